@@ -0,0 +1,57 @@
+"""JSON encoding and decoding for adapter traffic and cache payloads.
+
+Uses orjson when it is installed (the ``speedups`` extra) and falls back to
+the standard library json module otherwise. orjson decodes API responses
+straight from the response bytes and is several times faster on the large,
+string-heavy payloads some sources return.
+
+Both backends raise a ValueError subclass on malformed input, so callers
+catch ValueError regardless of which one is active.
+"""
+
+import json
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - exercised when orjson is absent
+    orjson = None  # type: ignore[assignment]
+
+
+def loads(data: bytes | str) -> Any:
+    """Decode a JSON document.
+
+    Args:
+        data: UTF-8 encoded bytes (e.g. response.content) or a str.
+
+    Returns:
+        Decoded Python object.
+
+    Raises:
+        ValueError: If the input is not valid JSON.
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def dumps(obj: Any) -> bytes:
+    """Encode an object as compact UTF-8 JSON bytes.
+
+    Args:
+        obj: JSON-serializable object.
+
+    Returns:
+        UTF-8 encoded JSON document, ready to send without re-encoding.
+
+    Raises:
+        TypeError: If the object is not JSON serializable.
+    """
+    if orjson is not None:
+        # Like the stdlib encoder, turn int/float/bool/None dict keys into
+        # strings instead of raising
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode()
+
+
+__all__ = ["dumps", "loads"]
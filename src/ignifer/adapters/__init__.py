@@ -1,29 +1,93 @@
-"""OSINT data source adapters."""
-
-from ignifer.adapters.aisstream import AISStreamAdapter
-from ignifer.adapters.base import (
-    AdapterAuthError,
-    AdapterError,
-    AdapterParseError,
-    AdapterTimeoutError,
-    OSINTAdapter,
-    handle_http_status,
-)
-from ignifer.adapters.gdelt import GDELTAdapter
-from ignifer.adapters.opensky import OpenSkyAdapter
-from ignifer.adapters.wikidata import WikidataAdapter
-from ignifer.adapters.worldbank import WorldBankAdapter
-
-__all__ = [
-    "OSINTAdapter",
-    "AdapterError",
-    "AdapterTimeoutError",
-    "AdapterParseError",
-    "AdapterAuthError",
-    "AISStreamAdapter",
-    "GDELTAdapter",
-    "OpenSkyAdapter",
-    "WikidataAdapter",
-    "WorldBankAdapter",
-    "handle_http_status",
-]
+"""OSINT data source adapters.
+
+Adapter classes are resolved lazily on first attribute access (PEP 562) so
+importing ``ignifer.adapters`` only pays for the base protocol and error
+hierarchy. Adapter submodules are also registered with
+``importlib.util.LazyLoader``, so ``import ignifer.adapters.gdelt`` and
+``importlib.import_module(...)`` defer executing the module body (and its
+HTTP/WebSocket dependencies) until an attribute on it is first used.
+"""
+
+import importlib
+import importlib.util
+import sys
+from types import ModuleType
+from typing import TYPE_CHECKING, Any
+
+from ignifer.adapters._registry import BASE_EXPORTS, LAZY_EXPORTS, LAZY_MODULES
+
+# Redundant "as" aliases mark explicit re-exports, since __all__ is computed
+from ignifer.adapters.base import AdapterAuthError as AdapterAuthError
+from ignifer.adapters.base import AdapterError as AdapterError
+from ignifer.adapters.base import AdapterParseError as AdapterParseError
+from ignifer.adapters.base import AdapterTimeoutError as AdapterTimeoutError
+from ignifer.adapters.base import OSINTAdapter as OSINTAdapter
+from ignifer.adapters.base import build_attribution as build_attribution
+from ignifer.adapters.base import handle_http_status as handle_http_status
+
+# PEP 810 explicit lazy imports (CPython 3.15+): the adapter imports below are
+# bound as lazy proxies and only executed on first use. Older interpreters
+# import nothing here and fall back to the LazyLoader/__getattr__ hooks below.
+# ignifer.adapters.base is deliberately excluded: the exception classes must
+# exist at import time for callers' ``except AdapterError:`` clauses.
+if sys.version_info >= (3, 15):
+    __lazy_modules__ = list(LAZY_MODULES)
+
+if TYPE_CHECKING or sys.version_info >= (3, 15):
+    from ignifer.adapters._http import close_transport as close_transport
+    from ignifer.adapters._http import get_transport as get_transport
+    from ignifer.adapters.aisstream import AISStreamAdapter as AISStreamAdapter
+    from ignifer.adapters.gdelt import GDELTAdapter as GDELTAdapter
+    from ignifer.adapters.opensky import OpenSkyAdapter as OpenSkyAdapter
+    from ignifer.adapters.wikidata import WikidataAdapter as WikidataAdapter
+    from ignifer.adapters.worldbank import WorldBankAdapter as WorldBankAdapter
+
+
+def _lazy_submodule(fullname: str) -> ModuleType:
+    """Register a submodule whose body executes on first attribute access.
+
+    Args:
+        fullname: Fully qualified module name, e.g. "ignifer.adapters.gdelt".
+
+    Returns:
+        The (possibly not yet executed) module object.
+    """
+    existing = sys.modules.get(fullname)
+    if existing is not None:
+        return existing
+
+    spec = importlib.util.find_spec(fullname)
+    if spec is None or spec.loader is None:
+        raise ImportError(f"No module named {fullname!r}", name=fullname)
+    loader = importlib.util.LazyLoader(spec.loader)
+    spec.loader = loader
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[fullname] = module
+    loader.exec_module(module)
+    # Mirror the regular import system, which binds submodules on the parent
+    globals()[fullname.rpartition(".")[2]] = module
+    return module
+
+
+# One find_spec() per lazy module, done once at package import
+for _module_path in LAZY_MODULES:
+    _lazy_submodule(_module_path)
+del _module_path
+
+__all__ = BASE_EXPORTS + tuple(LAZY_EXPORTS)
+
+# O(1) rejection of unknown names before consulting the lazy dispatch table
+_EXPORT_SET = frozenset(__all__)
+
+
+def __getattr__(name: str) -> Any:
+    """Import adapter classes on first access and bind them on the package."""
+    if name not in _EXPORT_SET:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(LAZY_EXPORTS[name]), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return list(__all__)
@@ -0,0 +1,57 @@
+"""Retry delays for rate-limited adapters.
+
+Plain exponential backoff sends every caller that hit the same rate limit
+back at the same moments, so they collide again. "Decorrelated jitter"
+picks each delay at random between the base delay and three times the
+previous one, which spreads concurrent retries out while growing at a
+similar rate on average. When the server says how long to wait (a
+Retry-After header), that hint takes precedence.
+"""
+
+import random
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+
+
+def decorrelated_jitter(previous: float, base: float, cap: float) -> float:
+    """Return the next retry delay.
+
+    Args:
+        previous: Delay before the last retry; pass ``base`` for the first.
+        base: Smallest delay to return.
+        cap: Largest delay to return.
+
+    Returns:
+        Delay in seconds, between ``base`` and ``cap``.
+    """
+    return min(cap, random.uniform(base, previous * 3))
+
+
+def parse_retry_after(value: str | None) -> float | None:
+    """Parse a Retry-After header value into seconds to wait.
+
+    Accepts both forms allowed by RFC 9110: delta-seconds ("120") and an
+    HTTP-date ("Wed, 21 Oct 2015 07:28:00 GMT").
+
+    Args:
+        value: Header value, or None if the header is absent.
+
+    Returns:
+        Seconds to wait (0 for a date in the past), or None if the header is
+        missing or malformed.
+    """
+    if not value:
+        return None
+    value = value.strip()
+    if value.isascii() and value.isdigit():
+        return float(value)
+    try:
+        when = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if when.tzinfo is None:
+        when = when.replace(tzinfo=timezone.utc)
+    return max(0.0, (when - datetime.now(timezone.utc)).total_seconds())
+
+
+__all__ = ["decorrelated_jitter", "parse_retry_after"]
@@ -0,0 +1,39 @@
+"""Concurrent request fan-out that stops on the first failure.
+
+asyncio.gather() hands the first exception to the caller but leaves the
+other awaitables running. For an adapter fan-out that means the remaining
+requests keep going out to the source (against its rate limit) and their
+exceptions are never retrieved. gather_or_cancel() cancels them instead.
+"""
+
+import asyncio
+from collections.abc import Awaitable, Iterable
+from typing import TypeVar
+
+T = TypeVar("T")
+
+
+async def gather_or_cancel(aws: Iterable[Awaitable[T]]) -> list[T]:
+    """Run awaitables concurrently, cancelling the rest if one fails.
+
+    Args:
+        aws: Awaitables to run, typically bounded request coroutines.
+
+    Returns:
+        Their results, in the same order as aws.
+
+    Raises:
+        Exception: The first exception raised by any awaitable, after every
+            other one has been cancelled and awaited.
+    """
+    tasks = [asyncio.ensure_future(aw) for aw in aws]
+    try:
+        return list(await asyncio.gather(*tasks))
+    finally:
+        # No-op when all succeeded; otherwise stop and reap the stragglers
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+
+__all__ = ["gather_or_cancel"]
@@ -0,0 +1,72 @@
+"""Shared HTTP connection pool for the httpx-based adapters.
+
+Each adapter keeps its own lightweight httpx.AsyncClient (per-source headers
+and timeouts), but all of them send requests through one process-wide
+connection pool. Repeated calls to the same host (GDELT, Wikidata, World
+Bank, OpenSky) reuse keep-alive connections instead of paying a new TCP and
+TLS handshake per adapter instance. HTTP/2 is negotiated where the server
+supports it, so concurrent requests to one host are multiplexed as streams
+over a single connection.
+"""
+
+import logging
+
+import httpx
+
+logger = logging.getLogger(__name__)
+
+# Sized for concurrent fan-out (economic_context, multi-source briefings) across
+# a handful of hosts; idle connections are kept warm for 30s between queries.
+POOL_LIMITS = httpx.Limits(
+    max_connections=100,
+    max_keepalive_connections=50,
+    keepalive_expiry=30.0,
+)
+CONNECT_RETRIES = 3
+
+
+class _SharedTransport(httpx.AsyncBaseTransport):
+    """Transport that forwards to the shared pool and ignores per-client close.
+
+    httpx closes a client's transport in AsyncClient.aclose(); adapters close
+    their clients independently, so the pool itself is only closed through
+    close_transport().
+    """
+
+    def __init__(self, pool: httpx.AsyncHTTPTransport) -> None:
+        self._pool = pool
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        return await self._pool.handle_async_request(request)
+
+    async def aclose(self) -> None:
+        pass
+
+
+_transport: _SharedTransport | None = None
+
+
+def get_transport() -> httpx.AsyncBaseTransport:
+    """Get the process-wide pooled transport, creating it on first use."""
+    global _transport
+    if _transport is None:
+        pool = httpx.AsyncHTTPTransport(
+            limits=POOL_LIMITS, retries=CONNECT_RETRIES, http2=True
+        )
+        _transport = _SharedTransport(pool)
+    return _transport
+
+
+async def close_transport() -> None:
+    """Close the shared connection pool.
+
+    A later get_transport() call creates a fresh pool.
+    """
+    global _transport
+    if _transport is not None:
+        transport, _transport = _transport, None
+        await transport._pool.aclose()
+        logger.debug("Shared HTTP transport closed")
+
+
+__all__ = ["get_transport", "close_transport"]
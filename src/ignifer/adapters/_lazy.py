@@ -0,0 +1,74 @@
+"""Deferred imports for third-party adapter dependencies.
+
+Adapter modules bind their HTTP/WebSocket client libraries through
+lazy_import() so that the import cost is paid on first use (typically the
+first query) rather than when the adapter module itself is imported.
+"""
+
+import importlib
+from types import ModuleType
+from typing import Any
+
+
+class _LazyModule:
+    """Proxy that imports a module on first attribute access.
+
+    The resolved module is cached on the proxy, so only the first access goes
+    through the import machinery; later accesses are a plain getattr.
+    """
+
+    def __init__(self, name: str) -> None:
+        self._name = name
+        self._mod: ModuleType | None = None
+
+    def _load(self) -> ModuleType:
+        if self._mod is None:
+            self._mod = importlib.import_module(self._name)
+        return self._mod
+
+    def __getattr__(self, attr: str) -> Any:
+        return getattr(self._load(), attr)
+
+    def __repr__(self) -> str:
+        state = "loaded" if self._mod is not None else "not loaded"
+        return f"<lazy module {self._name!r} ({state})>"
+
+
+class _LazyCallable:
+    """Proxy for a callable attribute that imports its module on first call."""
+
+    def __init__(self, module: _LazyModule, attr: str) -> None:
+        self._module = module
+        self._attr = attr
+        self._target: Any = None
+
+    def _load(self) -> Any:
+        if self._target is None:
+            self._target = getattr(self._module._load(), self._attr)
+        return self._target
+
+    def __call__(self, *args: Any, **kwargs: Any) -> Any:
+        return self._load()(*args, **kwargs)
+
+    def __getattr__(self, attr: str) -> Any:
+        return getattr(self._load(), attr)
+
+
+def lazy_import(path: str) -> Any:
+    """Return a proxy that defers importing a module or callable.
+
+    Args:
+        path: Module path ("websockets.exceptions") or a module path and
+            attribute separated by a colon ("httpx:get").
+
+    Returns:
+        A module proxy, or a callable proxy when an attribute is given.
+    """
+    module_path, _, attr = path.partition(":")
+    module = _LazyModule(module_path)
+    if attr:
+        return _LazyCallable(module, attr)
+    return module
+
+
+__all__ = ["lazy_import"]
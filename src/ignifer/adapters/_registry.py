@@ -0,0 +1,37 @@
+"""Export table for the ignifer.adapters package.
+
+Single source of truth for what the package exports: the eagerly imported
+base names, and the lazily imported adapter classes and helpers together
+with the module that defines each of them.
+"""
+
+# Protocol, error hierarchy and helpers from ignifer.adapters.base (imported eagerly)
+BASE_EXPORTS: tuple[str, ...] = (
+    "OSINTAdapter",
+    "AdapterError",
+    "AdapterTimeoutError",
+    "AdapterParseError",
+    "AdapterAuthError",
+    "handle_http_status",
+    "build_attribution",
+)
+
+# Adapter class name -> defining module (imported on first access)
+ADAPTERS: dict[str, str] = {
+    "AISStreamAdapter": "ignifer.adapters.aisstream",
+    "GDELTAdapter": "ignifer.adapters.gdelt",
+    "OpenSkyAdapter": "ignifer.adapters.opensky",
+    "WikidataAdapter": "ignifer.adapters.wikidata",
+    "WorldBankAdapter": "ignifer.adapters.worldbank",
+}
+
+# Other lazily exported names -> defining module
+HELPERS: dict[str, str] = {
+    "get_transport": "ignifer.adapters._http",
+    "close_transport": "ignifer.adapters._http",
+}
+
+LAZY_EXPORTS: dict[str, str] = {**ADAPTERS, **HELPERS}
+
+# Modules deferred via LazyLoader / PEP 810 (base is always eager)
+LAZY_MODULES: tuple[str, ...] = tuple(sorted(set(LAZY_EXPORTS.values())))
@@ -1,29 +1,34 @@
 """AISStream adapter for real-time maritime vessel tracking.
 
 AISStream provides real-time AIS (Automatic Identification System) data
-for vessels worldwide via WebSocket streaming. This adapter implements
-a connection-on-demand pattern: connect -> query -> cache -> disconnect.
+for vessels worldwide via WebSocket streaming. This adapter keeps one
+WebSocket connection open across queries, re-subscribing for each vessel,
+and closes it after a period without use.
 
 API Reference: https://aisstream.io/documentation
 """
 
+from __future__ import annotations
+
 import asyncio
-import json
 import logging
 import sys
 from collections.abc import AsyncIterator
 from contextlib import asynccontextmanager
 from datetime import datetime, timezone
-from typing import Any
-
-import websockets
-from websockets.exceptions import (
-    ConnectionClosed,
-    InvalidStatus,
-    WebSocketException,
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any
+
+from ignifer._json import dumps as json_dumps
+from ignifer._json import loads as json_loads
+from ignifer.adapters._lazy import lazy_import
+from ignifer.adapters.base import (
+    AdapterAuthError,
+    AdapterError,
+    AdapterParseError,
+    AdapterTimeoutError,
+    build_attribution,
 )
-
-from ignifer.adapters.base import AdapterAuthError, AdapterParseError, AdapterTimeoutError
 from ignifer.cache import CacheManager, cache_key
 from ignifer.config import get_settings
 from ignifer.models import (
@@ -32,12 +37,27 @@ from ignifer.models import (
     QualityTier,
     QueryParams,
     ResultStatus,
-    SourceAttribution,
-    SourceMetadata,
 )
 
+if TYPE_CHECKING:
+    import websockets
+    import websockets.exceptions as ws_exceptions
+    from websockets.asyncio.client import ClientConnection
+else:
+    websockets = lazy_import("websockets")
+    ws_exceptions = lazy_import("websockets.exceptions")
+
 logger = logging.getLogger(__name__)
 
+# Read-only stand-in for message sections missing from a frame
+_EMPTY: dict[str, Any] = {}
+
+# Global coverage: SW corner [-90, -180], NE corner [90, 180]
+GLOBAL_BOUNDING_BOXES: list[list[list[float]]] = [[[-90, -180], [90, 180]]]
+
+# Only position reports are parsed; the server drops every other message type
+POSITION_MESSAGE_TYPES: list[str] = ["PositionReport"]
+
 
 # Python 3.10 compatibility for asyncio.timeout
 @asynccontextmanager
@@ -49,7 +69,7 @@ async def async_timeout(seconds: float) -> AsyncIterator[None]:
     else:
         # For Python 3.10, use asyncio.wait_for pattern via task cancellation
         task = asyncio.current_task()
-        loop = asyncio.get_event_loop()
+        loop = asyncio.get_running_loop()
         timeout_handle = loop.call_later(seconds, task.cancel)  # type: ignore[union-attr]
         try:
             yield
@@ -59,11 +79,58 @@ async def async_timeout(seconds: float) -> AsyncIterator[None]:
             timeout_handle.cancel()
 
 
+def _is_valid_mmsi(mmsi: str) -> bool:
+    """Check that an MMSI is exactly nine ASCII digits.
+
+    str.isdigit() alone also accepts non-ASCII digits such as '٣' or '³',
+    which no AIS filter will ever match. The length test runs first as the
+    cheapest rejection.
+    """
+    return len(mmsi) == 9 and mmsi.isascii() and mmsi.isdigit()
+
+
+def _retrieve_exception(task: asyncio.Task[Any]) -> None:
+    """Mark a background task's exception as retrieved.
+
+    Args:
+        task: Finished task nobody else may await.
+    """
+    if not task.cancelled():
+        task.exception()
+
+
+@lru_cache(maxsize=256)
+def _encode_mmsi_subscription(api_key: str, mmsi: tuple[str, ...]) -> bytes:
+    """Serialize a global-coverage subscription filtered to the given MMSIs.
+
+    Memoized so repeat lookups of the same vessel reuse the encoded frame.
+    The API key is part of the cache key, so a rotated key never reuses a
+    stale frame.
+
+    Args:
+        api_key: AISStream API key.
+        mmsi: MMSI numbers to filter by (may be empty).
+
+    Returns:
+        UTF-8 encoded JSON subscription message.
+    """
+    msg: dict[str, Any] = {
+        "APIKey": api_key,
+        "BoundingBoxes": GLOBAL_BOUNDING_BOXES,
+        "FilterMessageTypes": POSITION_MESSAGE_TYPES,
+    }
+    if mmsi:
+        msg["FiltersShipMMSI"] = list(mmsi)
+    return json_dumps(msg)
+
+
 class AISStreamAdapter:
     """AISStream adapter for real-time vessel tracking via WebSocket.
 
-    Uses connection-on-demand pattern: establishes WebSocket connection,
-    subscribes for specific vessel data, waits for response, then disconnects.
+    Opens a WebSocket connection on first use and keeps it for later
+    queries, which avoids a TCP and TLS handshake per lookup. Each query
+    sends a new subscription for its vessel and waits for a position. The
+    connection is closed after IDLE_TIMEOUT seconds without a query.
     Results are cached with 15-minute TTL.
 
     Attributes:
@@ -74,9 +141,12 @@ class AISStreamAdapter:
     WEBSOCKET_URL = "wss://stream.aisstream.io/v0/stream"
     DEFAULT_TIMEOUT = 30.0  # seconds to wait for vessel data (AIS broadcasts every 2-180s)
     CONNECTION_TIMEOUT = 10.0  # seconds to establish WebSocket connection
+    MAX_FRAME_SIZE = 2**16  # bytes; AIS JSON frames are around 1 KiB
     MAX_RETRIES = 2
     INITIAL_BACKOFF = 1.0  # seconds
     MAX_BACKOFF = 5.0  # seconds
+    IDLE_TIMEOUT = 60.0  # seconds an unused connection stays open
+    SUBSCRIBE_BATCH_DELAY = 0.005  # seconds to gather lookups into one subscription
 
     def __init__(self, cache: CacheManager | None = None) -> None:
         """Initialize the AISStream adapter.
@@ -85,6 +155,15 @@ class AISStreamAdapter:
             cache: Optional cache manager for caching results.
         """
         self._cache = cache
+        # Shared WebSocket connection, opened on first query
+        self._ws: ClientConnection | None = None
+        self._reader: asyncio.Task[None] | None = None
+        self._sub_lock = asyncio.Lock()
+        self._idle_close: asyncio.Task[None] | None = None
+        self._pending_subscribe: asyncio.Task[None] | None = None
+        # Lookups waiting for a position, by MMSI, and the current filter
+        self._waiters: dict[str, set[asyncio.Future[dict[str, Any]]]] = {}
+        self._subscribed: tuple[str, ...] = ()
 
     @property
     def source_name(self) -> str:
@@ -133,17 +212,36 @@ class AISStreamAdapter:
         }
 
         # Default to global bounding box if none specified
-        if bounding_boxes:
-            msg["BoundingBoxes"] = bounding_boxes
-        else:
-            # Global coverage: SW corner [-90, -180], NE corner [90, 180]
-            msg["BoundingBoxes"] = [[[-90, -180], [90, 180]]]
+        msg["BoundingBoxes"] = bounding_boxes or GLOBAL_BOUNDING_BOXES
+        msg["FilterMessageTypes"] = POSITION_MESSAGE_TYPES
 
         if mmsi_list:
             msg["FiltersShipMMSI"] = mmsi_list
 
         return msg
 
+    def _build_subscribe_bytes(
+        self,
+        mmsi_list: list[str] | None = None,
+        bounding_boxes: list[list[list[float]]] | None = None,
+    ) -> bytes:
+        """Build the serialized WebSocket subscription message.
+
+        Global-coverage subscriptions (the MMSI lookup case) are memoized per
+        API key and MMSI list; custom bounding boxes are serialized each time.
+
+        Args:
+            mmsi_list: Optional list of MMSI numbers to filter by.
+            bounding_boxes: Optional list of bounding boxes [[SW, NE], ...].
+                           If None, uses global coverage.
+
+        Returns:
+            UTF-8 encoded JSON subscription message, ready to send.
+        """
+        if bounding_boxes:
+            return json_dumps(self._build_subscribe_message(mmsi_list, bounding_boxes))
+        return _encode_mmsi_subscription(self._get_api_key(), tuple(mmsi_list or ()))
+
     def _parse_position_message(self, raw_msg: dict[str, Any]) -> dict[str, Any] | None:
         """Parse AIS position report message.
 
@@ -153,146 +251,297 @@ class AISStreamAdapter:
         Returns:
             Parsed vessel position dict, or None if not a position report.
         """
-        msg_type = raw_msg.get("MessageType")
-        if msg_type != "PositionReport":
+        get = raw_msg.get
+        if get("MessageType") != "PositionReport":
             return None
 
-        message = raw_msg.get("Message", {})
-        position_report = message.get("PositionReport", {})
-        metadata = raw_msg.get("MetaData", {})
+        # Bound .get methods save an attribute lookup per field; _EMPTY
+        # stands in for missing sections without allocating a dict
+        report_get = ((get("Message") or _EMPTY).get("PositionReport") or _EMPTY).get
+        meta_get = (get("MetaData") or _EMPTY).get
 
         # Extract core position data
         return {
-            "mmsi": str(metadata.get("MMSI", "")),
-            "imo": metadata.get("IMO"),
-            "vessel_name": metadata.get("ShipName", "").strip(),
-            "vessel_type": position_report.get("Type"),
-            "latitude": position_report.get("Latitude"),
-            "longitude": position_report.get("Longitude"),
-            "speed_over_ground": position_report.get("Sog"),
-            "course_over_ground": position_report.get("Cog"),
-            "heading": position_report.get("TrueHeading"),
-            "navigational_status": position_report.get("NavigationalStatus"),
-            "destination": metadata.get("Destination", "").strip() or None,
-            "eta": metadata.get("ETA"),
-            "timestamp": metadata.get("time_utc"),
-            "country": metadata.get("country"),
+            "mmsi": str(meta_get("MMSI", "")),
+            "imo": meta_get("IMO"),
+            "vessel_name": meta_get("ShipName", "").strip(),
+            "vessel_type": report_get("Type"),
+            "latitude": report_get("Latitude"),
+            "longitude": report_get("Longitude"),
+            "speed_over_ground": report_get("Sog"),
+            "course_over_ground": report_get("Cog"),
+            "heading": report_get("TrueHeading"),
+            "navigational_status": report_get("NavigationalStatus"),
+            "destination": meta_get("Destination", "").strip() or None,
+            "eta": meta_get("ETA"),
+            "timestamp": meta_get("time_utc"),
+            "country": meta_get("country"),
         }
 
-    async def _connect_and_receive(
-        self,
-        subscribe_msg: dict[str, Any],
-        timeout: float,
-    ) -> list[dict[str, Any]]:
-        """Connect to WebSocket, subscribe, and receive messages.
+    async def _ensure_connected(self) -> ClientConnection:
+        """Return the shared WebSocket connection, opening it if needed.
+
+        Opening a connection also starts the background reader that routes
+        its frames to waiting lookups.
+
+        Returns:
+            Open AISStream connection.
+        """
+        if self._ws is None:
+            # websockets.connect has its own open_timeout (default 10s)
+            # We set it explicitly to CONNECTION_TIMEOUT for clarity
+            ws = await websockets.connect(
+                self.WEBSOCKET_URL,
+                open_timeout=self.CONNECTION_TIMEOUT,
+                ping_interval=20,
+                ping_timeout=10,
+                close_timeout=5,
+                # Frames are small and parsed immediately; permessage-deflate
+                # would only add a zlib inflate per frame
+                compression=None,
+                max_size=self.MAX_FRAME_SIZE,
+            )
+            logger.debug("Opened AISStream connection")
+            self._ws = ws
+            self._subscribed = ()
+            self._reader = asyncio.create_task(self._read_frames(ws))
+        return self._ws
+
+    async def _discard_connection(self) -> None:
+        """Stop the reader, then close and forget the shared connection."""
+        ws, self._ws = self._ws, None
+        reader, self._reader = self._reader, None
+        self._subscribed = ()
+        if reader is not None:
+            reader.cancel()
+        if ws is not None:
+            await ws.close()
+            logger.debug("Closed AISStream connection")
+
+    def _schedule_idle_close(self) -> None:
+        """Close the shared connection if no lookup uses it for IDLE_TIMEOUT."""
+        self._cancel_idle_close()
+        if self._ws is not None:
+            self._idle_close = asyncio.create_task(self._close_when_idle())
+
+    def _cancel_idle_close(self) -> None:
+        """Cancel a pending idle close."""
+        if self._idle_close is not None:
+            self._idle_close.cancel()
+            self._idle_close = None
+
+    async def _close_when_idle(self) -> None:
+        """Wait out the idle period, then close the shared connection."""
+        await asyncio.sleep(self.IDLE_TIMEOUT)
+        async with self._sub_lock:
+            self._idle_close = None
+            if not self._waiters:
+                await self._discard_connection()
+
+    async def _read_frames(self, ws: ClientConnection) -> None:
+        """Receive frames on the shared connection and route them to waiters.
+
+        Runs as a background task for the lifetime of the connection. Each
+        position report resolves the futures waiting on its MMSI; frames for
+        vessels nobody is waiting on are dropped before they are parsed. An
+        error frame is raised in every waiting lookup and a malformed frame is
+        logged and skipped; neither closes the connection. Only a connection
+        failure ends the reader, and it is raised in every waiting lookup,
+        whose retry handling then decides what to do.
 
         Args:
-            subscribe_msg: Subscription message to send.
+            ws: Connection to read from.
+        """
+        parse_position = self._parse_position_message
+        waiters = self._waiters
+        try:
+            while True:
+                # Undecoded bytes: the JSON parser validates UTF-8 itself,
+                # so skip websockets' bytes -> str decode
+                raw = await ws.recv(decode=False)
+                try:
+                    msg = json_loads(raw)
+
+                    # Check for error messages
+                    if msg.get("MessageType") == "Error":
+                        error_msg = msg.get("Message", "Unknown error")
+                        logger.warning(f"AISStream error message: {error_msg}")
+                        error: AdapterError
+                        if "API" in str(error_msg) or "auth" in str(error_msg).lower():
+                            error = AdapterAuthError(
+                                self.source_name, f"AISStream: {error_msg}"
+                            )
+                        else:
+                            error = AdapterParseError(
+                                self.source_name, f"AISStream error: {error_msg}"
+                            )
+                        self._fail_waiters(error)
+                        continue
+
+                    # Only build a position for vessels someone is waiting on;
+                    # frames still in flight for an older filter are dropped here
+                    mmsi_waiters = waiters.get(
+                        str((msg.get("MetaData") or _EMPTY).get("MMSI", ""))
+                    )
+                    if not mmsi_waiters:
+                        continue
+
+                    # Parse position report and hand it to everyone waiting on it
+                    position = parse_position(msg)
+                    if position is None:
+                        continue
+                    for waiter in mmsi_waiters:
+                        if not waiter.done():
+                            waiter.set_result(position)
+                except Exception as e:
+                    # One bad frame should not cost every lookup the connection
+                    logger.warning(f"Skipping malformed AISStream frame: {e}")
+        except Exception as e:
+            # The connection is unusable; detach it so the next lookup reconnects
+            if self._ws is ws:
+                self._ws = None
+                self._reader = None
+                self._subscribed = ()
+            self._fail_waiters(e)
+            try:
+                await ws.close()
+            except Exception as close_error:
+                logger.debug(f"Error closing AISStream connection: {close_error}")
+
+    def _fail_waiters(self, error: Exception) -> None:
+        """Raise an error in every lookup still waiting for a position.
+
+        Args:
+            error: Exception to set on each pending waiter.
+        """
+        for mmsi_waiters in self._waiters.values():
+            for waiter in mmsi_waiters:
+                if not waiter.done():
+                    waiter.set_exception(error)
+
+    async def _subscribe(self) -> None:
+        """Subscribe the shared connection to every MMSI being waited on.
+
+        Lookups arriving within SUBSCRIBE_BATCH_DELAY of each other share one
+        pending update, so a burst of N lookups sends one subscription
+        instead of N.
+        """
+        # A batch that failed to connect is done but never cleared; replace it
+        if self._pending_subscribe is None or self._pending_subscribe.done():
+            self._pending_subscribe = asyncio.create_task(self._send_subscription())
+            # Lookups that time out stop awaiting the batch; retrieve its error here
+            self._pending_subscribe.add_done_callback(_retrieve_exception)
+        # Shielded so a lookup timing out does not cancel the batch for others
+        await asyncio.shield(self._pending_subscribe)
+
+    async def _send_subscription(self) -> None:
+        """Wait out the batching delay, then send the current MMSI filter."""
+        await asyncio.sleep(self.SUBSCRIBE_BATCH_DELAY)
+        async with self._sub_lock:
+            self._cancel_idle_close()
+            ws = await self._ensure_connected()
+            # Lookups registering from here on start the next batch
+            self._pending_subscribe = None
+            wanted = tuple(sorted(self._waiters))
+            # An empty filter would subscribe to every vessel in the world
+            if wanted and wanted != self._subscribed:
+                # Send subscription message (bytes, but as a text frame)
+                await ws.send(self._build_subscribe_bytes(mmsi_list=list(wanted)), text=True)
+                self._subscribed = wanted
+                logger.debug(f"Subscribed AISStream to {len(wanted)} MMSI(s)")
+
+    async def _await_position(self, mmsi: str, timeout: float) -> dict[str, Any] | None:
+        """Wait for one position report for an MMSI on the shared connection.
+
+        Args:
+            mmsi: Vessel to wait for.
+            timeout: Maximum time to wait for data.
+
+        Returns:
+            Parsed position, or None if the vessel did not report in time.
+        """
+        waiter: asyncio.Future[dict[str, Any]] = asyncio.get_running_loop().create_future()
+        mmsi_waiters = self._waiters.setdefault(mmsi, set())
+        mmsi_waiters.add(waiter)
+        try:
+            await self._subscribe()
+            try:
+                async with async_timeout(timeout):
+                    return await waiter
+            except TimeoutError:
+                return None
+        finally:
+            # An error routed here after we stopped waiting is superseded
+            if waiter.done() and not waiter.cancelled():
+                waiter.exception()
+            mmsi_waiters.discard(waiter)
+            if not mmsi_waiters and self._waiters.get(mmsi) is mmsi_waiters:
+                del self._waiters[mmsi]
+            if not self._waiters:
+                self._schedule_idle_close()
+
+    async def _backoff(self, backoff: float) -> float:
+        """Sleep before the next retry and return the following delay.
+
+        Args:
+            backoff: Seconds to sleep now.
+
+        Returns:
+            Delay for the next retry, doubled and capped at MAX_BACKOFF.
+        """
+        await asyncio.sleep(backoff)
+        return min(backoff * 2, self.MAX_BACKOFF)
+
+    async def _receive_position(self, mmsi: str, timeout: float) -> dict[str, Any] | None:
+        """Wait for a vessel's position on the shared connection, with retries.
+
+        Lookups share one connection and one subscription covering every
+        MMSI currently being waited on. A background reader routes each
+        position report to the lookups waiting for that vessel. The
+        connection stays open between lookups and is closed after
+        IDLE_TIMEOUT seconds without one.
+
+        Args:
+            mmsi: Maritime Mobile Service Identity to wait for.
             timeout: Maximum time to wait for data.
 
         Returns:
-            List of parsed position messages.
+            Parsed position, or None if the vessel did not report in time.
 
         Raises:
             AdapterTimeoutError: If connection or data retrieval times out.
             AdapterAuthError: If authentication fails.
-            AdapterParseError: If message parsing fails.
+            AdapterParseError: If AISStream reports an error.
         """
-        positions: list[dict[str, Any]] = []
         backoff = self.INITIAL_BACKOFF
 
         for attempt in range(self.MAX_RETRIES):
             try:
-                # websockets.connect has its own open_timeout (default 10s)
-                # We set it explicitly to CONNECTION_TIMEOUT for clarity
-                async with websockets.connect(
-                    self.WEBSOCKET_URL,
-                    open_timeout=self.CONNECTION_TIMEOUT,
-                    ping_interval=20,
-                    ping_timeout=10,
-                    close_timeout=5,
-                ) as ws:
-                    # Send subscription message
-                    await ws.send(json.dumps(subscribe_msg))
-                    logger.debug("Sent subscription to AISStream")
-
-                    # Receive messages until data timeout or we get data
-                    start_time = asyncio.get_event_loop().time()
-                    while (asyncio.get_event_loop().time() - start_time) < timeout:
-                        try:
-                            raw = await asyncio.wait_for(ws.recv(), timeout=5.0)
-                            msg = json.loads(raw)
-
-                            # Check for error messages
-                            if msg.get("MessageType") == "Error":
-                                error_msg = msg.get("Message", "Unknown error")
-                                if "API" in str(error_msg) or "auth" in str(error_msg).lower():
-                                    raise AdapterAuthError(
-                                        self.source_name, f"AISStream: {error_msg}"
-                                    )
-                                raise AdapterParseError(
-                                    self.source_name, f"AISStream error: {error_msg}"
-                                )
-
-                            # Parse position report
-                            position = self._parse_position_message(msg)
-                            if position:
-                                positions.append(position)
-                                # For single MMSI query, return after first position
-                                if subscribe_msg.get("FiltersShipMMSI"):
-                                    return positions
-
-                        except asyncio.TimeoutError:
-                            # No message received in 5s, continue waiting
-                            continue
-
-                    # Data timeout reached, return what we have (may be empty)
-                    return positions
-
-            except InvalidStatus as e:
-                # InvalidStatus has a response attribute with status code
-                status_code = getattr(e.response, "status_code", 0) if hasattr(e, "response") else 0
-                if status_code == 401:
-                    raise AdapterAuthError(
-                        self.source_name, "Invalid API key"
-                    ) from e
-                logger.warning(f"AISStream WebSocket error (attempt {attempt + 1}): {e}")
-                if attempt < self.MAX_RETRIES - 1:
-                    await asyncio.sleep(backoff)
-                    backoff = min(backoff * 2, self.MAX_BACKOFF)
-                else:
-                    raise AdapterTimeoutError(self.source_name, timeout) from e
-
-            except ConnectionClosed as e:
-                logger.warning(f"AISStream WebSocket closed (attempt {attempt + 1}): {e}")
-                if attempt < self.MAX_RETRIES - 1:
-                    await asyncio.sleep(backoff)
-                    backoff = min(backoff * 2, self.MAX_BACKOFF)
-                else:
-                    raise AdapterTimeoutError(self.source_name, timeout) from e
+                return await self._await_position(mmsi, timeout)
 
-            except WebSocketException as e:
+            except ws_exceptions.WebSocketException as e:
+                # InvalidStatus carries the HTTP response from the failed handshake
+                if isinstance(e, ws_exceptions.InvalidStatus):
+                    try:
+                        status_code = e.response.status_code
+                    except AttributeError:
+                        status_code = 0
+                    if status_code == 401:
+                        raise AdapterAuthError(
+                            self.source_name, "Invalid API key"
+                        ) from e
                 logger.warning(f"AISStream WebSocket error (attempt {attempt + 1}): {e}")
-                if attempt < self.MAX_RETRIES - 1:
-                    await asyncio.sleep(backoff)
-                    backoff = min(backoff * 2, self.MAX_BACKOFF)
-                else:
+                if attempt == self.MAX_RETRIES - 1:
                     raise AdapterTimeoutError(self.source_name, timeout) from e
+                backoff = await self._backoff(backoff)
 
             except TimeoutError:
                 logger.warning(f"AISStream connection timeout (attempt {attempt + 1})")
-                if attempt < self.MAX_RETRIES - 1:
-                    await asyncio.sleep(backoff)
-                    backoff = min(backoff * 2, self.MAX_BACKOFF)
-                else:
+                if attempt == self.MAX_RETRIES - 1:
                     raise AdapterTimeoutError(self.source_name, self.CONNECTION_TIMEOUT)
+                backoff = await self._backoff(backoff)
 
-            except json.JSONDecodeError as e:
-                raise AdapterParseError(
-                    self.source_name, f"Invalid JSON from AISStream: {e}"
-                ) from e
-
-        return positions
+        return None
 
     async def query(self, params: QueryParams) -> OSINTResult:
         """Query AISStream by MMSI or vessel search.
@@ -314,7 +563,7 @@ class AISStreamAdapter:
         mmsi = params.query.strip()
 
         # Validate MMSI format (should be 9 digits)
-        if not mmsi.isdigit() or len(mmsi) != 9:
+        if not _is_valid_mmsi(mmsi):
             return OSINTResult(
                 status=ResultStatus.NO_DATA,
                 query=mmsi,
@@ -352,17 +601,15 @@ class AISStreamAdapter:
                 logger.debug(f"Cache hit for {key}")
                 return self._build_result_from_cache(mmsi, cached.data)
 
-        # Build subscription message for specific MMSI
-        subscribe_msg = self._build_subscribe_message(mmsi_list=[mmsi])
+        # Validate credentials before touching the connection
+        self._get_api_key()
 
         logger.info(f"Querying AISStream for MMSI: {mmsi}")
 
-        # Connect and receive position data
-        positions = await self._connect_and_receive(
-            subscribe_msg, timeout=self.DEFAULT_TIMEOUT
-        )
+        # Wait for this vessel's next position on the shared connection
+        position = await self._receive_position(mmsi, timeout=self.DEFAULT_TIMEOUT)
 
-        if not positions:
+        if position is None:
             return OSINTResult(
                 status=ResultStatus.NO_DATA,
                 query=mmsi,
@@ -371,6 +618,7 @@ class AISStreamAdapter:
                 retrieved_at=datetime.now(timezone.utc),
                 error=f"No position data found for MMSI '{mmsi}'",
             )
+        positions = [position]
 
         # Cache results
         if self._cache:
@@ -388,15 +636,12 @@ class AISStreamAdapter:
             query=mmsi,
             results=positions,
             sources=[
-                SourceAttribution(
-                    source=self.source_name,
-                    quality=self.base_quality_tier,
-                    confidence=ConfidenceLevel.ALMOST_CERTAIN,  # AIS transponder data
-                    metadata=SourceMetadata(
-                        source_name=self.source_name,
-                        source_url=self.WEBSOCKET_URL,
-                        retrieved_at=retrieved_at,
-                    ),
+                build_attribution(
+                    self.source_name,
+                    self.base_quality_tier,
+                    ConfidenceLevel.ALMOST_CERTAIN,  # AIS transponder data
+                    self.WEBSOCKET_URL,
+                    retrieved_at,
                 )
             ],
             retrieved_at=retrieved_at,
@@ -412,15 +657,12 @@ class AISStreamAdapter:
             query=query,
             results=cached_data.get("positions", []),
             sources=[
-                SourceAttribution(
-                    source=self.source_name,
-                    quality=self.base_quality_tier,
-                    confidence=ConfidenceLevel.ALMOST_CERTAIN,
-                    metadata=SourceMetadata(
-                        source_name=self.source_name,
-                        source_url=self.WEBSOCKET_URL,
-                        retrieved_at=retrieved_at,
-                    ),
+                build_attribution(
+                    self.source_name,
+                    self.base_quality_tier,
+                    ConfidenceLevel.ALMOST_CERTAIN,
+                    self.WEBSOCKET_URL,
+                    retrieved_at,
                 )
             ],
             retrieved_at=retrieved_at,
@@ -444,18 +686,20 @@ class AISStreamAdapter:
                     self.WEBSOCKET_URL,
                     ping_interval=None,
                     close_timeout=2,
+                    compression=None,
+                    max_size=self.MAX_FRAME_SIZE,
                 ) as ws:
                     # Send minimal subscription to test auth
                     subscribe_msg = {
                         "APIKey": api_key,
                         "BoundingBoxes": [[[0, 0], [1, 1]]],  # Small area
                     }
-                    await ws.send(json.dumps(subscribe_msg))
+                    await ws.send(json_dumps(subscribe_msg), text=True)
 
                     # Wait briefly for any error response
                     try:
-                        raw = await asyncio.wait_for(ws.recv(), timeout=2.0)
-                        msg = json.loads(raw)
+                        raw = await asyncio.wait_for(ws.recv(decode=False), timeout=2.0)
+                        msg = json_loads(raw)
                         if msg.get("MessageType") == "Error":
                             logger.warning(f"AISStream health check error: {msg}")
                             return False
@@ -473,10 +717,14 @@ class AISStreamAdapter:
             return False
 
     async def close(self) -> None:
-        """Cleanup method (no persistent connections to close)."""
-        # Connection-on-demand pattern means no persistent connections
-        # This method exists for protocol compliance
-        logger.debug("AISStream adapter closed (no persistent connections)")
+        """Close the shared WebSocket connection, if open."""
+        self._cancel_idle_close()
+        self._fail_waiters(AdapterError(self.source_name, "Adapter closed"))
+        if self._pending_subscribe is not None:
+            self._pending_subscribe.cancel()
+            self._pending_subscribe = None
+        await self._discard_connection()
+        logger.debug("AISStream adapter closed")
 
 
 __all__ = ["AISStreamAdapter"]
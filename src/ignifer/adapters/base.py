@@ -5,9 +5,17 @@ must implement, along with a standardized error hierarchy for consistent
 error handling across all adapters.
 """
 
+from datetime import datetime
 from typing import Protocol, runtime_checkable
 
-from ignifer.models import OSINTResult, QualityTier, QueryParams
+from ignifer.models import (
+    ConfidenceLevel,
+    OSINTResult,
+    QualityTier,
+    QueryParams,
+    SourceAttribution,
+    SourceMetadata,
+)
 
 
 @runtime_checkable
@@ -158,6 +166,41 @@ def handle_http_status(
         return "client_error", AdapterParseError(source_name, f"HTTP {status_code} error")
 
 
+def build_attribution(
+    source_name: str,
+    quality: QualityTier,
+    confidence: ConfidenceLevel,
+    source_url: str,
+    retrieved_at: datetime,
+) -> SourceAttribution:
+    """Build the SourceAttribution for an adapter result.
+
+    Every field is an adapter constant or a value the adapter built itself,
+    so the models are created with model_construct() and skip validation.
+    This runs on every successful response and cache hit.
+
+    Args:
+        source_name: Name of the adapter
+        quality: Quality tier of the data
+        confidence: Confidence level for this result
+        source_url: URL the data was retrieved from
+        retrieved_at: Timezone-aware retrieval timestamp
+
+    Returns:
+        SourceAttribution with nested SourceMetadata
+    """
+    return SourceAttribution.model_construct(
+        source=source_name,
+        quality=quality,
+        confidence=confidence,
+        metadata=SourceMetadata.model_construct(
+            source_name=source_name,
+            source_url=source_url,
+            retrieved_at=retrieved_at,
+        ),
+    )
+
+
 __all__ = [
     "OSINTAdapter",
     "AdapterError",
@@ -165,4 +208,5 @@ __all__ = [
     "AdapterParseError",
     "AdapterAuthError",
     "handle_http_status",
+    "build_attribution",
 ]
@@ -1,13 +1,21 @@
 """GDELT adapter for news and event data."""
 
+from __future__ import annotations
+
 import asyncio
 import logging
+import random
+import re
 from datetime import datetime, timezone
-from urllib.parse import urlencode
-
-import httpx
-
-from ignifer.adapters.base import AdapterParseError, AdapterTimeoutError
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any
+from urllib.parse import quote_plus
+
+from ignifer._json import loads as json_loads
+from ignifer.adapters._backoff import decorrelated_jitter, parse_retry_after
+from ignifer.adapters._fanout import gather_or_cancel
+from ignifer.adapters._lazy import lazy_import
+from ignifer.adapters.base import AdapterParseError, AdapterTimeoutError, build_attribution
 from ignifer.cache import CacheManager, cache_key
 from ignifer.config import get_settings
 from ignifer.models import (
@@ -16,14 +24,29 @@ from ignifer.models import (
     QualityTier,
     QueryParams,
     ResultStatus,
-    SourceAttribution,
-    SourceMetadata,
 )
-from ignifer.timeparse import parse_time_range
+from ignifer.timeparse import TimeRangeResult, parse_time_range
+
+if TYPE_CHECKING:
+    import httpx
+
+    from ignifer.adapters._http import get_transport
+else:
+    httpx = lazy_import("httpx")
+    get_transport = lazy_import("ignifer.adapters._http:get_transport")
 
 logger = logging.getLogger(__name__)
 
 
+# Hyphenated terms such as "Japan-China" or "step-by-step"
+_HYPHENATED_WORD = re.compile(r"\b\w+(?:-\w+)+\b")
+
+
+def _quote_match(match: re.Match[str]) -> str:
+    """Wrap a matched term in double quotes."""
+    return f'"{match.group(0)}"'
+
+
 def _sanitize_gdelt_query(query: str) -> str:
     """Sanitize query for GDELT API.
 
@@ -36,20 +59,20 @@ def _sanitize_gdelt_query(query: str) -> str:
     Returns:
         Sanitized query safe for GDELT API
     """
-    import re
+    # Most queries contain no hyphen at all; skip the regex for them
+    if "-" not in query:
+        return query
+    return _HYPHENATED_WORD.sub(_quote_match, query)
 
-    # Find words containing hyphens that aren't already quoted
-    # Match word-word patterns not inside quotes
-    def quote_hyphenated(match: re.Match) -> str:
-        word = match.group(0)
-        # Don't re-quote if already quoted
-        return f'"{word}"'
 
-    # Pattern: word-word (hyphenated terms not already in quotes)
-    # This regex finds hyphenated words
-    sanitized = re.sub(r'\b\w+(?:-\w+)+\b', quote_hyphenated, query)
+@lru_cache(maxsize=1024)
+def _encode_gdelt_query(query: str) -> str:
+    """Sanitize a query and URL-encode it for the ArtList URL.
 
-    return sanitized
+    Memoized so a repeated query (e.g. the same topic with a different time
+    range) skips the regex and the percent-encoding.
+    """
+    return quote_plus(_sanitize_gdelt_query(query))
 
 
 class GDELTAdapter:
@@ -65,8 +88,16 @@ class GDELTAdapter:
 
     BASE_URL = "https://api.gdeltproject.org/api/v2/doc/doc"
     DEFAULT_TIMEOUT = 30.0  # seconds (GDELT can be slow during high load)
+    CONNECT_TIMEOUT = 5.0  # seconds; slow responses are normal, slow connects are not
     MAX_RETRIES = 3
     RETRY_BASE_DELAY = 2.0  # seconds
+    RETRY_MAX_DELAY = 30.0  # seconds
+    RETRY_AFTER_MAX = 60.0  # seconds; longest Retry-After hint honored
+    NO_DATA_TTL = 300  # seconds to remember that a query found nothing
+    # Fixed ArtList parameters, pre-encoded once. TIMESPAN limits to recent
+    # articles (GDELT defaults to 3 months by relevance); "sort=datedesc"
+    # sorts newest first within the timespan.
+    ARTLIST_PARAMS = "mode=ArtList&format=json&maxrecords=75&sort=datedesc"
 
     def __init__(self, cache: CacheManager | None = None) -> None:
         self._client: httpx.AsyncClient | None = None
@@ -84,11 +115,76 @@ class GDELTAdapter:
         """Lazy initialization of HTTP client."""
         if self._client is None:
             self._client = httpx.AsyncClient(
-                timeout=httpx.Timeout(self.DEFAULT_TIMEOUT),
+                timeout=httpx.Timeout(self.DEFAULT_TIMEOUT, connect=self.CONNECT_TIMEOUT),
                 headers={"User-Agent": "Ignifer/1.0"},
+                transport=get_transport(),
             )
         return self._client
 
+    def _build_url(self, query: str, time_result: TimeRangeResult | None) -> str:
+        """Build the ArtList request URL.
+
+        Only the query and time window vary per request, so they are appended
+        to the pre-encoded ARTLIST_PARAMS rather than urlencoding a fresh dict.
+
+        Args:
+            query: Raw user query; sanitized and encoded here.
+            time_result: Parsed time range, or None for the default window.
+
+        Returns:
+            Full request URL.
+        """
+        url = f"{self.BASE_URL}?query={_encode_gdelt_query(query)}&{self.ARTLIST_PARAMS}"
+
+        # Add time parameters based on parse result
+        if time_result and time_result.gdelt_timespan:
+            return f"{url}&timespan={quote_plus(time_result.gdelt_timespan)}"
+        if time_result and time_result.start_datetime:
+            url = f"{url}&startdatetime={quote_plus(time_result.start_datetime)}"
+            if time_result.end_datetime:
+                url = f"{url}&enddatetime={quote_plus(time_result.end_datetime)}"
+            return url
+        return f"{url}&timespan=1week"  # Default
+
+    def _rate_limit_delay(self, response: httpx.Response, previous: float, attempt: int) -> float:
+        """Choose how long to wait before retrying a 429 response.
+
+        A Retry-After header is honored, clamped to RETRY_AFTER_MAX, with up to
+        RETRY_BASE_DELAY of jitter added so callers told the same time do not
+        retry in lockstep. Without one, decorrelated jitter is used.
+
+        Args:
+            response: The 429 response.
+            previous: Delay used before the previous retry.
+            attempt: Zero-based attempt number, for logging.
+
+        Returns:
+            Seconds to sleep.
+        """
+        retry_after = response.headers.get("Retry-After")
+        hint = parse_retry_after(retry_after)
+        if hint is None:
+            delay = decorrelated_jitter(previous, self.RETRY_BASE_DELAY, self.RETRY_MAX_DELAY)
+        else:
+            delay = min(max(hint, self.RETRY_BASE_DELAY), self.RETRY_AFTER_MAX)
+            delay += random.uniform(0, self.RETRY_BASE_DELAY)
+        logger.warning(
+            f"GDELT rate limited (429, Retry-After: {retry_after}), "
+            f"retry {attempt + 1}/{self.MAX_RETRIES} after {delay:.1f}s"
+        )
+        return delay
+
+    def _no_data_result(self, query: str) -> OSINTResult:
+        """Build the result for a query that matched no articles."""
+        return OSINTResult(
+            status=ResultStatus.NO_DATA,
+            query=query,
+            results=[],
+            sources=[],
+            retrieved_at=datetime.now(timezone.utc),
+            error="No articles found. Try broader search terms or different keywords.",
+        )
+
     async def query(self, params: QueryParams) -> OSINTResult:
         """Query GDELT for articles matching the query.
 
@@ -102,80 +198,71 @@ class GDELTAdapter:
             AdapterTimeoutError: If request times out.
             AdapterParseError: If response cannot be parsed.
         """
-        # Generate cache key (include time_range to invalidate when parameters change)
-        timespan = params.time_range or "1week"
-        key = cache_key(self.source_name, "articles", search_query=f"{params.query}:{timespan}")
+        key = self._cache_key(params)
 
         # Check cache first
         if self._cache:
             cached = await self._cache.get(key)
             if cached and cached.data and not cached.is_stale:
                 logger.debug(f"Cache hit for {key}")
-                # Reconstruct OSINTResult from cached data
-                cached_results = cached.data.get("articles", [])
-                retrieved_at = datetime.now(timezone.utc)
-                return OSINTResult(
-                    status=ResultStatus.SUCCESS,
-                    query=params.query,
-                    results=cached_results,
-                    sources=[
-                        SourceAttribution(
-                            source=self.source_name,
-                            quality=self.base_quality_tier,
-                            confidence=ConfidenceLevel.LIKELY,
-                            metadata=SourceMetadata(
-                                source_name=self.source_name,
-                                source_url=self.BASE_URL,
-                                retrieved_at=retrieved_at,
-                            ),
-                        )
-                    ],
-                    retrieved_at=retrieved_at,
+                return self._cached_result(params.query, cached.data)
+
+        return await self._fetch(params, key)
+
+    def _cache_key(self, params: QueryParams) -> str:
+        """Build the cache key for a query."""
+        # Include time_range to invalidate when parameters change
+        timespan = params.time_range or "1week"
+        # GDELT splits queries on whitespace, so "Iran  sanctions" and
+        # "Iran sanctions" share a key. Case is kept: "OR" is an operator.
+        normalized_query = " ".join(params.query.split())
+        return cache_key(
+            self.source_name, "articles", search_query=f"{normalized_query}:{timespan}"
+        )
+
+    def _cached_result(self, query: str, data: dict[str, Any]) -> OSINTResult:
+        """Build the result for a query answered from cache."""
+        if not data.get("articles"):
+            return self._no_data_result(query)
+        # Cached articles were validated when the result was first
+        # built, so the cache hit skips validating them again
+        retrieved_at = datetime.now(timezone.utc)
+        return OSINTResult.model_construct(
+            status=ResultStatus.SUCCESS,
+            query=query,
+            results=data["articles"],
+            sources=[
+                build_attribution(
+                    self.source_name,
+                    self.base_quality_tier,
+                    ConfidenceLevel.LIKELY,
+                    self.BASE_URL,
+                    retrieved_at,
                 )
+            ],
+            retrieved_at=retrieved_at,
+        )
 
+    async def _fetch(self, params: QueryParams, key: str) -> OSINTResult:
+        """Query the GDELT API, bypassing the cache lookup, and cache the result."""
         # Parse time range if provided
         time_result = parse_time_range(params.time_range) if params.time_range else None
 
-        # Build request URL
-        # TIMESPAN limits to recent articles; GDELT defaults to 3 months by relevance
-        # "sort:datedesc" sorts newest first within the timespan
-        sanitized_query = _sanitize_gdelt_query(params.query)
-        query_params = {
-            "query": sanitized_query,
-            "mode": "ArtList",
-            "format": "json",
-            "maxrecords": 75,
-            "sort": "datedesc",
-        }
-
-        # Add time parameters based on parse result
-        if time_result and time_result.gdelt_timespan:
-            query_params["timespan"] = time_result.gdelt_timespan
-        elif time_result and time_result.start_datetime:
-            query_params["startdatetime"] = time_result.start_datetime
-            if time_result.end_datetime:
-                query_params["enddatetime"] = time_result.end_datetime
-        else:
-            query_params["timespan"] = "1week"  # Default
-
-        url = f"{self.BASE_URL}?{urlencode(query_params)}"
+        url = self._build_url(params.query, time_result)
 
         client = await self._get_client()
         logger.info(f"Querying GDELT: {params.query}")
 
-        # Retry loop with exponential backoff for rate limiting
+        # Retry loop with jittered exponential backoff for rate limiting
         last_error: Exception | None = None
+        delay = self.RETRY_BASE_DELAY
         for attempt in range(self.MAX_RETRIES):
             try:
                 response = await client.get(url)
 
                 # Handle rate limiting with retry
                 if response.status_code == 429:
-                    delay = self.RETRY_BASE_DELAY * (2**attempt)
-                    logger.warning(
-                        f"GDELT rate limited (429), retry {attempt + 1}/{self.MAX_RETRIES} "
-                        f"after {delay}s"
-                    )
+                    delay = self._rate_limit_delay(response, delay, attempt)
                     await asyncio.sleep(delay)
                     continue
 
@@ -188,11 +275,7 @@ class GDELTAdapter:
 
             except httpx.HTTPStatusError as e:
                 if e.response.status_code == 429:
-                    delay = self.RETRY_BASE_DELAY * (2**attempt)
-                    logger.warning(
-                        f"GDELT rate limited (429), retry {attempt + 1}/{self.MAX_RETRIES} "
-                        f"after {delay}s"
-                    )
+                    delay = self._rate_limit_delay(e.response, delay, attempt)
                     last_error = e
                     await asyncio.sleep(delay)
                     continue
@@ -213,7 +296,7 @@ class GDELTAdapter:
 
         # Parse response
         try:
-            data = response.json()
+            data = json_loads(response.content)
         except Exception as e:
             raise AdapterParseError(self.source_name, "Invalid JSON response") from e
 
@@ -221,46 +304,98 @@ class GDELTAdapter:
         articles = data.get("articles", [])
         if not articles:
             logger.info(f"No GDELT results for: {params.query}")
-            return OSINTResult(
-                status=ResultStatus.NO_DATA,
-                query=params.query,
-                results=[],
-                sources=[],
-                retrieved_at=datetime.now(timezone.utc),
-                error="No articles found. Try broader search terms or different keywords.",
-            )
+            # Remember the miss briefly so a repeated query does not hit the API
+            if self._cache:
+                settings = get_settings()
+                await self._cache.set(
+                    key=key,
+                    data={"articles": []},
+                    ttl_seconds=min(self.NO_DATA_TTL, settings.ttl_gdelt),
+                    source=self.source_name,
+                )
+            return self._no_data_result(params.query)
 
         # Build successful result
         retrieved_at = datetime.now(timezone.utc)
+        result = OSINTResult(
+            status=ResultStatus.SUCCESS,
+            query=params.query,
+            results=articles,
+            sources=[
+                build_attribution(
+                    self.source_name,
+                    self.base_quality_tier,
+                    ConfidenceLevel.LIKELY,
+                    url,
+                    retrieved_at,
+                )
+            ],
+            retrieved_at=retrieved_at,
+        )
 
-        # Cache the result
+        # Cache the validated articles, so cache hits can skip validation
         if self._cache:
             settings = get_settings()
             await self._cache.set(
                 key=key,
-                data={"articles": articles},
+                data={"articles": result.results},
                 ttl_seconds=settings.ttl_gdelt,
                 source=self.source_name,
             )
 
-        return OSINTResult(
-            status=ResultStatus.SUCCESS,
-            query=params.query,
-            results=articles,
-            sources=[
-                SourceAttribution(
-                    source=self.source_name,
-                    quality=self.base_quality_tier,
-                    confidence=ConfidenceLevel.LIKELY,
-                    metadata=SourceMetadata(
-                        source_name=self.source_name,
-                        source_url=url,
-                        retrieved_at=retrieved_at,
-                    ),
-                )
-            ],
-            retrieved_at=retrieved_at,
-        )
+        return result
+
+    async def query_many(
+        self, params_list: list[QueryParams], max_concurrency: int = 4
+    ) -> list[OSINTResult]:
+        """Run several queries concurrently, at most max_concurrency at a time.
+
+        The requests share the pooled HTTP/2 connection, so their round trips
+        overlap. The limit keeps a large fan-out from tripping GDELT's rate
+        limit. With a cache, all keys are looked up in one batch first and
+        only the misses are sent to GDELT. If one request fails, the rest are
+        cancelled.
+
+        Args:
+            params_list: Queries to run.
+            max_concurrency: Maximum number of requests in flight.
+
+        Returns:
+            One OSINTResult per query, in the same order as params_list.
+
+        Raises:
+            AdapterTimeoutError: If any request times out.
+            AdapterParseError: If any response cannot be parsed.
+        """
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        if not self._cache:
+
+            async def bounded_query(params: QueryParams) -> OSINTResult:
+                async with semaphore:
+                    return await self.query(params)
+
+            return await gather_or_cancel(bounded_query(p) for p in params_list)
+
+        # Look every key up at once, then only send the misses to GDELT
+        keys = [self._cache_key(p) for p in params_list]
+        cached = await self._cache.mget(keys)
+
+        async def bounded_fetch(params: QueryParams, key: str) -> OSINTResult:
+            async with semaphore:
+                return await self._fetch(params, key)
+
+        misses = [
+            (params, key)
+            for params, key, hit in zip(params_list, keys, cached)
+            if not (hit and hit.data)
+        ]
+        fetched = iter(await gather_or_cancel(bounded_fetch(p, k) for p, k in misses))
+
+        return [
+            self._cached_result(params.query, hit.data) if hit and hit.data else next(fetched)
+            for params, hit in zip(params_list, cached)
+        ]
 
     async def health_check(self) -> bool:
         """Check if GDELT API is reachable.
@@ -6,13 +6,26 @@ of ADS-B receivers. Uses OAuth2 client credentials flow for authentication.
 API Reference: https://openskynetwork.github.io/opensky-api/rest.html
 """
 
+from __future__ import annotations
+
+import asyncio
 import logging
+import random
+import time
+from dataclasses import dataclass, field
 from datetime import datetime, timedelta, timezone
-from typing import Any
-
-import httpx
-
-from ignifer.adapters.base import AdapterAuthError, AdapterParseError, AdapterTimeoutError
+from operator import itemgetter
+from typing import TYPE_CHECKING, Any
+
+from ignifer._json import loads as json_loads
+from ignifer.adapters._fanout import gather_or_cancel
+from ignifer.adapters._lazy import lazy_import
+from ignifer.adapters.base import (
+    AdapterAuthError,
+    AdapterParseError,
+    AdapterTimeoutError,
+    build_attribution,
+)
 from ignifer.cache import CacheManager, cache_key
 from ignifer.config import get_settings
 from ignifer.models import (
@@ -21,10 +34,16 @@ from ignifer.models import (
     QualityTier,
     QueryParams,
     ResultStatus,
-    SourceAttribution,
-    SourceMetadata,
 )
 
+if TYPE_CHECKING:
+    import httpx
+
+    from ignifer.adapters._http import get_transport
+else:
+    httpx = lazy_import("httpx")
+    get_transport = lazy_import("ignifer.adapters._http:get_transport")
+
 logger = logging.getLogger(__name__)
 
 # OAuth2 token endpoint
@@ -34,6 +53,104 @@ OPENSKY_TOKEN_URL = (
 )
 
 
+# Keys of a parsed state vector, in the order _parse_state_vector builds them
+_STATE_FIELDS = (
+    "icao24",
+    "callsign",
+    "origin_country",
+    "time_position",
+    "last_contact",
+    "longitude",
+    "latitude",
+    "altitude_barometric",
+    "on_ground",
+    "velocity",
+    "heading",
+    "vertical_rate",
+    "altitude_geometric",
+    "squawk",
+)
+
+
+def _states_to_columns(states: list[dict[str, Any]]) -> dict[str, list[Any]]:
+    """Store parsed states as one list per field.
+
+    The full feed has ~10k aircraft. Cached as rows, each one repeats all 14
+    key names, which dominates both the L1 memory use and the JSON written
+    to L2. Columns store each name once.
+    """
+    return {name: [state[name] for state in states] for name in _STATE_FIELDS}
+
+
+def _columns_to_states(columns: dict[str, list[Any]]) -> list[dict[str, Any]]:
+    """Rebuild parsed state dicts from _states_to_columns output."""
+    names = list(columns)
+    return [dict(zip(names, values)) for values in zip(*columns.values())]
+
+
+# Fields of a track waypoint array, in OpenSky's order
+_TRACK_POINT_FIELDS = ("timestamp", "latitude", "longitude", "altitude", "heading", "on_ground")
+
+
+def _track_rows(
+    path: list[list[Any]],
+    icao24: str | None,
+    callsign: str,
+    start_time: int | None,
+    end_time: int | None,
+) -> list[dict[str, Any]]:
+    """Flatten track waypoint arrays into result rows.
+
+    Track waypoints: [0] time, [1] latitude, [2] longitude, [3] baro_altitude,
+    [4] true_track, [5] on_ground. OSINTResult.results only supports flat
+    dicts with scalar values, so every row repeats the track metadata.
+    """
+    return [
+        {
+            "icao24": icao24,
+            "callsign": callsign,
+            "start_time": start_time,
+            "end_time": end_time,
+            "timestamp": wp[0],
+            "latitude": wp[1],
+            "longitude": wp[2],
+            "altitude": wp[3],
+            "heading": wp[4],
+            "on_ground": wp[5],
+        }
+        for wp in path
+    ]
+
+
+@dataclass
+class _TokenCache:
+    """OAuth2 token state shared by all adapters using the same client_id."""
+
+    access_token: str | None = None
+    expires_at: datetime | None = None
+    lock: asyncio.Lock = field(default_factory=asyncio.Lock)
+
+
+# Keyed by client_id so adapters created per request reuse one token
+_token_caches: dict[str, _TokenCache] = {}
+
+
+def _get_token_cache(client_id: str) -> _TokenCache:
+    """Return the shared token cache for a client_id, creating it if needed."""
+    token_cache = _token_caches.get(client_id)
+    if token_cache is None:
+        token_cache = _token_caches[client_id] = _TokenCache()
+    return token_cache
+
+
+def reset_token_cache() -> None:
+    """Forget all cached OpenSky OAuth2 tokens.
+
+    Primarily used for testing so each test starts without a token.
+    """
+    _token_caches.clear()
+
+
 class OpenSkyAdapter:
     """OpenSky Network adapter for live aircraft tracking.
 
@@ -46,8 +163,11 @@ class OpenSkyAdapter:
     """
 
     BASE_URL = "https://opensky-network.org"
+    STATES_URL = f"{BASE_URL}/api/states/all"
+    TRACKS_URL = f"{BASE_URL}/api/tracks/all"
     DEFAULT_TIMEOUT = 15.0  # seconds
     TOKEN_REFRESH_MARGIN = 60  # Refresh token 60 seconds before expiry
+    TOKEN_EXPIRY_JITTER = 0.1  # Shorten token lifetime by up to 10% at random
 
     def __init__(self, cache: CacheManager | None = None) -> None:
         """Initialize the OpenSky adapter.
@@ -57,9 +177,6 @@ class OpenSkyAdapter:
         """
         self._client: httpx.AsyncClient | None = None
         self._cache = cache
-        # OAuth2 token state
-        self._access_token: str | None = None
-        self._token_expires_at: datetime | None = None
 
     @property
     def source_name(self) -> str:
@@ -86,22 +203,28 @@ class OpenSkyAdapter:
         client_secret = settings.opensky_client_secret.get_secret_value()  # type: ignore[union-attr]
         return (client_id, client_secret)
 
+    def _cached_access_token(self, token_cache: _TokenCache) -> str | None:
+        """Return the cached access token unless it is due for refresh."""
+        if token_cache.access_token and token_cache.expires_at:
+            now = datetime.now(timezone.utc)
+            if now < token_cache.expires_at - timedelta(seconds=self.TOKEN_REFRESH_MARGIN):
+                return token_cache.access_token
+        return None
+
     async def _get_access_token(self) -> str:
         """Get a valid OAuth2 access token, refreshing if necessary.
 
+        Tokens are cached per client_id at module level, so every adapter
+        instance in the process shares one token. Concurrent callers that
+        find the token expired wait on a lock, so only one of them requests
+        a new token and the rest reuse it.
+
         Returns:
             Valid access token string.
 
         Raises:
             AdapterAuthError: If credentials are not configured or token request fails.
         """
-        # Check if we have a valid cached token
-        if self._access_token and self._token_expires_at:
-            now = datetime.now(timezone.utc)
-            if now < self._token_expires_at - timedelta(seconds=self.TOKEN_REFRESH_MARGIN):
-                return self._access_token
-
-        # Need to get a new token
         credentials = self._get_oauth_credentials()
         if credentials is None:
             settings = get_settings()
@@ -109,10 +232,42 @@ class OpenSkyAdapter:
                 self.source_name, settings.get_credential_error_message("opensky")
             )
 
+        token_cache = _get_token_cache(credentials[0])
+        token = self._cached_access_token(token_cache)
+        if token is not None:
+            return token
+
+        async with token_cache.lock:
+            # Another caller may have refreshed the token while we waited
+            token = self._cached_access_token(token_cache)
+            if token is None:
+                token = await self._fetch_access_token(credentials, token_cache)
+            return token
+
+    async def _fetch_access_token(
+        self, credentials: tuple[str, str], token_cache: _TokenCache
+    ) -> str:
+        """Request a new OAuth2 access token and store it in the shared cache.
+
+        Args:
+            credentials: Tuple of (client_id, client_secret).
+            token_cache: Shared token cache for this client_id.
+
+        Returns:
+            Newly issued access token string.
+
+        Raises:
+            AdapterAuthError: If the token request fails.
+        """
         client_id, client_secret = credentials
         logger.debug("Requesting new OpenSky OAuth2 token")
+        # expires_in counts from when the server issued the token, so measure the
+        # lifetime from before the request rather than after the response arrives
+        requested_at = datetime.now(timezone.utc)
 
-        async with httpx.AsyncClient(timeout=httpx.Timeout(10.0)) as token_client:
+        async with httpx.AsyncClient(
+            timeout=httpx.Timeout(10.0), transport=get_transport()
+        ) as token_client:
             try:
                 response = await token_client.post(
                     OPENSKY_TOKEN_URL,
@@ -131,7 +286,7 @@ class OpenSkyAdapter:
                     )
 
                 response.raise_for_status()
-                token_data = response.json()
+                token_data = json_loads(response.content)
 
             except httpx.HTTPStatusError as e:
                 logger.error(f"OpenSky token request failed: {e}")
@@ -146,18 +301,21 @@ class OpenSkyAdapter:
                 ) from e
 
         # Extract token and expiration
-        self._access_token = token_data.get("access_token")
+        access_token: str | None = token_data.get("access_token")
         expires_in = token_data.get("expires_in", 1800)  # Default 30 minutes
 
-        if not self._access_token:
+        if not access_token:
             raise AdapterAuthError(
                 self.source_name, "OAuth2 response missing access_token"
             )
 
-        self._token_expires_at = datetime.now(timezone.utc) + timedelta(seconds=expires_in)
+        # Jitter the lifetime so adapters started together don't all refresh at once
+        lifetime = expires_in - random.uniform(0, self.TOKEN_EXPIRY_JITTER * expires_in)
+        token_cache.access_token = access_token
+        token_cache.expires_at = requested_at + timedelta(seconds=lifetime)
         logger.info(f"OpenSky OAuth2 token obtained, expires in {expires_in}s")
 
-        return self._access_token
+        return access_token
 
     async def _get_client(self) -> httpx.AsyncClient:
         """Lazy initialization of HTTP client with Bearer token auth.
@@ -171,18 +329,20 @@ class OpenSkyAdapter:
         # Get valid access token (may refresh if expired)
         token = await self._get_access_token()
 
-        # Create or update client with current token
+        # Create client with current token; refreshes update its header in place
+        authorization = f"Bearer {token}"
         if self._client is None:
             self._client = httpx.AsyncClient(
                 timeout=httpx.Timeout(self.DEFAULT_TIMEOUT),
                 headers={
                     "User-Agent": "Ignifer/1.0",
-                    "Authorization": f"Bearer {token}",
+                    "Authorization": authorization,
                 },
+                transport=get_transport(),
             )
-        else:
-            # Update the authorization header with fresh token
-            self._client.headers["Authorization"] = f"Bearer {token}"
+        elif self._client.headers.get("Authorization") != authorization:
+            # The shared token was refreshed, possibly by another adapter
+            self._client.headers["Authorization"] = authorization
 
         return self._client
 
@@ -218,73 +378,38 @@ class OpenSkyAdapter:
             "squawk": state[14],
         }
 
-    def _parse_track_point(self, waypoint: list[Any]) -> dict[str, Any]:
-        """Parse OpenSky track waypoint array into named dict.
+    async def _get_json(
+        self,
+        url: str,
+        query: str,
+        params: dict[str, str] | None = None,
+        not_found_error: str | None = None,
+    ) -> dict[str, Any] | OSINTResult:
+        """GET an OpenSky endpoint and decode the JSON body.
 
-        Track waypoints: [0] time, [1] latitude, [2] longitude, [3] baro_altitude,
-        [4] true_track, [5] on_ground
+        Handles the responses every endpoint treats alike: 401 raises
+        AdapterAuthError, 429 becomes a RATE_LIMITED result and, if
+        not_found_error is given, 404 becomes a NO_DATA result with that
+        message.
 
         Args:
-            waypoint: Raw waypoint array from OpenSky API
-
-        Returns:
-            Dictionary with named fields
-        """
-        return {
-            "timestamp": waypoint[0],
-            "latitude": waypoint[1],
-            "longitude": waypoint[2],
-            "altitude": waypoint[3],
-            "heading": waypoint[4],
-            "on_ground": waypoint[5],
-        }
-
-    async def query(self, params: QueryParams) -> OSINTResult:
-        """Query OpenSky by callsign.
-
-        Args:
-            params: Query parameters with callsign in query field.
+            url: Endpoint URL.
+            query: Query string to report in a returned OSINTResult.
+            params: Optional query parameters.
+            not_found_error: Error message for a 404, or None to treat a 404
+                as any other HTTP error.
 
         Returns:
-            OSINTResult with aircraft state vectors matching callsign.
+            The decoded body, or an OSINTResult for the caller to return.
 
         Raises:
             AdapterAuthError: If credentials not configured or invalid.
             AdapterTimeoutError: If request times out.
-            AdapterParseError: If response cannot be parsed.
+            AdapterParseError: If the request fails or the body is not JSON.
         """
-        callsign = params.query.strip().upper()
-
-        # Generate cache key
-        key = cache_key(self.source_name, "callsign", callsign=callsign)
-
-        # Check cache first
-        if self._cache:
-            cached = await self._cache.get(key)
-            if cached and cached.data and not cached.is_stale:
-                logger.debug(f"Cache hit for {key}")
-                return self._build_result_from_cache(callsign, cached.data)
-
         client = await self._get_client()
-        url = f"{self.BASE_URL}/api/states/all"
-        logger.info(f"Querying OpenSky by callsign: {callsign}")
-
         try:
-            response = await client.get(url)
-
-            if response.status_code == 401:
-                raise AdapterAuthError(self.source_name, "Invalid credentials")
-
-            if response.status_code == 429:
-                logger.warning("OpenSky rate limited")
-                return OSINTResult(
-                    status=ResultStatus.RATE_LIMITED,
-                    query=callsign,
-                    results=[],
-                    sources=[],
-                    retrieved_at=datetime.now(timezone.utc),
-                )
-
+            response = await client.get(url, params=params)
             response.raise_for_status()
 
         except httpx.TimeoutException as e:
@@ -292,15 +417,26 @@ class OpenSkyAdapter:
             raise AdapterTimeoutError(self.source_name, self.DEFAULT_TIMEOUT) from e
 
         except httpx.HTTPStatusError as e:
-            if e.response.status_code == 401:
+            status_code = e.response.status_code
+            if status_code == 401:
                 raise AdapterAuthError(self.source_name, "Invalid credentials") from e
-            if e.response.status_code == 429:
+            if status_code == 429:
+                logger.warning("OpenSky rate limited")
                 return OSINTResult(
                     status=ResultStatus.RATE_LIMITED,
-                    query=callsign,
+                    query=query,
+                    results=[],
+                    sources=[],
+                    retrieved_at=datetime.now(timezone.utc),
+                )
+            if status_code == 404 and not_found_error is not None:
+                return OSINTResult(
+                    status=ResultStatus.NO_DATA,
+                    query=query,
                     results=[],
                     sources=[],
                     retrieved_at=datetime.now(timezone.utc),
+                    error=not_found_error,
                 )
             logger.error(f"OpenSky HTTP error: {e}")
             raise AdapterParseError(self.source_name, str(e)) from e
@@ -309,19 +445,70 @@ class OpenSkyAdapter:
             logger.error(f"OpenSky HTTP error: {e}")
             raise AdapterParseError(self.source_name, str(e)) from e
 
-        # Parse response
         try:
-            data = response.json()
+            data: dict[str, Any] = json_loads(response.content)
         except Exception as e:
             raise AdapterParseError(self.source_name, "Invalid JSON response") from e
+        return data
+
+    @staticmethod
+    def _states_ttl(max_age: int, server_time: int | None) -> int:
+        """Cache lifetime for state vectors, counted from when OpenSky sampled them.
+
+        A response can already be some seconds old when it arrives, so caching
+        it for the full TTL would serve data older than max_age.
+
+        Args:
+            max_age: Oldest the cached state vectors may get, in seconds.
+            server_time: The response's "time" field (Unix seconds), if any.
+
+        Returns:
+            Seconds to cache the response, at least 1.
+        """
+        if server_time is None:
+            return max_age
+        age = max(0, int(time.time()) - server_time)
+        return max(1, max_age - age)
+
+    async def query(self, params: QueryParams) -> OSINTResult:
+        """Query OpenSky by callsign.
+
+        Args:
+            params: Query parameters with callsign in query field.
+
+        Returns:
+            OSINTResult with aircraft state vectors matching callsign.
+
+        Raises:
+            AdapterAuthError: If credentials not configured or invalid.
+            AdapterTimeoutError: If request times out.
+            AdapterParseError: If response cannot be parsed.
+        """
+        callsign = params.query.strip().upper()
+
+        # Generate cache key
+        key = cache_key(self.source_name, "callsign", callsign=callsign)
 
-        # Filter states by callsign
+        # Check cache first
+        if self._cache:
+            cached = await self._cache.get(key)
+            if cached and cached.data and not cached.is_stale:
+                logger.debug(f"Cache hit for {key}")
+                return self._build_result_from_cache(callsign, cached.data)
+
+        url = self.STATES_URL
+        logger.info(f"Querying OpenSky by callsign: {callsign}")
+
+        data = await self._get_json(url, callsign)
+        if isinstance(data, OSINTResult):
+            return data
+
+        # Filter states by callsign on the raw arrays, so only the few matches
+        # out of the full feed are turned into dicts. Callsigns are padded
+        # with trailing spaces, which a substring test does not care about.
         states = data.get("states") or []
-        matching_states = []
-        for state in states:
-            state_callsign = (state[1] or "").strip().upper()
-            if callsign in state_callsign or state_callsign.startswith(callsign):
-                matching_states.append(self._parse_state_vector(state))
+        parse = self._parse_state_vector
+        matching_states = [parse(state) for state in states if callsign in (state[1] or "").upper()]
 
         if not matching_states:
             return OSINTResult(
@@ -339,7 +526,7 @@ class OpenSkyAdapter:
             await self._cache.set(
                 key=key,
                 data={"states": matching_states, "time": data.get("time")},
-                ttl_seconds=settings.ttl_opensky,
+                ttl_seconds=self._states_ttl(settings.ttl_opensky, data.get("time")),
                 source=self.source_name,
             )
 
@@ -349,15 +536,12 @@ class OpenSkyAdapter:
             query=callsign,
             results=matching_states,
             sources=[
-                SourceAttribution(
-                    source=self.source_name,
-                    quality=self.base_quality_tier,
-                    confidence=ConfidenceLevel.ALMOST_CERTAIN,  # ADS-B data
-                    metadata=SourceMetadata(
-                        source_name=self.source_name,
-                        source_url=url,
-                        retrieved_at=retrieved_at,
-                    ),
+                build_attribution(
+                    self.source_name,
+                    self.base_quality_tier,
+                    ConfidenceLevel.ALMOST_CERTAIN,  # ADS-B data
+                    url,
+                    retrieved_at,
                 )
             ],
             retrieved_at=retrieved_at,
@@ -388,59 +572,16 @@ class OpenSkyAdapter:
                 logger.debug(f"Cache hit for {key}")
                 return self._build_result_from_cache(icao24 or "all", cached.data)
 
-        client = await self._get_client()
-        url = f"{self.BASE_URL}/api/states/all"
+        url = self.STATES_URL
         params: dict[str, str] = {}
         if icao24:
             params["icao24"] = icao24.lower()
 
         logger.info(f"Querying OpenSky states: icao24={icao24 or 'all'}")
 
-        try:
-            response = await client.get(url, params=params if params else None)
-
-            if response.status_code == 401:
-                raise AdapterAuthError(self.source_name, "Invalid credentials")
-
-            if response.status_code == 429:
-                logger.warning("OpenSky rate limited")
-                return OSINTResult(
-                    status=ResultStatus.RATE_LIMITED,
-                    query=icao24 or "all",
-                    results=[],
-                    sources=[],
-                    retrieved_at=datetime.now(timezone.utc),
-                )
-
-            response.raise_for_status()
-
-        except httpx.TimeoutException as e:
-            logger.warning(f"OpenSky timeout: {e}")
-            raise AdapterTimeoutError(self.source_name, self.DEFAULT_TIMEOUT) from e
-
-        except httpx.HTTPStatusError as e:
-            if e.response.status_code == 401:
-                raise AdapterAuthError(self.source_name, "Invalid credentials") from e
-            if e.response.status_code == 429:
-                return OSINTResult(
-                    status=ResultStatus.RATE_LIMITED,
-                    query=icao24 or "all",
-                    results=[],
-                    sources=[],
-                    retrieved_at=datetime.now(timezone.utc),
-                )
-            logger.error(f"OpenSky HTTP error: {e}")
-            raise AdapterParseError(self.source_name, str(e)) from e
-
-        except httpx.HTTPError as e:
-            logger.error(f"OpenSky HTTP error: {e}")
-            raise AdapterParseError(self.source_name, str(e)) from e
-
-        # Parse response
-        try:
-            data = response.json()
-        except Exception as e:
-            raise AdapterParseError(self.source_name, "Invalid JSON response") from e
+        data = await self._get_json(url, icao24 or "all", params=params or None)
+        if isinstance(data, OSINTResult):
+            return data
 
         states = data.get("states") or []
         if not states:
@@ -460,8 +601,8 @@ class OpenSkyAdapter:
             settings = get_settings()
             await self._cache.set(
                 key=key,
-                data={"states": parsed_states, "time": data.get("time")},
-                ttl_seconds=settings.ttl_opensky,
+                data={"columns": _states_to_columns(parsed_states), "time": data.get("time")},
+                ttl_seconds=self._states_ttl(settings.ttl_opensky, data.get("time")),
                 source=self.source_name,
             )
 
@@ -471,15 +612,12 @@ class OpenSkyAdapter:
             query=icao24 or "all",
             results=parsed_states,
             sources=[
-                SourceAttribution(
-                    source=self.source_name,
-                    quality=self.base_quality_tier,
-                    confidence=ConfidenceLevel.ALMOST_CERTAIN,
-                    metadata=SourceMetadata(
-                        source_name=self.source_name,
-                        source_url=url + (f"?icao24={icao24}" if icao24 else ""),
-                        retrieved_at=retrieved_at,
-                    ),
+                build_attribution(
+                    self.source_name,
+                    self.base_quality_tier,
+                    ConfidenceLevel.ALMOST_CERTAIN,
+                    url + (f"?icao24={icao24}" if icao24 else ""),
+                    retrieved_at,
                 )
             ],
             retrieved_at=retrieved_at,
@@ -514,77 +652,20 @@ class OpenSkyAdapter:
                 logger.debug(f"Cache hit for {key}")
                 return self._build_track_result_from_cache(icao24_lower, cached.data)
 
-        client = await self._get_client()
         # time=0 means get track for current flight
-        url = f"{self.BASE_URL}/api/tracks/all"
+        url = self.TRACKS_URL
         params = {"icao24": icao24_lower, "time": "0"}
 
         logger.info(f"Querying OpenSky track: icao24={icao24}")
 
-        try:
-            response = await client.get(url, params=params)
-
-            if response.status_code == 401:
-                raise AdapterAuthError(self.source_name, "Invalid credentials")
-
-            if response.status_code == 429:
-                logger.warning("OpenSky rate limited")
-                return OSINTResult(
-                    status=ResultStatus.RATE_LIMITED,
-                    query=icao24_lower,
-                    results=[],
-                    sources=[],
-                    retrieved_at=datetime.now(timezone.utc),
-                )
-
-            if response.status_code == 404:
-                return OSINTResult(
-                    status=ResultStatus.NO_DATA,
-                    query=icao24_lower,
-                    results=[],
-                    sources=[],
-                    retrieved_at=datetime.now(timezone.utc),
-                    error=f"No track data found for aircraft '{icao24}'",
-                )
-
-            response.raise_for_status()
-
-        except httpx.TimeoutException as e:
-            logger.warning(f"OpenSky timeout: {e}")
-            raise AdapterTimeoutError(self.source_name, self.DEFAULT_TIMEOUT) from e
-
-        except httpx.HTTPStatusError as e:
-            if e.response.status_code == 401:
-                raise AdapterAuthError(self.source_name, "Invalid credentials") from e
-            if e.response.status_code == 429:
-                return OSINTResult(
-                    status=ResultStatus.RATE_LIMITED,
-                    query=icao24_lower,
-                    results=[],
-                    sources=[],
-                    retrieved_at=datetime.now(timezone.utc),
-                )
-            if e.response.status_code == 404:
-                return OSINTResult(
-                    status=ResultStatus.NO_DATA,
-                    query=icao24_lower,
-                    results=[],
-                    sources=[],
-                    retrieved_at=datetime.now(timezone.utc),
-                    error=f"No track data found for aircraft '{icao24}'",
-                )
-            logger.error(f"OpenSky HTTP error: {e}")
-            raise AdapterParseError(self.source_name, str(e)) from e
-
-        except httpx.HTTPError as e:
-            logger.error(f"OpenSky HTTP error: {e}")
-            raise AdapterParseError(self.source_name, str(e)) from e
-
-        # Parse response
-        try:
-            data = response.json()
-        except Exception as e:
-            raise AdapterParseError(self.source_name, "Invalid JSON response") from e
+        data = await self._get_json(
+            url,
+            icao24_lower,
+            params=params,
+            not_found_error=f"No track data found for aircraft '{icao24}'",
+        )
+        if isinstance(data, OSINTResult):
+            return data
 
         path = data.get("path") or []
         if not path:
@@ -597,39 +678,21 @@ class OpenSkyAdapter:
                 error=f"No track data found for aircraft '{icao24}'",
             )
 
-        # Parse waypoints and sort chronologically
-        raw_waypoints = [self._parse_track_point(wp) for wp in path]
-        raw_waypoints.sort(key=lambda x: x.get("timestamp", 0))
-
-        # Include track metadata in each waypoint for flat structure
-        # OSINTResult.results only supports flat dicts with scalar values
+        # Sort chronologically on the raw arrays, then build each row in one pass
+        path.sort(key=itemgetter(0))
         icao24_val = data.get("icao24")
         callsign_val = (data.get("callsign") or "").strip()
         start_time_val = data.get("startTime")
         end_time_val = data.get("endTime")
+        waypoints = _track_rows(path, icao24_val, callsign_val, start_time_val, end_time_val)
 
-        waypoints: list[dict[str, str | int | float | bool | None]] = []
-        for wp in raw_waypoints:
-            waypoints.append({
-                "icao24": icao24_val,
-                "callsign": callsign_val,
-                "start_time": start_time_val,
-                "end_time": end_time_val,
-                "timestamp": wp.get("timestamp"),
-                "latitude": wp.get("latitude"),
-                "longitude": wp.get("longitude"),
-                "altitude": wp.get("altitude"),
-                "heading": wp.get("heading"),
-                "on_ground": wp.get("on_ground"),
-            })
-
-        # Cache the raw waypoints for later retrieval
+        # Cache the sorted waypoint arrays for later retrieval
         cache_data = {
             "icao24": icao24_val,
             "callsign": callsign_val,
             "start_time": start_time_val,
             "end_time": end_time_val,
-            "waypoints": raw_waypoints,
+            "path": path,
         }
         if self._cache:
             settings = get_settings()
@@ -646,39 +709,65 @@ class OpenSkyAdapter:
             query=icao24_lower,
             results=waypoints,
             sources=[
-                SourceAttribution(
-                    source=self.source_name,
-                    quality=self.base_quality_tier,
-                    confidence=ConfidenceLevel.ALMOST_CERTAIN,
-                    metadata=SourceMetadata(
-                        source_name=self.source_name,
-                        source_url=f"{url}?icao24={icao24_lower}&time=0",
-                        retrieved_at=retrieved_at,
-                    ),
+                build_attribution(
+                    self.source_name,
+                    self.base_quality_tier,
+                    ConfidenceLevel.ALMOST_CERTAIN,
+                    f"{url}?icao24={icao24_lower}&time=0",
+                    retrieved_at,
                 )
             ],
             retrieved_at=retrieved_at,
         )
 
+    async def get_tracks(self, icao24s: list[str], max_concurrency: int = 10) -> list[OSINTResult]:
+        """Get flight tracks for several aircraft concurrently.
+
+        The requests share the pooled HTTP/2 connection, so their round trips
+        overlap. The limit keeps a large fan-out within OpenSky's rate limit,
+        and if one request fails the rest are cancelled.
+
+        Args:
+            icao24s: ICAO24 transponder codes of the aircraft.
+            max_concurrency: Maximum number of requests in flight.
+
+        Returns:
+            One OSINTResult per aircraft, in the same order as icao24s.
+
+        Raises:
+            AdapterAuthError: If credentials not configured or invalid.
+            AdapterTimeoutError: If any request times out.
+            AdapterParseError: If any response cannot be parsed.
+        """
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def bounded_track(icao24: str) -> OSINTResult:
+            async with semaphore:
+                return await self.get_track(icao24)
+
+        # On the first error, cancel the tracks still in flight or queued
+        return await gather_or_cancel(bounded_track(i) for i in icao24s)
+
     def _build_result_from_cache(
         self, query: str, cached_data: dict[str, Any]
     ) -> OSINTResult:
         """Build OSINTResult from cached state data."""
+        if "columns" in cached_data:
+            states = _columns_to_states(cached_data["columns"])
+        else:
+            states = cached_data.get("states", [])
         retrieved_at = datetime.now(timezone.utc)
         return OSINTResult(
             status=ResultStatus.SUCCESS,
             query=query,
-            results=cached_data.get("states", []),
+            results=states,
             sources=[
-                SourceAttribution(
-                    source=self.source_name,
-                    quality=self.base_quality_tier,
-                    confidence=ConfidenceLevel.ALMOST_CERTAIN,
-                    metadata=SourceMetadata(
-                        source_name=self.source_name,
-                        source_url=f"{self.BASE_URL}/api/states/all",
-                        retrieved_at=retrieved_at,
-                    ),
+                build_attribution(
+                    self.source_name,
+                    self.base_quality_tier,
+                    ConfidenceLevel.ALMOST_CERTAIN,
+                    self.STATES_URL,
+                    retrieved_at,
                 )
             ],
             retrieved_at=retrieved_at,
@@ -688,27 +777,20 @@ class OpenSkyAdapter:
         self, icao24: str, cached_data: dict[str, Any]
     ) -> OSINTResult:
         """Build OSINTResult from cached track data."""
-        # Reconstruct flat waypoint list from cached data
-        icao24_val = cached_data.get("icao24")
-        callsign_val = cached_data.get("callsign", "")
-        start_time_val = cached_data.get("start_time")
-        end_time_val = cached_data.get("end_time")
-        raw_waypoints = cached_data.get("waypoints", [])
-
-        waypoints: list[dict[str, str | int | float | bool | None]] = []
-        for wp in raw_waypoints:
-            waypoints.append({
-                "icao24": icao24_val,
-                "callsign": callsign_val,
-                "start_time": start_time_val,
-                "end_time": end_time_val,
-                "timestamp": wp.get("timestamp"),
-                "latitude": wp.get("latitude"),
-                "longitude": wp.get("longitude"),
-                "altitude": wp.get("altitude"),
-                "heading": wp.get("heading"),
-                "on_ground": wp.get("on_ground"),
-            })
+        path = cached_data.get("path")
+        if path is None:
+            # Entries cached before tracks were stored as raw arrays
+            path = [
+                [wp.get(name) for name in _TRACK_POINT_FIELDS]
+                for wp in cached_data.get("waypoints", [])
+            ]
+        waypoints = _track_rows(
+            path,
+            cached_data.get("icao24"),
+            cached_data.get("callsign", ""),
+            cached_data.get("start_time"),
+            cached_data.get("end_time"),
+        )
 
         retrieved_at = datetime.now(timezone.utc)
         return OSINTResult(
@@ -716,15 +798,12 @@ class OpenSkyAdapter:
             query=icao24,
             results=waypoints,
             sources=[
-                SourceAttribution(
-                    source=self.source_name,
-                    quality=self.base_quality_tier,
-                    confidence=ConfidenceLevel.ALMOST_CERTAIN,
-                    metadata=SourceMetadata(
-                        source_name=self.source_name,
-                        source_url=f"{self.BASE_URL}/api/tracks/all?icao24={icao24}&time=0",
-                        retrieved_at=retrieved_at,
-                    ),
+                build_attribution(
+                    self.source_name,
+                    self.base_quality_tier,
+                    ConfidenceLevel.ALMOST_CERTAIN,
+                    f"{self.TRACKS_URL}?icao24={icao24}&time=0",
+                    retrieved_at,
                 )
             ],
             retrieved_at=retrieved_at,
@@ -740,7 +819,7 @@ class OpenSkyAdapter:
             client = await self._get_client()
             # Use a simple states query to test connectivity
             response = await client.get(
-                f"{self.BASE_URL}/api/states/all",
+                self.STATES_URL,
                 params={"icao24": "abc123"},  # Specific query to minimize response size
             )
             # 200 = success, even with no results
@@ -5,14 +5,21 @@ from Wikidata via the MediaWiki Action API. Uses wbsearchentities for
 text search and wbgetentities for direct Q-ID lookup.
 """
 
+from __future__ import annotations
+
 import logging
 import re
 from datetime import datetime, timezone
-from typing import Any
-
-import httpx
-
-from ignifer.adapters.base import AdapterParseError, AdapterTimeoutError, handle_http_status
+from typing import TYPE_CHECKING, Any
+
+from ignifer._json import loads as json_loads
+from ignifer.adapters._lazy import lazy_import
+from ignifer.adapters.base import (
+    AdapterParseError,
+    AdapterTimeoutError,
+    build_attribution,
+    handle_http_status,
+)
 
 # Regex pattern for valid Wikidata Q-ID format (Q followed by one or more digits)
 QID_PATTERN = re.compile(r"^Q\d+$")
@@ -25,10 +32,16 @@ from ignifer.models import (
     QualityTier,
     QueryParams,
     ResultStatus,
-    SourceAttribution,
-    SourceMetadata,
 )
 
+if TYPE_CHECKING:
+    import httpx
+
+    from ignifer.adapters._http import get_transport
+else:
+    httpx = lazy_import("httpx")
+    get_transport = lazy_import("ignifer.adapters._http:get_transport")
+
 logger = logging.getLogger(__name__)
 
 # Key Wikidata properties to extract from claims
@@ -94,6 +107,7 @@ class WikidataAdapter:
                 headers={
                     "User-Agent": "Ignifer/1.0 (https://github.com/ignifer/ignifer; ignifer@example.com)"
                 },
+                transport=get_transport(),
             )
         return self._client
 
@@ -106,11 +120,10 @@ class WikidataAdapter:
         Returns:
             Dict of language code to label value
         """
-        labels = {}
-        raw_labels = entity_data.get("labels", {})
-        for lang, label_data in raw_labels.items():
-            labels[lang] = label_data.get("value", "")
-        return labels
+        return {
+            lang: label_data.get("value", "")
+            for lang, label_data in entity_data.get("labels", {}).items()
+        }
 
     def _extract_aliases(self, entity_data: dict[str, Any]) -> list[str]:
         """Extract aliases from entity data.
@@ -121,20 +134,20 @@ class WikidataAdapter:
         Returns:
             List of alias strings (English preferred, then others)
         """
-        aliases = []
         raw_aliases = entity_data.get("aliases", {})
 
         # Prefer English aliases first
-        if "en" in raw_aliases:
-            for alias_data in raw_aliases["en"]:
-                aliases.append(alias_data.get("value", ""))
+        aliases = [alias_data.get("value", "") for alias_data in raw_aliases.get("en", ())]
 
-        # Add aliases from other languages
+        # Add aliases from other languages, skipping ones already listed
+        # (tracked in a set: popular entities have hundreds of aliases)
+        seen = set(aliases)
         for lang, alias_list in raw_aliases.items():
             if lang != "en":
                 for alias_data in alias_list:
                     value = alias_data.get("value", "")
-                    if value and value not in aliases:
+                    if value and value not in seen:
+                        seen.add(value)
                         aliases.append(value)
 
         return aliases
@@ -362,8 +375,8 @@ class WikidataAdapter:
 
         # Parse response
         try:
-            data = response.json()
-        except Exception as e:
+            data = json_loads(response.content)
+        except ValueError as e:
             raise AdapterParseError(self.source_name, "Invalid JSON response") from e
 
         search_results = data.get("search", [])
@@ -423,15 +436,12 @@ class WikidataAdapter:
             query=params.query,
             results=results,
             sources=[
-                SourceAttribution(
-                    source=self.source_name,
-                    quality=self.base_quality_tier,
-                    confidence=ConfidenceLevel.VERY_LIKELY,  # Search results may vary
-                    metadata=SourceMetadata(
-                        source_name=self.source_name,
-                        source_url=f"{self.BASE_URL}?action=wbsearchentities&search={query_text}",
-                        retrieved_at=retrieved_at,
-                    ),
+                build_attribution(
+                    self.source_name,
+                    self.base_quality_tier,
+                    ConfidenceLevel.VERY_LIKELY,  # Search results may vary
+                    f"{self.BASE_URL}?action=wbsearchentities&search={query_text}",
+                    retrieved_at,
                 )
             ],
             retrieved_at=retrieved_at,
@@ -537,8 +547,8 @@ class WikidataAdapter:
 
         # Parse response
         try:
-            data = response.json()
-        except Exception as e:
+            data = json_loads(response.content)
+        except ValueError as e:
             raise AdapterParseError(self.source_name, "Invalid JSON response") from e
 
         entities = data.get("entities", {})
@@ -613,15 +623,12 @@ class WikidataAdapter:
             query=qid,
             results=results,
             sources=[
-                SourceAttribution(
-                    source=self.source_name,
-                    quality=self.base_quality_tier,
-                    confidence=ConfidenceLevel.ALMOST_CERTAIN,  # Direct Q-ID lookup
-                    metadata=SourceMetadata(
-                        source_name=self.source_name,
-                        source_url=self._build_entity_url(qid),
-                        retrieved_at=retrieved_at,
-                    ),
+                build_attribution(
+                    self.source_name,
+                    self.base_quality_tier,
+                    ConfidenceLevel.ALMOST_CERTAIN,  # Direct Q-ID lookup
+                    self._build_entity_url(qid),
+                    retrieved_at,
                 )
             ],
             retrieved_at=retrieved_at,
@@ -647,7 +654,9 @@ class WikidataAdapter:
         entity_params = {
             "action": "wbgetentities",
             "ids": "|".join(qids),
-            "props": "labels|descriptions|aliases|claims",
+            # Search results already carry the label and description; only
+            # aliases and claims (instance_of) are read from this response.
+            "props": "aliases|claims",
             "languages": "en",
             "format": "json",
         }
@@ -682,8 +691,8 @@ class WikidataAdapter:
             return {}
 
         try:
-            data = response.json()
-        except Exception as e:
+            data = json_loads(response.content)
+        except ValueError as e:
             logger.warning(
                 f"Failed to parse entity details JSON for {len(qids)} entities. "
                 f"Search results will be returned without enriched properties. Error: {e}"
@@ -728,15 +737,12 @@ class WikidataAdapter:
             query=query,
             results=results,
             sources=[
-                SourceAttribution(
-                    source=self.source_name,
-                    quality=self.base_quality_tier,
-                    confidence=ConfidenceLevel.VERY_LIKELY,
-                    metadata=SourceMetadata(
-                        source_name=self.source_name,
-                        source_url=source_url,
-                        retrieved_at=retrieved_at,
-                    ),
+                build_attribution(
+                    self.source_name,
+                    self.base_quality_tier,
+                    ConfidenceLevel.VERY_LIKELY,
+                    source_url,
+                    retrieved_at,
                 )
             ],
             retrieved_at=retrieved_at,
@@ -1,12 +1,15 @@
 """World Bank adapter for economic indicators."""
 
+from __future__ import annotations
+
+import asyncio
 import logging
 from datetime import datetime, timezone
-from typing import Any
-
-import httpx
+from typing import TYPE_CHECKING, Any
 
-from ignifer.adapters.base import AdapterParseError, AdapterTimeoutError
+from ignifer._json import loads as json_loads
+from ignifer.adapters._lazy import lazy_import
+from ignifer.adapters.base import AdapterParseError, AdapterTimeoutError, build_attribution
 from ignifer.cache import CacheManager, cache_key
 from ignifer.config import get_settings
 from ignifer.models import (
@@ -15,10 +18,16 @@ from ignifer.models import (
     QualityTier,
     QueryParams,
     ResultStatus,
-    SourceAttribution,
-    SourceMetadata,
 )
 
+if TYPE_CHECKING:
+    import httpx
+
+    from ignifer.adapters._http import get_transport
+else:
+    httpx = lazy_import("httpx")
+    get_transport = lazy_import("ignifer.adapters._http:get_transport")
+
 logger = logging.getLogger(__name__)
 
 
@@ -47,6 +56,11 @@ INDICATOR_CODES: dict[str, str] = {
     "broad money": "FM.LBL.BMNY.GD.ZS",
 }
 
+# Indicator names longest first, so multi-word phrases match before their parts
+INDICATOR_NAMES_BY_LENGTH: tuple[str, ...] = tuple(
+    sorted(INDICATOR_CODES, key=len, reverse=True)
+)
+
 # Common aliases not in World Bank data (lowercase keys)
 COUNTRY_ALIASES: dict[str, str] = {
     "usa": "USA",
@@ -83,6 +97,10 @@ class WorldBankAdapter:
         self._client: httpx.AsyncClient | None = None
         self._cache = cache
         self._country_lookup: dict[str, str] | None = None
+        # Country names longest first, computed once per lookup table
+        self._country_names: tuple[dict[str, str], tuple[str, ...]] | None = None
+        # Concurrent first queries share one country-list fetch
+        self._country_lookup_lock = asyncio.Lock()
 
     @property
     def source_name(self) -> str:
@@ -100,6 +118,7 @@ class WorldBankAdapter:
             self._client = httpx.AsyncClient(
                 timeout=httpx.Timeout(self.DEFAULT_TIMEOUT),
                 headers={"User-Agent": "Ignifer/1.0"},
+                transport=get_transport(),
             )
         return self._client
 
@@ -112,8 +131,32 @@ class WorldBankAdapter:
         if self._country_lookup is not None:
             return self._country_lookup
 
+        async with self._country_lookup_lock:
+            if self._country_lookup is None:
+                self._country_lookup = await self._fetch_country_lookup()
+            return self._country_lookup
+
+    async def _fetch_country_lookup(self) -> dict[str, str]:
+        """Build the country lookup from aliases plus the World Bank country list.
+
+        The country list rarely changes, so a successful fetch is stored in the
+        cache manager and reused across processes instead of being re-downloaded
+        on every start.
+
+        Returns:
+            Dictionary mapping country names/codes (lowercase) to ISO3 codes.
+        """
+        key = cache_key(self.source_name, "countries")
+
+        if self._cache:
+            cached = await self._cache.get(key)
+            if cached and cached.data and not cached.is_stale:
+                logger.debug(f"Cache hit for {key}")
+                return dict(cached.data.get("lookup", {}))
+
         # Build lookup starting with hardcoded aliases
         lookup: dict[str, str] = dict(COUNTRY_ALIASES)
+        loaded = False
 
         try:
             client = await self._get_client()
@@ -122,7 +165,7 @@ class WorldBankAdapter:
             response = await client.get(url)
             response.raise_for_status()
 
-            data = response.json()
+            data = json_loads(response.content)
             if isinstance(data, list) and len(data) >= 2 and data[1]:
                 for country in data[1]:
                     iso3 = country.get("id", "").upper()
@@ -143,14 +186,35 @@ class WorldBankAdapter:
                     lookup[iso3.lower()] = iso3
 
                 logger.info(f"Loaded {len(data[1])} countries from World Bank API")
+                loaded = True
 
         except Exception as e:
             logger.warning(f"Failed to fetch country list from World Bank: {e}")
             # Fall back to aliases only - don't fail completely
 
-        self._country_lookup = lookup
+        # Only cache a complete lookup; an aliases-only fallback is retried next time
+        if self._cache and loaded:
+            settings = get_settings()
+            await self._cache.set(
+                key=key,
+                data={"lookup": lookup},
+                ttl_seconds=settings.ttl_worldbank,
+                source=self.source_name,
+            )
+
         return lookup
 
+    def _country_names_by_length(self, country_lookup: dict[str, str]) -> tuple[str, ...]:
+        """Return the lookup's country names longest first.
+
+        The several hundred names are sorted once per lookup table instead of
+        on every query.
+        """
+        if self._country_names is None or self._country_names[0] is not country_lookup:
+            names = tuple(sorted(country_lookup, key=len, reverse=True))
+            self._country_names = (country_lookup, names)
+        return self._country_names[1]
+
     def _parse_query(
         self, query: str, country_lookup: dict[str, str]
     ) -> tuple[str | None, str | None]:
@@ -167,14 +231,14 @@ class WorldBankAdapter:
 
         # Find indicator (check longer phrases first)
         indicator_code = None
-        for indicator_name in sorted(INDICATOR_CODES.keys(), key=len, reverse=True):
+        for indicator_name in INDICATOR_NAMES_BY_LENGTH:
             if indicator_name in query_lower:
                 indicator_code = INDICATOR_CODES[indicator_name]
                 break
 
         # Find country (check longer phrases first for multi-word names)
         country_code = None
-        for name in sorted(country_lookup.keys(), key=len, reverse=True):
+        for name in self._country_names_by_length(country_lookup):
             if name in query_lower:
                 country_code = country_lookup[name]
                 break
@@ -257,8 +321,8 @@ class WorldBankAdapter:
 
         # Parse response
         try:
-            data = response.json()
-        except Exception as e:
+            data = json_loads(response.content)
+        except ValueError as e:
             raise AdapterParseError(self.source_name, "Invalid JSON response") from e
 
         # World Bank returns [metadata, data] array
@@ -283,16 +347,17 @@ class WorldBankAdapter:
                 error="No data available for this indicator/country combination.",
             )
 
-        # Normalize results
-        results: list[dict[str, str | int | float | bool | None]] = []
-        for record in records:
-            if record.get("value") is not None:
-                results.append({
-                    "indicator": record.get("indicator", {}).get("value", ""),
-                    "country": record.get("country", {}).get("value", ""),
-                    "year": record.get("date", ""),
-                    "value": record.get("value"),
-                })
+        # Normalize results (single comprehension; years without a value are skipped)
+        results: list[dict[str, str | int | float | bool | None]] = [
+            {
+                "indicator": record.get("indicator", {}).get("value", ""),
+                "country": record.get("country", {}).get("value", ""),
+                "year": record.get("date", ""),
+                "value": value,
+            }
+            for record in records
+            if (value := record.get("value")) is not None
+        ]
 
         # Cache results
         if self._cache and results:
@@ -314,15 +379,12 @@ class WorldBankAdapter:
             query=params.query,
             results=results,
             sources=[
-                SourceAttribution(
-                    source=self.source_name,
-                    quality=self.base_quality_tier,
-                    confidence=ConfidenceLevel.ALMOST_CERTAIN,  # Official data
-                    metadata=SourceMetadata(
-                        source_name=self.source_name,
-                        source_url=url,
-                        retrieved_at=retrieved_at,
-                    ),
+                build_attribution(
+                    self.source_name,
+                    self.base_quality_tier,
+                    ConfidenceLevel.ALMOST_CERTAIN,  # Official data
+                    url,
+                    retrieved_at,
                 )
             ],
             retrieved_at=retrieved_at,
@@ -342,15 +404,12 @@ class WorldBankAdapter:
             query=query,
             results=cached_data.get("results", []),
             sources=[
-                SourceAttribution(
-                    source=self.source_name,
-                    quality=self.base_quality_tier,
-                    confidence=ConfidenceLevel.ALMOST_CERTAIN,
-                    metadata=SourceMetadata(
-                        source_name=self.source_name,
-                        source_url=f"{self.BASE_URL}/country/{country}/indicator/{indicator}",
-                        retrieved_at=retrieved_at,
-                    ),
+                build_attribution(
+                    self.source_name,
+                    self.base_quality_tier,
+                    ConfidenceLevel.ALMOST_CERTAIN,
+                    f"{self.BASE_URL}/country/{country}/indicator/{indicator}",
+                    retrieved_at,
                 )
             ],
             retrieved_at=retrieved_at,
@@ -206,6 +206,8 @@ PERSON_KEYWORDS: set[str] = {
 }
 
 # Vessel detection patterns and keywords
+IMO_PATTERN = re.compile(r"\bimo\s*\d+\b")
+MMSI_PATTERN = re.compile(r"\bmmsi\s*\d+\b")
 VESSEL_KEYWORDS: set[str] = {
     "vessel",
     "ship",
@@ -220,6 +222,9 @@ VESSEL_KEYWORDS: set[str] = {
 }
 
 # Aircraft detection patterns and keywords
+CALLSIGN_PATTERN = re.compile(r"\b[a-z]{2,3}\d{1,4}\b")
+US_TAIL_NUMBER_PATTERN = re.compile(r"\bn\d{1,5}[a-z]{0,2}\b")
+TAIL_NUMBER_PATTERN = re.compile(r"\b[a-z]{1,2}-[a-z0-9]{3,5}\b")
 AIRCRAFT_KEYWORDS: set[str] = {
     "flight",
     "aircraft",
@@ -402,9 +407,9 @@ class SourceRelevanceEngine:
             True if query appears to be about a vessel.
         """
         # Check for IMO or MMSI patterns
-        if re.search(r"\bimo\s*\d+\b", query_lower):
+        if IMO_PATTERN.search(query_lower):
             return True
-        if re.search(r"\bmmsi\s*\d+\b", query_lower):
+        if MMSI_PATTERN.search(query_lower):
             return True
 
         # Check for vessel keywords
@@ -421,16 +426,16 @@ class SourceRelevanceEngine:
         """
         # Check for callsign pattern (e.g., UAL123, BAW456)
         # Airlines use 2-3 letter ICAO codes followed by 1-4 digits
-        if re.search(r"\b[a-z]{2,3}\d{1,4}\b", query_lower):
+        if CALLSIGN_PATTERN.search(query_lower):
             return True
 
         # Check for tail number patterns (e.g., N12345, G-ABCD, VP-ABC)
         # US: N followed by up to 5 alphanumeric characters
         # UK: G-XXXX format
         # Other countries: 1-2 letter prefix, hyphen, 3-5 alphanumeric
-        if re.search(r"\bn\d{1,5}[a-z]{0,2}\b", query_lower):
+        if US_TAIL_NUMBER_PATTERN.search(query_lower):
             return True
-        if re.search(r"\b[a-z]{1,2}-[a-z0-9]{3,5}\b", query_lower):
+        if TAIL_NUMBER_PATTERN.search(query_lower):
             return True
 
         # Check for aircraft keywords
@@ -1,5 +1,6 @@
 """Multi-tier caching system with TTL support for Ignifer."""
 
+import asyncio
 import hashlib
 import json
 import logging
@@ -10,6 +11,9 @@ from typing import Any
 import aiosqlite
 from pydantic import BaseModel, ConfigDict, field_serializer
 
+from ignifer._json import dumps as json_dumps
+from ignifer._json import loads as json_loads
+
 logger = logging.getLogger(__name__)
 
 
@@ -70,11 +74,18 @@ class CacheEntry(BaseModel):
 
 
 class MemoryCache:
-    """L1 in-memory cache with dict-based storage."""
+    """L1 in-memory cache with dict-based storage.
+
+    Attributes:
+        hits: Number of lookups that found an entry.
+        misses: Number of lookups that found nothing.
+    """
 
     def __init__(self) -> None:
         """Initialize empty memory cache."""
         self._cache: dict[str, CacheEntry] = {}
+        self.hits = 0
+        self.misses = 0
 
     async def get(self, key: str) -> CacheEntry | None:
         """Retrieve entry from memory cache.
@@ -87,8 +98,10 @@ class MemoryCache:
         """
         entry = self._cache.get(key)
         if entry is None:
+            self.misses += 1
             logger.debug(f"L1 cache miss: {key}")
             return None
+        self.hits += 1
         logger.debug(f"L1 cache hit: {key}")
         return entry
 
@@ -142,6 +155,8 @@ class MemoryCache:
 class SQLiteCache:
     """L2 SQLite cache with WAL mode for persistence."""
 
+    MAX_KEYS_PER_QUERY = 500
+
     def __init__(self, db_path: str | Path = "~/.cache/ignifer/cache.db") -> None:
         """Initialize SQLite cache with database path.
 
@@ -151,30 +166,40 @@ class SQLiteCache:
         self._db_path = Path(db_path).expanduser()
         self._db_path.parent.mkdir(parents=True, exist_ok=True)
         self._conn: aiosqlite.Connection | None = None
+        self._connect_lock = asyncio.Lock()
 
     async def connect(self) -> None:
-        """Initialize connection and configure SQLite for performance."""
-        self._conn = await aiosqlite.connect(str(self._db_path), timeout=30.0)
-
-        # Enable WAL mode for better concurrency
-        await self._conn.execute("PRAGMA journal_mode=WAL")
-        # Faster sync (less durable but faster)
-        await self._conn.execute("PRAGMA synchronous=NORMAL")
-        # Increase cache size to 64MB
-        await self._conn.execute("PRAGMA cache_size=-64000")
-
-        # Create table if not exists
-        await self._conn.execute("""
-            CREATE TABLE IF NOT EXISTS cache (
-                key TEXT PRIMARY KEY,
-                data TEXT NOT NULL,
-                created_at TEXT NOT NULL,
-                ttl_seconds INTEGER NOT NULL,
-                source TEXT NOT NULL
-            )
-        """)
-        await self._conn.commit()
-        logger.info(f"SQLite cache initialized at {self._db_path}")
+        """Initialize connection and configure SQLite for performance.
+
+        Safe to call concurrently: only the first call opens a connection.
+        """
+        async with self._connect_lock:
+            if self._conn is not None:
+                return
+
+            conn = await aiosqlite.connect(str(self._db_path), timeout=30.0)
+
+            # Enable WAL mode for better concurrency
+            await conn.execute("PRAGMA journal_mode=WAL")
+            # Faster sync (less durable but faster)
+            await conn.execute("PRAGMA synchronous=NORMAL")
+            # Increase cache size to 64MB
+            await conn.execute("PRAGMA cache_size=-64000")
+
+            # Create table if not exists
+            await conn.execute("""
+                CREATE TABLE IF NOT EXISTS cache (
+                    key TEXT PRIMARY KEY,
+                    data TEXT NOT NULL,
+                    created_at TEXT NOT NULL,
+                    ttl_seconds INTEGER NOT NULL,
+                    source TEXT NOT NULL
+                )
+            """)
+            await conn.commit()
+            # Publish only once set up, so no caller sees a half-ready connection
+            self._conn = conn
+            logger.info(f"SQLite cache initialized at {self._db_path}")
 
     async def close(self) -> None:
         """Close SQLite connection."""
@@ -208,12 +233,47 @@ class SQLiteCache:
         logger.debug(f"L2 cache hit: {key}")
         return CacheEntry(
             key=row[0],
-            data=json.loads(row[1]),
+            data=json_loads(row[1]),
             created_at=datetime.fromisoformat(row[2]),
             ttl_seconds=row[3],
             source=row[4],
         )
 
+    async def get_many(self, keys: list[str]) -> dict[str, CacheEntry]:
+        """Retrieve several entries from SQLite cache in one query per chunk.
+
+        Args:
+            keys: Cache keys
+
+        Returns:
+            Mapping of key to CacheEntry for the keys that were found
+        """
+        if not self._conn:
+            await self.connect()
+
+        assert self._conn is not None  # For mypy
+        entries: dict[str, CacheEntry] = {}
+        # Stay under SQLite's limit on bound parameters per statement
+        for start in range(0, len(keys), self.MAX_KEYS_PER_QUERY):
+            chunk = keys[start : start + self.MAX_KEYS_PER_QUERY]
+            placeholders = ", ".join("?" * len(chunk))
+            cursor = await self._conn.execute(
+                "SELECT key, data, created_at, ttl_seconds, source FROM cache "
+                f"WHERE key IN ({placeholders})",
+                chunk,
+            )
+            for row in await cursor.fetchall():
+                entries[row[0]] = CacheEntry(
+                    key=row[0],
+                    data=json_loads(row[1]),
+                    created_at=datetime.fromisoformat(row[2]),
+                    ttl_seconds=row[3],
+                    source=row[4],
+                )
+
+        logger.debug(f"L2 cache get_many: {len(entries)}/{len(keys)} hits")
+        return entries
+
     async def set(self, key: str, entry: CacheEntry) -> None:
         """Store entry in SQLite cache.
 
@@ -230,7 +290,8 @@ class SQLiteCache:
                VALUES (?, ?, ?, ?, ?)""",
             (
                 entry.key,
-                json.dumps(entry.data),
+                # Stored as the encoder's bytes; loads() accepts bytes or str
+                json_dumps(entry.data),
                 entry.created_at.isoformat(),
                 entry.ttl_seconds,
                 entry.source,
@@ -315,6 +376,8 @@ class CacheManager:
         """
         self._l1 = l1 or MemoryCache()
         self._l2 = l2 or SQLiteCache()
+        # L2 writes still running in the background (see set())
+        self._pending_writes: set[asyncio.Task[None]] = set()
 
     async def get(self, key: str, allow_stale: bool = False) -> CacheResult | None:
         """Get from cache, checking L1 then L2.
@@ -336,6 +399,37 @@ class CacheManager:
                 # Promote to L1 for faster subsequent access
                 await self._l1.set(key, entry)
 
+        return self._to_result(key, entry, allow_stale)
+
+    async def mget(self, keys: list[str], allow_stale: bool = False) -> list[CacheResult | None]:
+        """Get several keys, checking L1 then L2 with a single L2 lookup.
+
+        Keys missing from L1 are fetched from L2 together rather than one
+        query per key, which matters when a caller fans out many queries.
+
+        Args:
+            keys: Cache keys
+            allow_stale: If True, return expired entries with is_stale=True
+
+        Returns:
+            One CacheResult or None per key, in the same order as keys
+        """
+        entries = [await self._l1.get(key) for key in keys]
+
+        missing = [key for key, entry in zip(keys, entries) if entry is None]
+        if missing:
+            found = await self._l2.get_many(missing)
+            for i, key in enumerate(keys):
+                if entries[i] is None and key in found:
+                    entries[i] = found[key]
+                    # Promote to L1 for faster subsequent access
+                    await self._l1.set(key, found[key])
+
+        return [self._to_result(key, entry, allow_stale) for key, entry in zip(keys, entries)]
+
+    @staticmethod
+    def _to_result(key: str, entry: CacheEntry | None, allow_stale: bool) -> CacheResult | None:
+        """Wrap a looked-up entry, applying the expiration rules."""
         if entry is None:
             return None
 
@@ -359,6 +453,11 @@ class CacheManager:
     ) -> None:
         """Store in both L1 and L2 caches.
 
+        L1 is updated before this returns, so the entry is immediately
+        visible in-process. The L2 write runs as a background task, keeping
+        the SQLite write and commit off the caller's response path; flush()
+        waits for it.
+
         Args:
             key: Cache key
             data: Data to cache
@@ -373,7 +472,20 @@ class CacheManager:
             source=source,
         )
         await self._l1.set(key, entry)
-        await self._l2.set(key, entry)
+        task = asyncio.create_task(self._l2.set(key, entry))
+        self._pending_writes.add(task)
+        task.add_done_callback(self._l2_write_done)
+
+    def _l2_write_done(self, task: asyncio.Task[None]) -> None:
+        """Forget a finished L2 write and log it if it failed."""
+        self._pending_writes.discard(task)
+        if not task.cancelled() and task.exception() is not None:
+            logger.warning(f"L2 cache write failed: {task.exception()}")
+
+    async def flush(self) -> None:
+        """Wait for background L2 writes to finish."""
+        if self._pending_writes:
+            await asyncio.gather(*self._pending_writes, return_exceptions=True)
 
     async def invalidate(self, key: str) -> bool:
         """Invalidate entry from both tiers.
@@ -384,6 +496,7 @@ class CacheManager:
         Returns:
             True if entry was removed from either tier
         """
+        await self.flush()  # a pending write must not resurrect the entry
         l1_result = await self._l1.invalidate(key)
         l2_result = await self._l2.invalidate(key)
         return l1_result or l2_result
@@ -397,18 +510,30 @@ class CacheManager:
         Returns:
             Number of entries removed (from L2, source of truth)
         """
+        await self.flush()
         l1_count = await self._l1.invalidate_by_source(source)
         l2_count = await self._l2.invalidate_by_source(source)
         return max(l1_count, l2_count)  # L2 is source of truth
 
     async def clear(self) -> None:
         """Clear both cache tiers."""
+        await self.flush()
         await self._l1.clear()
         await self._l2.clear()
 
+    def stats(self) -> dict[str, int]:
+        """Report how well the L1 tier absorbs repeated lookups.
+
+        Returns:
+            L1 hit and miss counts since this manager was created
+        """
+        return {"l1_hits": self._l1.hits, "l1_misses": self._l1.misses}
+
     async def close(self) -> None:
-        """Close L2 connection."""
+        """Finish pending L2 writes, then close the L2 connection."""
+        await self.flush()
         await self._l2.close()
+        logger.debug(f"Cache stats at close: {self.stats()}")
 
 
 __all__ = [
@@ -105,6 +105,9 @@ class Settings(BaseSettings):
     # Rigor mode (Phase 4)
     rigor_mode: bool = False
 
+    # Run the event loop on uvloop when it is installed (speedups extra)
+    use_uvloop: bool = True
+
     @model_validator(mode="before")
     @classmethod
     def load_from_config_file(cls, values: dict[str, Any]) -> dict[str, Any]:
@@ -127,6 +130,7 @@ class Settings(BaseSettings):
             "ttl_wikidata",
             "log_level",
             "rigor_mode",
+            "use_uvloop",
         ]
 
         for key in config_keys:
@@ -219,10 +223,33 @@ def configure_logging(level: str = "INFO") -> None:
     logging.getLogger("httpx").setLevel(logging.WARNING)
 
 
+def event_loop_options(use_uvloop: bool = True) -> dict[str, Any]:
+    """Backend options for anyio.run() that select the event loop.
+
+    uvloop is passed to anyio as a loop factory rather than installed with
+    uvloop.install(), which is deprecated on Python 3.12+ and relies on the
+    event loop policy API deprecated in 3.14.
+
+    Args:
+        use_uvloop: Whether uvloop should be used if it is installed.
+
+    Returns:
+        {"use_uvloop": True} if uvloop is requested and importable, else {}.
+    """
+    if not use_uvloop:
+        return {}
+    try:
+        import uvloop  # noqa: F401
+    except ImportError:
+        return {}
+    return {"use_uvloop": True}
+
+
 __all__ = [
     "Settings",
     "get_settings",
     "reset_settings",
     "configure_logging",
+    "event_loop_options",
     "CONFIG_FILE_PATH",
 ]
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import json
+from bisect import bisect_right
 from datetime import datetime, timezone
 from enum import Enum
 
@@ -86,20 +87,16 @@ class ConfidenceLevel(Enum):
         Returns:
             ConfidenceLevel corresponding to the percentage.
         """
-        if percentage >= 0.95:
-            return cls.ALMOST_CERTAIN
-        elif percentage >= 0.80:
-            return cls.VERY_LIKELY
-        elif percentage >= 0.55:
-            return cls.LIKELY
-        elif percentage >= 0.45:
-            return cls.ROUGHLY_EVEN
-        elif percentage >= 0.20:
-            return cls.UNLIKELY
-        elif percentage >= 0.05:
-            return cls.VERY_UNLIKELY
-        else:
+        # NaN fails every comparison; keep mapping it to REMOTE
+        if not percentage >= 0.0:
             return cls.REMOTE
+        return _LEVELS_BY_THRESHOLD[bisect_right(_PERCENTAGE_THRESHOLDS, percentage)]
+
+
+# Lower bound of each ConfidenceLevel above REMOTE, ascending. from_percentage
+# bisects this table instead of walking an if/elif ladder.
+_PERCENTAGE_THRESHOLDS = (0.05, 0.20, 0.45, 0.55, 0.80, 0.95)
+_LEVELS_BY_THRESHOLD = tuple(ConfidenceLevel)
 
 
 class QualityTier(Enum):
@@ -3,9 +3,10 @@
 from __future__ import annotations
 
 import logging
+from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from enum import Enum
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
 from ignifer.models import OSINTResult, QualityTier, ResultStatus
 from ignifer.source_metadata import (
@@ -66,6 +67,34 @@ SCORE_RELIABILITY_A = 2
 SCORE_RELIABILITY_B = 1
 
 
+def _parse_seendate(date_str: Any) -> datetime | None:
+    """Parse the date part of a GDELT seendate ("20260101T120000Z").
+
+    Slices the fixed-width digits directly instead of going through
+    strptime, which is comparatively slow and runs once per article.
+    Non-string values fail the slice or str methods and return None, so
+    callers need no per-article type check.
+    """
+    try:
+        digits = date_str[:8]
+        if len(digits) != 8 or not (digits.isascii() and digits.isdecimal()):
+            return None
+        return datetime(int(digits[:4]), int(digits[4:6]), int(digits[6:]))
+    except (TypeError, AttributeError, ValueError):
+        return None
+
+
+@dataclass
+class _ArticleScan:
+    """Fields collected from a single pass over a briefing's articles."""
+
+    domains: set[str] = field(default_factory=set)
+    languages: set[str] = field(default_factory=set)  # lowercased
+    countries: set[str] = field(default_factory=set)
+    dates: list[datetime] = field(default_factory=list)
+    missing_domain: bool = False  # any article without a domain
+
+
 class OutputMode(Enum):
     """Output verbosity modes."""
 
@@ -178,8 +207,11 @@ class OutputFormatter:
         lines.append("```")
         lines.append("")
 
+        # One pass over the articles feeds every summary section below
+        scan = self._scan_articles(articles)
+
         # Date range context
-        date_range = self._extract_date_range(articles)
+        date_range = self._extract_date_range(articles, scan)
         if date_range:
             lines.append(f"*Coverage Period: {date_range}*")
             lines.append("")
@@ -191,10 +223,7 @@ class OutputFormatter:
         # Check for multi-region topic
         if detected_region is None and len(articles) > 0:
             # Count distinct nations
-            countries = {
-                a.get("sourcecountry") for a in articles if a.get("sourcecountry")
-            }
-            if len(countries) > 3:
+            if len(scan.countries) > 3:
                 lines.append(
                     "*Multi-region topic detected — using all sources without region prioritization.*"
                 )
@@ -250,7 +279,7 @@ class OutputFormatter:
         # Source Analysis
         lines.append("### SOURCE ANALYSIS")
         lines.append("")
-        source_diversity = self._analyze_source_diversity(articles)
+        source_diversity = self._analyze_source_diversity(articles, scan)
         lines.append("```")
         lines.append(DIVIDER_SECONDARY)
         lines.append(f"{'SOURCE CORRELATION MATRIX':^55}")
@@ -266,7 +295,7 @@ class OutputFormatter:
         # Information Gaps
         lines.append("### INFORMATION GAPS")
         lines.append("")
-        gaps = self._identify_info_gaps(articles, query)
+        gaps = self._identify_info_gaps(articles, query, scan)
         for gap in gaps:
             lines.append(f"► {gap}")
         lines.append("")
@@ -487,17 +516,37 @@ class OutputFormatter:
         else:
             return CONF_LOW
 
-    def _extract_date_range(self, articles: list[dict]) -> str | None:
-        """Extract date range from articles if date information available."""
-        dates = []
+    def _scan_articles(self, articles: list[dict[str, Any]]) -> _ArticleScan:
+        """Collect domains, languages, countries and dates in one pass.
+
+        The briefing sections all summarize the same few article fields, so
+        they share one scan instead of each walking the article list.
+        """
+        scan = _ArticleScan()
         for article in articles:
+            domain = article.get("domain")
+            if domain:
+                scan.domains.add(domain)
+            else:
+                scan.missing_domain = True
+            language = article.get("language")
+            if language:
+                scan.languages.add(language.lower())
+            country = article.get("sourcecountry")
+            if country:
+                scan.countries.add(country)
             date_str = article.get("seendate")
             if date_str:
-                try:
-                    dt = datetime.strptime(date_str[:8], "%Y%m%d")
-                    dates.append(dt)
-                except (ValueError, TypeError):
-                    continue
+                seen = _parse_seendate(date_str)
+                if seen is not None:
+                    scan.dates.append(seen)
+        return scan
+
+    def _extract_date_range(
+        self, articles: list[dict[str, Any]], scan: _ArticleScan | None = None
+    ) -> str | None:
+        """Extract date range from articles if date information available."""
+        dates = (scan or self._scan_articles(articles)).dates
 
         if not dates:
             return None
@@ -515,16 +564,15 @@ class OutputFormatter:
         date_str = article.get("seendate")
         if not date_str:
             return None
-        try:
-            dt = datetime.strptime(date_str[:8], "%Y%m%d")
-            return dt.strftime("%d %b %Y")
-        except (ValueError, TypeError):
-            return None
+        dt = _parse_seendate(date_str)
+        return dt.strftime("%d %b %Y") if dt else None
 
-    def _analyze_source_diversity(self, articles: list[dict]) -> dict:
+    def _analyze_source_diversity(
+        self, articles: list[dict[str, Any]], scan: _ArticleScan | None = None
+    ) -> dict:
         """Analyze diversity of sources for correlation matrix."""
-        domains = {a.get("domain", "") for a in articles if a.get("domain")}
-        languages = {a.get("language", "").lower() for a in articles if a.get("language")}
+        scan = scan or self._scan_articles(articles)
+        domains, languages, dates = scan.domains, scan.languages, scan.dates
 
         # Geographic assessment based on domain TLDs and known sources
         geo_indicators = set()
@@ -547,16 +595,6 @@ class OutputFormatter:
                 geo_indicators.add("US/Intl")
 
         # Temporal assessment
-        dates = []
-        for article in articles:
-            date_str = article.get("seendate")
-            if date_str:
-                try:
-                    dt = datetime.strptime(date_str[:8], "%Y%m%d")
-                    dates.append(dt)
-                except (ValueError, TypeError):
-                    continue
-
         if dates:
             date_range = (max(dates) - min(dates)).days
             if date_range == 0:
@@ -741,14 +779,18 @@ class OutputFormatter:
         else:
             return CONF_LOW
 
-    def _identify_info_gaps(self, articles: list[dict], query: str) -> list[str]:
+    def _identify_info_gaps(
+        self, articles: list[dict[str, Any]], query: str, scan: _ArticleScan | None = None
+    ) -> list[str]:
         """Identify potential information gaps based on article analysis."""
         gaps = []
 
-        domains = {a.get("domain", "") for a in articles}
-        languages = {a.get("language", "").lower() for a in articles if a.get("language")}
+        scan = scan or self._scan_articles(articles)
+        languages, dates = scan.languages, scan.dates
+        # Articles without a domain count as one more (unknown) source
+        domain_count = len(scan.domains) + scan.missing_domain
 
-        if len(domains) < 5:
+        if domain_count < 5:
             gaps.append("Limited source diversity — assess for single-narrative bias")
 
         # GDELT searches 65 languages; flag if results are monolingual
@@ -760,16 +802,6 @@ class OutputFormatter:
             gaps.append("Low source volume — confidence limited by sparse reporting")
 
         # Check for recency
-        dates = []
-        for article in articles:
-            date_str = article.get("seendate")
-            if date_str:
-                try:
-                    dt = datetime.strptime(date_str[:8], "%Y%m%d")
-                    dates.append(dt)
-                except (ValueError, TypeError):
-                    continue
-
         if dates:
             newest = max(dates)
             age = (datetime.now() - newest).days
@@ -114,10 +114,10 @@ def format_source_attribution(
 
     for source in sources:
         # Use SOURCE_DISPLAY_NAMES dict directly (public API) instead of private method
-        source_key = source.source_name.lower()
-        display_name = SOURCE_DISPLAY_NAMES.get(
-            source_key, source.source_name.replace("_", " ").title()
-        )
+        # Only build the title-cased fallback for sources missing from the table
+        display_name = SOURCE_DISPLAY_NAMES.get(source.source_name.lower())
+        if display_name is None:
+            display_name = source.source_name.replace("_", " ").title()
         timestamp = source.retrieved_at.strftime("%Y-%m-%dT%H:%M:%S+00:00")
         freshness = get_data_freshness(source.retrieved_at)
         freshness_label = get_freshness_label(freshness)
@@ -6,6 +6,7 @@ import logging
 from datetime import datetime, timezone
 from typing import Any
 
+import anyio
 import httpx
 import trafilatura
 from fastmcp import FastMCP
@@ -20,6 +21,7 @@ from ignifer.adapters import (
     OSINTAdapter,
     WikidataAdapter,
     WorldBankAdapter,
+    close_transport,
 )
 from ignifer.aggregation import EntityResolver
 from ignifer.aggregation.correlator import (
@@ -38,8 +40,8 @@ from ignifer.confidence import (
     ConfidenceCalculator,
     confidence_to_language,
 )
-from ignifer.config import configure_logging, get_settings
-from ignifer.models import QualityTier, QueryParams, ResultStatus, SourceMetadata
+from ignifer.config import configure_logging, event_loop_options, get_settings
+from ignifer.models import OSINTResult, QualityTier, QueryParams, ResultStatus, SourceMetadata
 from ignifer.output import OutputFormatter
 from ignifer.source_metadata import (
     InvalidReliabilityGradeError,
@@ -63,6 +65,9 @@ logger = logging.getLogger(__name__)
 MAX_AUTO_EXTRACTS = 4  # Number of articles to auto-extract
 EXTRACT_TIMEOUT = 12.0  # Timeout per article extraction
 
+# Economic context settings
+WORLDBANK_MAX_CONCURRENCY = 4  # World Bank queries in flight per economic_context call
+
 # Initialize FastMCP server
 mcp = FastMCP("ignifer")
 
@@ -198,6 +203,9 @@ async def _cleanup_resources() -> None:
             await adapter.close()
             globals()[name] = None
 
+    # Close the connection pool shared by the adapters' HTTP clients
+    await close_transport()
+
     # Close source metadata manager
     if _source_metadata is not None:
         await _source_metadata.close()
@@ -1163,21 +1171,28 @@ async def economic_context(
         all_results: dict[str, dict[str, Any]] = {}
         rate_limited = False
 
-        # Query each indicator
-        for label, query_term, _, _ in all_indicator_defs:
-            params = QueryParams(query=f"{query_term} {country}")
-            result = await adapter.query(params)
+        # Query indicators concurrently, a few at a time so the fan-out does not
+        # burst every request at the World Bank API at once
+        semaphore = asyncio.Semaphore(WORLDBANK_MAX_CONCURRENCY)
 
-            if result.status == ResultStatus.RATE_LIMITED:
-                rate_limited = True
-                break
+        async def bounded_query(query_term: str) -> OSINTResult:
+            async with semaphore:
+                return await adapter.query(QueryParams(query=f"{query_term} {country}"))
 
-            if result.status == ResultStatus.SUCCESS and result.results:
-                sorted_results = sorted(
-                    result.results, key=lambda x: str(x.get("year", "")), reverse=True
-                )
-                if sorted_results:
-                    all_results[label] = sorted_results[0]
+        tasks = [
+            asyncio.create_task(bounded_query(query_term))
+            for _, query_term, _, _ in all_indicator_defs
+        ]
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                if (await next_done).status == ResultStatus.RATE_LIMITED:
+                    # Stop spending requests once the API pushes back
+                    rate_limited = True
+                    break
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
 
         # If rate limited, inform the user
         if rate_limited:
@@ -1191,6 +1206,16 @@ async def economic_context(
                 "- Results may be cached - try your last query again"
             )
 
+        for (label, _, _, _), task in zip(all_indicator_defs, tasks):
+            result = task.result()
+
+            if result.status == ResultStatus.SUCCESS and result.results:
+                sorted_results = sorted(
+                    result.results, key=lambda x: str(x.get("year", "")), reverse=True
+                )
+                if sorted_results:
+                    all_results[label] = sorted_results[0]
+
         # If no results at all, country not found
         if not all_results:
             logger.warning(f"No economic data found for: {country}")
@@ -2085,6 +2110,37 @@ def _format_credentials_error() -> str:
     )
 
 
+async def _fetch_flight_track(opensky: OpenSkyAdapter, icao24: str) -> list[dict[str, Any]]:
+    """Fetch track waypoints for an aircraft, treating failures as no track.
+
+    Args:
+        opensky: OpenSky adapter instance.
+        icao24: ICAO24 transponder address.
+
+    Returns:
+        List of track waypoints, or an empty list if unavailable.
+    """
+    try:
+        track_result = await opensky.get_track(icao24)
+
+        if track_result.status == ResultStatus.SUCCESS and track_result.results:
+            return track_result.results
+
+    except AdapterAuthError:
+        # Track history requires auth - continue without it
+        logger.debug("Track history unavailable (requires authentication)")
+
+    except AdapterTimeoutError:
+        # Timeout getting track - continue with state only
+        logger.warning("Timeout getting track history")
+
+    except AdapterError as e:
+        # Other error - log and continue
+        logger.warning(f"Error getting track history: {e}")
+
+    return []
+
+
 @mcp.tool()
 async def track_flight(
     identifier: str,
@@ -2143,14 +2199,24 @@ async def track_flight(
         track_waypoints: list[dict[str, Any]] = []
 
         if identifier_type == "icao24":
-            # Direct ICAO24 lookup
-            state_result = await opensky.get_states(icao24=normalized)
+            # Direct ICAO24 lookup - state and track share the key, so fetch both at once
+            track_task = asyncio.create_task(_fetch_flight_track(opensky, normalized))
+            try:
+                state_result = await opensky.get_states(icao24=normalized)
+            except BaseException:
+                track_task.cancel()
+                await asyncio.gather(track_task, return_exceptions=True)
+                raise
 
             if state_result.status == ResultStatus.SUCCESS and state_result.results:
                 state = state_result.results[0]
-                icao24_for_track = normalized
+                track_waypoints = await track_task
+            else:
+                # Only report a track alongside a current state
+                track_task.cancel()
+                await asyncio.gather(track_task, return_exceptions=True)
 
-            elif state_result.status == ResultStatus.RATE_LIMITED:
+            if state_result.status == ResultStatus.RATE_LIMITED:
                 return (
                     "## Rate Limited\n\n"
                     "OpenSky Network is rate limiting requests.\n\n"
@@ -2203,25 +2269,9 @@ async def track_flight(
                     f"try '{callsign_suggestion}'"
                 )
 
-        # Get track history if we have an ICAO24
+        # Get track history once a callsign/tail number has resolved to an ICAO24
         if icao24_for_track:
-            try:
-                track_result = await opensky.get_track(icao24_for_track)
-
-                if track_result.status == ResultStatus.SUCCESS and track_result.results:
-                    track_waypoints = track_result.results
-
-            except AdapterAuthError:
-                # Track history requires auth - continue without it
-                logger.debug("Track history unavailable (requires authentication)")
-
-            except AdapterTimeoutError:
-                # Timeout getting track - continue with state only
-                logger.warning("Timeout getting track history")
-
-            except AdapterError as e:
-                # Other error - log and continue
-                logger.warning(f"Error getting track history: {e}")
+            track_waypoints = await _fetch_flight_track(opensky, icao24_for_track)
 
         # Format output
         return _format_flight_output(
@@ -2338,8 +2388,8 @@ def _identify_vessel_identifier(identifier: str) -> tuple[str, str]:
     # Normalize: strip whitespace
     normalized = identifier.strip()
 
-    # Check for MMSI: exactly 9 digits
-    if normalized.isdigit() and len(normalized) == 9:
+    # Check for MMSI: exactly 9 ASCII digits (isdigit() alone admits e.g. '³')
+    if len(normalized) == 9 and normalized.isascii() and normalized.isdigit():
         return ("mmsi", normalized)
 
     # Check for IMO number: "IMO" followed by 7 digits
@@ -2348,7 +2398,7 @@ def _identify_vessel_identifier(identifier: str) -> tuple[str, str]:
     if upper.startswith("IMO"):
         # Extract digits after "IMO"
         rest = upper[3:].strip()
-        if rest.isdigit() and len(rest) == 7:
+        if len(rest) == 7 and rest.isascii() and rest.isdigit():
             return ("imo", rest)
 
     # Default to vessel name
@@ -3594,8 +3644,12 @@ def main() -> None:
     """Run the Ignifer MCP server."""
     settings = get_settings()
     configure_logging(settings.log_level)
+    backend_options = event_loop_options(settings.use_uvloop)
+    if backend_options:
+        logger.debug("Using uvloop event loop")
     logger.info("Starting Ignifer MCP server")
-    mcp.run()
+    # Same as mcp.run(), but lets anyio build the loop from uvloop's factory
+    anyio.run(mcp.run_async, backend_options=backend_options)
 
 
 if __name__ == "__main__":
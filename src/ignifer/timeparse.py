@@ -1,21 +1,14 @@
 """Time range parser for GDELT API parameters."""
 
 import re
+import time
 from dataclasses import dataclass
-from datetime import datetime, timedelta, timezone
+from datetime import date, datetime, timedelta, timezone
+from functools import lru_cache
 
-# Regex patterns for natural language time ranges
-LAST_N_PATTERN = re.compile(
-    r"last\s+(\d+)\s+(hour|hours|day|days|week|weeks|month|months)",
-    re.IGNORECASE
-)
-N_UNIT_PATTERN = re.compile(
-    r"^(\d+)\s+(hour|hours|day|days|week|weeks|month|months)$",
-    re.IGNORECASE
-)
+# Regex pattern for ISO date ranges (matched against lowercased input)
 DATE_RANGE_PATTERN = re.compile(
-    r"(\d{4}-\d{2}-\d{2})\s+to\s+(\d{4}-\d{2}-\d{2})",
-    re.IGNORECASE
+    r"(\d{4}-\d{2}-\d{2})\s+to\s+(\d{4}-\d{2}-\d{2})"
 )
 
 # Unit to GDELT timespan suffix mapping
@@ -27,7 +20,7 @@ UNIT_SUFFIX_MAP = {
 }
 
 
-@dataclass
+@dataclass(frozen=True)
 class TimeRangeResult:
     """Result of parsing a time range string."""
 
@@ -75,36 +68,73 @@ def parse_time_range(time_range: str) -> TimeRangeResult:
         TimeRangeResult with either gdelt_timespan or datetime params.
     """
     time_range = time_range.strip()
+
+    # Handle "last week" -> use absolute dates (7-14 days ago)
+    if time_range.lower() == "last week":
+        return _last_week_range(int(time.time()))
+
+    return _parse_fixed_time_range(time_range)
+
+
+@lru_cache(maxsize=1)
+def _last_week_range(epoch_second: int) -> TimeRangeResult:
+    """Build the "last week" window (7-14 days ago) for the given second.
+
+    The window has one-second resolution, so calls within the same second
+    reuse the previous result instead of redoing the datetime math and
+    strftime formatting.
+
+    Args:
+        epoch_second: Current Unix time, truncated to whole seconds.
+
+    Returns:
+        TimeRangeResult with start and end datetimes.
+    """
+    now = datetime.fromtimestamp(epoch_second, timezone.utc)
+    start = now - timedelta(days=14)
+    end = now - timedelta(days=7)
+    return TimeRangeResult(
+        start_datetime=start.strftime("%Y%m%d%H%M%S"),
+        end_datetime=end.strftime("%Y%m%d%H%M%S")
+    )
+
+
+@lru_cache(maxsize=256)
+def _parse_fixed_time_range(time_range: str) -> TimeRangeResult:
+    """Parse time range forms whose result does not depend on the current time.
+
+    Memoized: the same handful of strings ("last 7 days", "this week", ...)
+    arrive on most queries, and the results are immutable.
+
+    Args:
+        time_range: Stripped time range string (any case).
+
+    Returns:
+        TimeRangeResult with either gdelt_timespan or datetime params.
+    """
     time_range_lower = time_range.lower()
 
     # Handle "this week" -> last 7 days
     if time_range_lower == "this week":
         return TimeRangeResult(gdelt_timespan="7d")
 
-    # Handle "last week" -> use absolute dates (7-14 days ago)
-    if time_range_lower == "last week":
-        now = datetime.now(timezone.utc)
-        start = now - timedelta(days=14)
-        end = now - timedelta(days=7)
-        return TimeRangeResult(
-            start_datetime=start.strftime("%Y%m%d%H%M%S"),
-            end_datetime=end.strftime("%Y%m%d%H%M%S")
-        )
-
-    # Handle "last N hours/days/weeks/months" or "N hours/days/weeks/months"
-    for pattern in (LAST_N_PATTERN, N_UNIT_PATTERN):
-        match = pattern.match(time_range)
-        if match:
-            return _unit_to_timespan(int(match.group(1)), match.group(2))
+    # Handle "last N hours/days/weeks/months" or "N hours/days/weeks/months".
+    # The grammar is two or three words, so split on whitespace rather than
+    # running a regex; anything after "last N unit" is ignored.
+    tokens = time_range_lower.split()
+    if tokens and tokens[0] == "last":
+        tokens = tokens[1:3]
+    if len(tokens) == 2 and tokens[0].isdecimal() and tokens[1] in UNIT_SUFFIX_MAP:
+        return _unit_to_timespan(int(tokens[0]), tokens[1])
 
     # Handle ISO date range "YYYY-MM-DD to YYYY-MM-DD"
-    match = DATE_RANGE_PATTERN.match(time_range)
+    match = DATE_RANGE_PATTERN.match(time_range_lower)
     if match:
         start_str, end_str = match.group(1), match.group(2)
 
         try:
-            start_date = datetime.strptime(start_str, "%Y-%m-%d").replace(tzinfo=timezone.utc)
-            end_date = datetime.strptime(end_str, "%Y-%m-%d").replace(tzinfo=timezone.utc)
+            start_date = date.fromisoformat(start_str)
+            end_date = date.fromisoformat(end_str)
 
             # Validate start < end
             if start_date >= end_date:
@@ -112,9 +142,10 @@ def parse_time_range(time_range: str) -> TimeRangeResult:
                     error=f"Start date must be before end date: {start_str} >= {end_str}"
                 )
 
+            # Midnight UTC on each date, e.g. "2026-01-01" -> "20260101000000"
             return TimeRangeResult(
-                start_datetime=start_date.strftime("%Y%m%d%H%M%S"),
-                end_datetime=end_date.strftime("%Y%m%d%H%M%S")
+                start_datetime=f"{start_str.replace('-', '')}000000",
+                end_datetime=f"{end_str.replace('-', '')}000000"
             )
         except ValueError as e:
             return TimeRangeResult(error=f"Invalid date format: {e}")
@@ -9,7 +9,12 @@ from unittest.mock import patch
 import pytest
 
 from ignifer.adapters.aisstream import AISStreamAdapter
-from ignifer.adapters.base import AdapterAuthError, AdapterParseError, AdapterTimeoutError
+from ignifer.adapters.base import (
+    AdapterAuthError,
+    AdapterError,
+    AdapterParseError,
+    AdapterTimeoutError,
+)
 from ignifer.config import reset_settings
 from ignifer.models import QualityTier, QueryParams, ResultStatus
 
@@ -59,12 +64,11 @@ class MockWebSocket:
 
     def __init__(
         self,
-        messages: list[dict[str, Any]] | None = None,
+        messages: list[dict[str, Any] | str] | None = None,
         error_on_connect: Exception | None = None,
         error_on_send: Exception | None = None,
         error_on_recv: Exception | None = None,
         recv_timeout: bool = False,
-        recv_raises_timeout_when_empty: bool = False,
     ):
         self.messages = messages or []
         self.message_index = 0
@@ -72,40 +76,49 @@ class MockWebSocket:
         self.error_on_send = error_on_send
         self.error_on_recv = error_on_recv
         self.recv_timeout = recv_timeout
-        self.recv_raises_timeout_when_empty = recv_raises_timeout_when_empty
-        self.sent_messages: list[str] = []
+        self.recv_decode: list[bool | None] = []
+        self.sent_messages: list[str | bytes] = []
+        self.sent_as_text: list[bool | None] = []
         self.closed = False
 
-    async def send(self, message: str) -> None:
+    async def send(self, message: str | bytes, text: bool | None = None) -> None:
         if self.error_on_send:
             raise self.error_on_send
         self.sent_messages.append(message)
+        self.sent_as_text.append(text)
 
-    async def recv(self) -> str:
+    async def recv(self, decode: bool | None = None) -> str | bytes:
+        self.recv_decode.append(decode)
         if self.error_on_recv:
             raise self.error_on_recv
         if self.recv_timeout:
             await asyncio.sleep(10)  # Will trigger timeout
-        if self.message_index < len(self.messages):
-            msg = self.messages[self.message_index]
-            self.message_index += 1
-            return json.dumps(msg)
-        # No more messages
-        if self.recv_raises_timeout_when_empty:
-            # Simulate inner wait_for timeout (adapter catches this and continues loop)
-            raise asyncio.TimeoutError()
-        # Default: wait forever (will trigger outer timeout)
-        await asyncio.sleep(100)
-        return ""
+        # Wait until a message is available; tests may append more later.
+        # With none, this waits until the adapter's timeout cancels it.
+        while self.message_index >= len(self.messages):
+            await asyncio.sleep(0.01)
+        msg = self.messages[self.message_index]
+        self.message_index += 1
+        # Strings are sent as-is so tests can feed malformed frames
+        frame = msg if isinstance(msg, str) else json.dumps(msg)
+        return frame.encode() if decode is False else frame
 
     async def close(self) -> None:
         self.closed = True
 
-    async def __aenter__(self) -> "MockWebSocket":
+    async def _connect(self) -> "MockWebSocket":
         if self.error_on_connect:
             raise self.error_on_connect
         return self
 
+    def __await__(self) -> Any:
+        # ws = await websockets.connect(...)
+        return self._connect().__await__()
+
+    async def __aenter__(self) -> "MockWebSocket":
+        # async with websockets.connect(...) as ws
+        return await self._connect()
+
     async def __aexit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None:
         self.closed = True
 
@@ -183,6 +196,11 @@ class TestAISStreamAdapter:
         assert result.status == ResultStatus.NO_DATA
         assert "Invalid MMSI format" in result.error  # type: ignore[operator]
 
+        # Non-ASCII digits (str.isdigit() accepts these)
+        result = await adapter.query(QueryParams(query="12345678³"))
+        assert result.status == ResultStatus.NO_DATA
+        assert "Invalid MMSI format" in result.error  # type: ignore[operator]
+
         await adapter.close()
 
     @pytest.mark.asyncio
@@ -224,6 +242,31 @@ class TestAISStreamAdapter:
 
             await adapter.close()
 
+    @pytest.mark.asyncio
+    async def test_websocket_non_auth_status_is_retried(
+        self, mock_aisstream_credentials
+    ) -> None:
+        """Test non-401 handshake rejections are retried rather than auth failures."""
+        from unittest.mock import MagicMock
+
+        from websockets.exceptions import InvalidStatus
+
+        error = InvalidStatus(MagicMock(status_code=503))
+        mock_ws = MockWebSocket(error_on_connect=error)
+
+        with patch(
+            "ignifer.adapters.aisstream.websockets.connect", return_value=mock_ws
+        ) as mock_connect:
+            adapter = AISStreamAdapter()
+            adapter.INITIAL_BACKOFF = 0.0
+
+            with pytest.raises(AdapterTimeoutError):
+                await adapter.get_vessel_position("123456789")
+
+            assert mock_connect.call_count == AISStreamAdapter.MAX_RETRIES
+
+            await adapter.close()
+
     @pytest.mark.asyncio
     async def test_websocket_error_message(
         self, mock_aisstream_credentials
@@ -314,7 +357,7 @@ class TestAISStreamAdapter:
         """Test that slow data reception returns NO_DATA (not timeout error)."""
         # Create mock that has very slow recv - simulates vessel not broadcasting
         # With DATA_TIMEOUT exceeded, should return empty positions (NO_DATA)
-        mock_ws = MockWebSocket(messages=[], recv_raises_timeout_when_empty=True)
+        mock_ws = MockWebSocket(messages=[])
 
         with patch(
             "ignifer.adapters.aisstream.websockets.connect",
@@ -332,14 +375,34 @@ class TestAISStreamAdapter:
 
             await adapter.close()
 
+    @pytest.mark.asyncio
+    async def test_receive_loop_does_not_wrap_each_recv(
+        self, mock_aisstream_credentials, position_message
+    ) -> None:
+        """Frames are read under one receive deadline, not a wait_for per recv."""
+        other_msg = {"MessageType": "StaticDataReport", "Message": {}}
+        mock_ws = MockWebSocket(messages=[other_msg, other_msg, position_message])
+
+        with (
+            patch("ignifer.adapters.aisstream.websockets.connect", return_value=mock_ws),
+            patch("ignifer.adapters.aisstream.asyncio.wait_for") as wait_for,
+        ):
+            adapter = AISStreamAdapter()
+            result = await adapter.get_vessel_position("123456789")
+
+            assert result.status == ResultStatus.SUCCESS
+            wait_for.assert_not_called()
+
+            await adapter.close()
+
     @pytest.mark.asyncio
     async def test_no_position_data_returns_no_data(
         self, mock_aisstream_credentials
     ) -> None:
         """Test that no position messages returns NO_DATA status."""
-        # Empty message list - recv will raise TimeoutError repeatedly
-        # until the outer loop time expires, then return empty positions
-        mock_ws = MockWebSocket(messages=[], recv_raises_timeout_when_empty=True)
+        # Empty message list - recv blocks until the receive deadline
+        # expires, then empty positions are returned
+        mock_ws = MockWebSocket(messages=[])
 
         with patch("ignifer.adapters.aisstream.websockets.connect", return_value=mock_ws):
             adapter = AISStreamAdapter()
@@ -431,6 +494,57 @@ class TestAISStreamAdapter:
             assert "BoundingBoxes" in sent
             assert "FiltersShipMMSI" in sent
             assert sent["FiltersShipMMSI"] == ["123456789"]
+            assert sent["FilterMessageTypes"] == ["PositionReport"]
+
+            # Sent pre-encoded, but framed as text
+            assert isinstance(mock_ws.sent_messages[0], bytes)
+            assert mock_ws.sent_as_text == [True]
+
+            await adapter.close()
+
+    def test_subscribe_bytes_memoized_per_mmsi(self, mock_aisstream_credentials) -> None:
+        """Test that repeat MMSI subscriptions reuse the encoded frame."""
+        adapter = AISStreamAdapter()
+
+        first = adapter._build_subscribe_bytes(mmsi_list=["123456789"])
+        second = adapter._build_subscribe_bytes(mmsi_list=["123456789"])
+        other = adapter._build_subscribe_bytes(mmsi_list=["987654321"])
+
+        assert first is second
+        assert json.loads(other)["FiltersShipMMSI"] == ["987654321"]
+        assert json.loads(first) == adapter._build_subscribe_message(mmsi_list=["123456789"])
+
+    def test_subscribe_bytes_follow_rotated_api_key(
+        self, mock_aisstream_credentials, monkeypatch
+    ) -> None:
+        """Test that a new API key is not served a frame cached for the old one."""
+        adapter = AISStreamAdapter()
+        adapter._build_subscribe_bytes(mmsi_list=["123456789"])
+
+        monkeypatch.setenv("IGNIFER_AISSTREAM_KEY", "rotated_key")
+        reset_settings()
+
+        sent = json.loads(adapter._build_subscribe_bytes(mmsi_list=["123456789"]))
+        assert sent["APIKey"] == "rotated_key"
+
+    @pytest.mark.asyncio
+    async def test_connection_disables_compression(
+        self, mock_aisstream_credentials, position_message
+    ) -> None:
+        """Test that connections skip permessage-deflate and cap frame size."""
+        mock_ws = MockWebSocket(messages=[position_message])
+
+        with patch(
+            "ignifer.adapters.aisstream.websockets.connect", return_value=mock_ws
+        ) as mock_connect:
+            adapter = AISStreamAdapter()
+            await adapter.get_vessel_position("123456789")
+            await adapter.health_check()
+
+            assert mock_connect.call_count == 2
+            for call in mock_connect.call_args_list:
+                assert call.kwargs["compression"] is None
+                assert call.kwargs["max_size"] == AISStreamAdapter.MAX_FRAME_SIZE
 
             await adapter.close()
 
@@ -466,6 +580,19 @@ class TestAISStreamAdapter:
 
             await adapter.close()
 
+    def test_parse_position_message_missing_sections(self) -> None:
+        """Test that a position report without its sections parses to empty fields."""
+        adapter = AISStreamAdapter()
+
+        pos = adapter._parse_position_message(
+            {"MessageType": "PositionReport", "Message": None}
+        )
+
+        assert pos is not None
+        assert pos["mmsi"] == ""
+        assert pos["latitude"] is None
+        assert pos["destination"] is None
+
     @pytest.mark.asyncio
     async def test_non_position_messages_ignored(
         self, mock_aisstream_credentials, position_message
@@ -485,27 +612,137 @@ class TestAISStreamAdapter:
             await adapter.close()
 
     @pytest.mark.asyncio
-    async def test_invalid_json_raises_parse_error(
-        self, mock_aisstream_credentials
+    async def test_invalid_json_frame_skipped(
+        self, mock_aisstream_credentials, position_message
+    ) -> None:
+        """Test that malformed frames are skipped without dropping the connection."""
+        mock_ws = MockWebSocket(messages=["not valid json {", "[]", position_message])
+
+        with patch(
+            "ignifer.adapters.aisstream.websockets.connect", return_value=mock_ws
+        ) as mock_connect:
+            adapter = AISStreamAdapter()
+            result = await adapter.get_vessel_position("123456789")
+
+            assert result.status == ResultStatus.SUCCESS
+            assert result.results[0]["vessel_name"] == "EVER GIVEN"
+            assert mock_connect.call_count == 1
+            assert not mock_ws.closed
+
+            await adapter.close()
+
+    @pytest.mark.asyncio
+    async def test_error_message_keeps_connection(
+        self, mock_aisstream_credentials, position_message
+    ) -> None:
+        """Test that an error frame fails current lookups but keeps the connection."""
+        error_msg = {"MessageType": "Error", "Message": "Rate limit exceeded"}
+        mock_ws = MockWebSocket(messages=[error_msg])
+
+        with patch(
+            "ignifer.adapters.aisstream.websockets.connect", return_value=mock_ws
+        ) as mock_connect:
+            adapter = AISStreamAdapter()
+
+            with pytest.raises(AdapterParseError):
+                await adapter.get_vessel_position("123456789")
+
+            mock_ws.messages.append(position_message)
+            result = await adapter.get_vessel_position("123456789")
+
+            assert result.status == ResultStatus.SUCCESS
+            assert mock_connect.call_count == 1
+            assert not mock_ws.closed
+
+            await adapter.close()
+
+    @pytest.mark.asyncio
+    async def test_connection_error_with_failing_close(
+        self, mock_aisstream_credentials, position_message
     ) -> None:
-        """Test that invalid JSON response raises AdapterParseError."""
+        """Test that an error while closing a dead connection does not escape the reader."""
+        from websockets.exceptions import ConnectionClosedError
+
+        dead_ws = MockWebSocket(error_on_recv=ConnectionClosedError(None, None))
+
+        async def failing_close() -> None:
+            raise OSError("socket already closed")
+
+        dead_ws.close = failing_close  # type: ignore[method-assign]
+        live_ws = MockWebSocket(messages=[position_message])
+
+        with patch(
+            "ignifer.adapters.aisstream.websockets.connect",
+            side_effect=[dead_ws, live_ws],
+        ), patch.object(AISStreamAdapter, "INITIAL_BACKOFF", 0.01):
+            adapter = AISStreamAdapter()
+            result = await adapter.get_vessel_position("123456789")
+
+            assert result.status == ResultStatus.SUCCESS
+
+            await adapter.close()
+
+    @pytest.mark.asyncio
+    async def test_close_fails_pending_lookups(self, mock_aisstream_credentials) -> None:
+        """Test that close() ends lookups still waiting on the connection."""
         mock_ws = MockWebSocket(messages=[])
-        mock_ws.messages = ["not valid json"]  # type: ignore[list-item]
 
-        # Override recv to return raw string
-        async def bad_recv() -> str:
-            return "not valid json {"
+        with patch("ignifer.adapters.aisstream.websockets.connect", return_value=mock_ws):
+            adapter = AISStreamAdapter()
+            lookup = asyncio.create_task(adapter.get_vessel_position("123456789"))
+            # Let the lookup subscribe and start waiting for a position
+            while not mock_ws.sent_messages:
+                await asyncio.sleep(0.01)
+
+            await adapter.close()
+
+            with pytest.raises(AdapterError):
+                await asyncio.wait_for(lookup, timeout=1)
+            assert mock_ws.closed
 
-        mock_ws.recv = bad_recv  # type: ignore[method-assign]
+    @pytest.mark.asyncio
+    async def test_binary_frames_parsed(
+        self, mock_aisstream_credentials, position_message
+    ) -> None:
+        """Test that frames are received as bytes, skipping the str decode."""
+        mock_ws = MockWebSocket(messages=[position_message])
 
         with patch("ignifer.adapters.aisstream.websockets.connect", return_value=mock_ws):
             adapter = AISStreamAdapter()
+            result = await adapter.get_vessel_position("123456789")
 
-            with pytest.raises(AdapterParseError) as exc_info:
-                await adapter.get_vessel_position("123456789")
+            assert result.status == ResultStatus.SUCCESS
+            assert result.results[0]["mmsi"] == "123456789"
+            assert mock_ws.recv_decode and set(mock_ws.recv_decode) == {False}
 
-            assert exc_info.value.source_name == "aisstream"
-            assert "Invalid JSON" in str(exc_info.value)
+            await adapter.close()
+
+    @pytest.mark.asyncio
+    async def test_clean_close_reconnects(
+        self, mock_aisstream_credentials, position_message
+    ) -> None:
+        """Test that a normal server close mid-lookup reconnects and keeps waiting."""
+        from websockets.exceptions import ConnectionClosedOK
+        from websockets.frames import Close
+
+        closing_ws = MockWebSocket(
+            error_on_recv=ConnectionClosedOK(
+                Close(1000, ""), Close(1000, ""), rcvd_then_sent=True
+            )
+        )
+        connections = [closing_ws, MockWebSocket(messages=[position_message])]
+
+        with patch(
+            "ignifer.adapters.aisstream.websockets.connect", side_effect=connections
+        ) as mock_connect:
+            adapter = AISStreamAdapter()
+            adapter.INITIAL_BACKOFF = 0.0
+
+            result = await adapter.get_vessel_position("123456789")
+
+            assert result.status == ResultStatus.SUCCESS
+            assert mock_connect.call_count == 2
+            assert closing_ws.closed
 
             await adapter.close()
 
@@ -558,6 +795,115 @@ class TestAISStreamAdapter:
         # close() should not raise, even without any connections
         await adapter.close()
 
+    @pytest.mark.asyncio
+    async def test_connection_reused_across_queries(
+        self, mock_aisstream_credentials, position_message
+    ) -> None:
+        """Test that consecutive lookups share one WebSocket connection."""
+        other_vessel = json.loads(json.dumps(position_message))
+        other_vessel["MetaData"]["MMSI"] = 987654321
+        mock_ws = MockWebSocket(messages=[position_message])
+
+        with patch(
+            "ignifer.adapters.aisstream.websockets.connect", return_value=mock_ws
+        ) as mock_connect:
+            adapter = AISStreamAdapter()
+
+            first = await adapter.get_vessel_position("123456789")
+            mock_ws.messages.append(other_vessel)
+            second = await adapter.get_vessel_position("987654321")
+
+            assert first.results[0]["mmsi"] == "123456789"
+            assert second.results[0]["mmsi"] == "987654321"
+            assert mock_connect.call_count == 1
+            assert len(mock_ws.sent_messages) == 2
+            assert not mock_ws.closed
+
+            await adapter.close()
+            assert mock_ws.closed
+
+    @pytest.mark.asyncio
+    async def test_concurrent_lookups_share_connection(
+        self, mock_aisstream_credentials, position_message
+    ) -> None:
+        """Test that concurrent lookups share one connection and one subscription."""
+        other_vessel = json.loads(json.dumps(position_message))
+        other_vessel["MetaData"]["MMSI"] = 987654321
+        mock_ws = MockWebSocket(messages=[])
+
+        async def broadcast() -> None:
+            # Both lookups are subscribed before any vessel reports
+            await asyncio.sleep(0.05)
+            mock_ws.messages.extend([other_vessel, position_message])
+
+        with patch(
+            "ignifer.adapters.aisstream.websockets.connect", return_value=mock_ws
+        ) as mock_connect:
+            adapter = AISStreamAdapter()
+
+            first, second, _ = await asyncio.gather(
+                adapter.get_vessel_position("123456789"),
+                adapter.get_vessel_position("987654321"),
+                broadcast(),
+            )
+
+            assert first.results[0]["mmsi"] == "123456789"
+            assert second.results[0]["mmsi"] == "987654321"
+            assert mock_connect.call_count == 1
+            # Lookups arriving together are batched into one subscription
+            assert len(mock_ws.sent_messages) == 1
+            subscription = json.loads(mock_ws.sent_messages[0])
+            assert subscription["FiltersShipMMSI"] == ["123456789", "987654321"]
+
+            await adapter.close()
+
+    @pytest.mark.asyncio
+    async def test_frames_for_previous_subscription_skipped(
+        self, mock_aisstream_credentials, position_message
+    ) -> None:
+        """Test that a lookup ignores positions for other vessels still in flight."""
+        other_vessel = json.loads(json.dumps(position_message))
+        other_vessel["MetaData"]["MMSI"] = 987654321
+        mock_ws = MockWebSocket(messages=[other_vessel, position_message])
+
+        with patch("ignifer.adapters.aisstream.websockets.connect", return_value=mock_ws):
+            adapter = AISStreamAdapter()
+            parsed: list[dict[str, Any]] = []
+            parse = adapter._parse_position_message
+
+            def recording_parse(raw_msg: dict[str, Any]) -> dict[str, Any] | None:
+                parsed.append(raw_msg)
+                return parse(raw_msg)
+
+            adapter._parse_position_message = recording_parse  # type: ignore[method-assign]
+            result = await adapter.get_vessel_position("123456789")
+
+            assert result.status == ResultStatus.SUCCESS
+            assert [p["mmsi"] for p in result.results] == ["123456789"]
+            # The other vessel's frame is dropped without being parsed
+            assert parsed == [position_message]
+
+            await adapter.close()
+
+    @pytest.mark.asyncio
+    async def test_idle_connection_closed(
+        self, mock_aisstream_credentials, position_message
+    ) -> None:
+        """Test that the shared connection is closed after IDLE_TIMEOUT unused."""
+        mock_ws = MockWebSocket(messages=[position_message])
+
+        with patch("ignifer.adapters.aisstream.websockets.connect", return_value=mock_ws):
+            adapter = AISStreamAdapter()
+            adapter.IDLE_TIMEOUT = 0.01
+
+            await adapter.get_vessel_position("123456789")
+            assert not mock_ws.closed
+
+            await asyncio.sleep(0.05)
+            assert mock_ws.closed
+
+            await adapter.close()
+
     @pytest.mark.asyncio
     async def test_api_key_not_logged(
         self, mock_aisstream_credentials, position_message, caplog
@@ -0,0 +1,51 @@
+"""Tests for adapter retry delays."""
+
+import random
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+
+from ignifer.adapters._backoff import decorrelated_jitter, parse_retry_after
+
+
+class TestDecorrelatedJitter:
+    def test_delay_stays_within_base_and_cap(self) -> None:
+        rng_state = random.getstate()
+        random.seed(1234)
+        try:
+            delay = 2.0
+            for _ in range(100):
+                delay = decorrelated_jitter(delay, base=2.0, cap=30.0)
+                assert 2.0 <= delay <= 30.0
+        finally:
+            random.setstate(rng_state)
+
+    def test_delays_are_spread_out(self) -> None:
+        rng_state = random.getstate()
+        random.seed(1234)
+        try:
+            delays = {decorrelated_jitter(2.0, base=2.0, cap=30.0) for _ in range(10)}
+        finally:
+            random.setstate(rng_state)
+        # Concurrent callers starting from the same delay should not retry in lockstep
+        assert len(delays) == 10
+
+
+class TestParseRetryAfter:
+    def test_delta_seconds(self) -> None:
+        assert parse_retry_after("120") == 120.0
+        assert parse_retry_after(" 7 ") == 7.0
+
+    def test_http_date(self) -> None:
+        when = datetime.now(timezone.utc) + timedelta(seconds=30)
+        seconds = parse_retry_after(format_datetime(when, usegmt=True))
+        assert seconds is not None
+        assert 25.0 <= seconds <= 30.0
+
+    def test_past_http_date_is_zero(self) -> None:
+        assert parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT") == 0.0
+
+    def test_missing_or_malformed_is_none(self) -> None:
+        assert parse_retry_after(None) is None
+        assert parse_retry_after("") is None
+        assert parse_retry_after("soon") is None
+        assert parse_retry_after("-5") is None
@@ -8,6 +8,7 @@ from ignifer.adapters import (
     AdapterParseError,
     AdapterTimeoutError,
     OSINTAdapter,
+    build_attribution,
 )
 from ignifer.models import (
     ConfidenceLevel,
@@ -123,3 +124,47 @@ class TestAdapterErrors:
             raise AdapterParseError("gdelt", "parse failed") from original
         except AdapterParseError as e:
             assert e.__cause__ is original
+
+
+class TestBuildAttribution:
+    def test_matches_validated_models(self) -> None:
+        """build_attribution produces the same attribution as validated construction."""
+        retrieved_at = datetime.now(timezone.utc)
+
+        attribution = build_attribution(
+            "mock",
+            QualityTier.HIGH,
+            ConfidenceLevel.VERY_LIKELY,
+            "https://example.com/api",
+            retrieved_at,
+        )
+
+        expected = SourceAttribution(
+            source="mock",
+            quality=QualityTier.HIGH,
+            confidence=ConfidenceLevel.VERY_LIKELY,
+            metadata=SourceMetadata(
+                source_name="mock",
+                source_url="https://example.com/api",
+                retrieved_at=retrieved_at,
+            ),
+        )
+        assert attribution == expected
+        assert attribution.model_dump() == expected.model_dump()
+
+    def test_usable_in_osint_result(self) -> None:
+        """Constructed attributions are accepted by OSINTResult."""
+        retrieved_at = datetime.now(timezone.utc)
+        attribution = build_attribution(
+            "mock", QualityTier.MEDIUM, ConfidenceLevel.LIKELY, "https://example.com", retrieved_at
+        )
+
+        result = OSINTResult(
+            status=ResultStatus.SUCCESS,
+            query="test",
+            results=[],
+            sources=[attribution],
+            retrieved_at=retrieved_at,
+        )
+
+        assert result.sources[0].metadata.source_name == "mock"
@@ -0,0 +1,38 @@
+"""Tests for adapter request fan-out."""
+
+import asyncio
+
+import pytest
+
+from ignifer.adapters._fanout import gather_or_cancel
+
+
+class TestGatherOrCancel:
+    @pytest.mark.asyncio
+    async def test_results_keep_input_order(self) -> None:
+        async def delayed(value: int) -> int:
+            await asyncio.sleep(0.01 * (3 - value))
+            return value
+
+        assert await gather_or_cancel(delayed(i) for i in range(3)) == [0, 1, 2]
+
+    @pytest.mark.asyncio
+    async def test_first_error_cancels_the_rest(self) -> None:
+        slow_cancelled = asyncio.Event()
+
+        async def fail() -> int:
+            raise ValueError("boom")
+
+        async def slow() -> int:
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                slow_cancelled.set()
+                raise
+            return 1
+
+        with pytest.raises(ValueError, match="boom"):
+            await asyncio.wait_for(gather_or_cancel([slow(), fail()]), timeout=2)
+
+        # Cancelled and awaited before the error reached the caller
+        assert slow_cancelled.is_set()
@@ -1,15 +1,20 @@
 """Tests for GDELT adapter."""
 
+import asyncio
 import json
 import re
+from datetime import datetime, timezone
 from pathlib import Path
+from urllib.parse import urlencode
 
 import httpx
 import pytest
 
 from ignifer.adapters.base import AdapterTimeoutError
-from ignifer.adapters.gdelt import GDELTAdapter, _sanitize_gdelt_query
-from ignifer.models import QualityTier, QueryParams, ResultStatus
+from ignifer.adapters.gdelt import GDELTAdapter, _encode_gdelt_query, _sanitize_gdelt_query
+from ignifer.cache import cache_key
+from ignifer.models import OSINTResult, QualityTier, QueryParams, ResultStatus
+from ignifer.timeparse import parse_time_range
 
 
 def load_fixture(name: str) -> dict:
@@ -46,6 +51,65 @@ class TestGDELTAdapter:
 
         await adapter.close()
 
+    @pytest.mark.asyncio
+    async def test_query_many_bounds_concurrency(self) -> None:
+        """Test query_many keeps order and limits requests in flight."""
+        adapter = GDELTAdapter()
+        in_flight = 0
+        peak = 0
+
+        async def fake_query(params: QueryParams) -> OSINTResult:
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return OSINTResult(
+                status=ResultStatus.NO_DATA,
+                query=params.query,
+                results=[],
+                sources=[],
+                retrieved_at=datetime.now(timezone.utc),
+            )
+
+        adapter.query = fake_query  # type: ignore[method-assign]
+        queries = [f"topic {i}" for i in range(6)]
+
+        results = await adapter.query_many(
+            [QueryParams(query=q) for q in queries], max_concurrency=2
+        )
+
+        assert [r.query for r in results] == queries
+        assert peak == 2
+
+    @pytest.mark.asyncio
+    async def test_query_many_cancels_remaining_on_error(self) -> None:
+        """Test query_many cancels the other requests when one fails."""
+        adapter = GDELTAdapter()
+        started: list[str] = []
+        cancelled: list[str] = []
+
+        async def fake_query(params: QueryParams) -> OSINTResult:
+            started.append(params.query)
+            if params.query == "topic 0":
+                raise AdapterTimeoutError("gdelt", 30.0)
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled.append(params.query)
+                raise
+            raise AssertionError("query should have been cancelled")
+
+        adapter.query = fake_query  # type: ignore[method-assign]
+        queries = [QueryParams(query=f"topic {i}") for i in range(6)]
+
+        with pytest.raises(AdapterTimeoutError):
+            await asyncio.wait_for(adapter.query_many(queries, max_concurrency=2), timeout=2)
+
+        # The query sharing the first slot was cancelled, the queued ones never ran
+        assert cancelled == started[1:]
+        assert len(started) <= 3
+
     @pytest.mark.asyncio
     async def test_query_empty_returns_no_data(self, httpx_mock) -> None:
         """Test empty results return NO_DATA status with error message."""
@@ -81,6 +145,69 @@ class TestGDELTAdapter:
 
         await adapter.close()
 
+    @pytest.mark.asyncio
+    async def test_rate_limit_retries_with_jittered_delay(self, httpx_mock, monkeypatch) -> None:
+        """Test 429 responses are retried after a jittered, bounded delay."""
+        delays: list[float] = []
+
+        async def record_sleep(delay: float) -> None:
+            delays.append(delay)
+
+        monkeypatch.setattr("ignifer.adapters.gdelt.asyncio.sleep", record_sleep)
+        httpx_mock.add_response(url=re.compile(r".*gdeltproject.*"), status_code=429)
+        httpx_mock.add_response(
+            url=re.compile(r".*gdeltproject.*"),
+            json=load_fixture("gdelt_response.json"),
+        )
+
+        adapter = GDELTAdapter()
+        result = await adapter.query(QueryParams(query="Ukraine"))
+
+        assert result.status == ResultStatus.SUCCESS
+        assert len(delays) == 1
+        assert GDELTAdapter.RETRY_BASE_DELAY <= delays[0] <= GDELTAdapter.RETRY_MAX_DELAY
+
+        await adapter.close()
+
+    @pytest.mark.asyncio
+    async def test_rate_limit_honors_retry_after(self, httpx_mock, monkeypatch) -> None:
+        """Test a Retry-After hint sets the delay, with jitter added on top."""
+        delays: list[float] = []
+
+        async def record_sleep(delay: float) -> None:
+            delays.append(delay)
+
+        monkeypatch.setattr("ignifer.adapters.gdelt.asyncio.sleep", record_sleep)
+        httpx_mock.add_response(
+            url=re.compile(r".*gdeltproject.*"),
+            status_code=429,
+            headers={"Retry-After": "7"},
+        )
+        httpx_mock.add_response(
+            url=re.compile(r".*gdeltproject.*"),
+            json=load_fixture("gdelt_response.json"),
+        )
+
+        adapter = GDELTAdapter()
+        result = await adapter.query(QueryParams(query="Ukraine"))
+
+        assert result.status == ResultStatus.SUCCESS
+        assert len(delays) == 1
+        assert 7.0 <= delays[0] <= 7.0 + GDELTAdapter.RETRY_BASE_DELAY
+
+        await adapter.close()
+
+    @pytest.mark.asyncio
+    async def test_client_bounds_connect_time(self) -> None:
+        """Test the client fails slow connects sooner than slow responses."""
+        adapter = GDELTAdapter()
+        client = await adapter._get_client()
+
+        assert client.timeout.connect == GDELTAdapter.CONNECT_TIMEOUT
+        assert client.timeout.read == GDELTAdapter.DEFAULT_TIMEOUT
+
+        await adapter.close()
+
     @pytest.mark.asyncio
     async def test_health_check_success(self, httpx_mock) -> None:
         """Test health check returns True when API responds."""
@@ -169,6 +296,38 @@ class TestGDELTAdapter:
 
         await adapter.close()
 
+    def test_build_url_matches_urlencode(self) -> None:
+        """Pre-encoded URL template produces the same URL as urlencode."""
+        adapter = GDELTAdapter()
+        query = '"al-Shabaab" attacks & raids in Mogadishu'
+        time_result = parse_time_range("2026-01-01 to 2026-01-08")
+
+        url = adapter._build_url(query, time_result)
+
+        expected = urlencode(
+            {
+                "query": _sanitize_gdelt_query(query),
+                "mode": "ArtList",
+                "format": "json",
+                "maxrecords": 75,
+                "sort": "datedesc",
+                "startdatetime": "20260101000000",
+                "enddatetime": "20260108000000",
+            }
+        )
+        assert url == f"{GDELTAdapter.BASE_URL}?{expected}"
+
+    def test_query_encoding_memoized(self) -> None:
+        """Repeat queries reuse the sanitized, encoded query string."""
+        adapter = GDELTAdapter()
+        _encode_gdelt_query.cache_clear()
+
+        adapter._build_url("Japan-China tensions", None)
+        adapter._build_url("Japan-China tensions", parse_time_range("last 48 hours"))
+
+        info = _encode_gdelt_query.cache_info()
+        assert (info.hits, info.misses) == (1, 1)
+
     @pytest.mark.asyncio
     async def test_cache_key_includes_time_range(self, httpx_mock) -> None:
         """Test that time_range is included in generated URLs."""
@@ -189,6 +348,107 @@ class TestGDELTAdapter:
 
         await adapter.close()
 
+    @pytest.mark.asyncio
+    async def test_cache_hit_returns_cached_articles(self, httpx_mock, tmp_path) -> None:
+        """Test a repeated query is answered from cache with the same articles."""
+        from ignifer.cache import CacheManager, MemoryCache, SQLiteCache
+
+        httpx_mock.add_response(
+            url=re.compile(r".*gdeltproject.*"),
+            json=load_fixture("gdelt_response.json"),
+        )
+        cache = CacheManager(l1=MemoryCache(), l2=SQLiteCache(db_path=tmp_path / "cache.db"))
+        adapter = GDELTAdapter(cache=cache)
+
+        first = await adapter.query(QueryParams(query="Ukraine"))
+        second = await adapter.query(QueryParams(query="Ukraine"))
+
+        assert len(httpx_mock.get_requests()) == 1
+        assert second.status == ResultStatus.SUCCESS
+        assert second.results == first.results
+        assert second.sources[0].source == "gdelt"
+        assert second.model_dump()["query"] == "Ukraine"
+
+        await adapter.close()
+        await cache.close()
+
+    @pytest.mark.asyncio
+    async def test_query_many_only_fetches_cache_misses(self, httpx_mock, tmp_path) -> None:
+        """Test query_many answers cached queries without a request."""
+        from ignifer.cache import CacheManager, MemoryCache, SQLiteCache
+
+        httpx_mock.add_response(
+            url=re.compile(r".*gdeltproject.*"),
+            json=load_fixture("gdelt_response.json"),
+        )
+        cache = CacheManager(l1=MemoryCache(), l2=SQLiteCache(db_path=tmp_path / "cache.db"))
+        adapter = GDELTAdapter(cache=cache)
+
+        await adapter.query(QueryParams(query="Ukraine"))
+        httpx_mock.add_response(
+            url=re.compile(r".*gdeltproject.*"),
+            json=load_fixture("gdelt_response.json"),
+        )
+        results = await adapter.query_many(
+            [QueryParams(query="Ukraine"), QueryParams(query="Taiwan")]
+        )
+
+        assert [r.query for r in results] == ["Ukraine", "Taiwan"]
+        assert all(r.status == ResultStatus.SUCCESS for r in results)
+        assert len(httpx_mock.get_requests()) == 2
+
+        await adapter.close()
+        await cache.close()
+
+    @pytest.mark.asyncio
+    async def test_cache_key_ignores_extra_whitespace(self, httpx_mock, tmp_path) -> None:
+        """Test queries differing only in whitespace share a cache entry."""
+        from ignifer.cache import CacheManager, MemoryCache, SQLiteCache
+
+        httpx_mock.add_response(
+            url=re.compile(r".*gdeltproject.*"),
+            json=load_fixture("gdelt_response.json"),
+        )
+        cache = CacheManager(l1=MemoryCache(), l2=SQLiteCache(db_path=tmp_path / "cache.db"))
+        adapter = GDELTAdapter(cache=cache)
+
+        await adapter.query(QueryParams(query="Iran sanctions"))
+        result = await adapter.query(QueryParams(query="Iran   sanctions"))
+
+        assert len(httpx_mock.get_requests()) == 1
+        assert result.status == ResultStatus.SUCCESS
+        assert result.query == "Iran   sanctions"
+
+        await adapter.close()
+        await cache.close()
+
+    @pytest.mark.asyncio
+    async def test_no_data_is_cached_briefly(self, httpx_mock, tmp_path) -> None:
+        """Test a query with no articles is not re-sent while the miss is cached."""
+        from ignifer.cache import CacheManager, MemoryCache, SQLiteCache
+
+        httpx_mock.add_response(
+            url=re.compile(r".*gdeltproject.*"),
+            json=load_fixture("gdelt_empty.json"),
+        )
+        cache = CacheManager(l1=MemoryCache(), l2=SQLiteCache(db_path=tmp_path / "cache.db"))
+        adapter = GDELTAdapter(cache=cache)
+
+        first = await adapter.query(QueryParams(query="xyznonexistent123"))
+        second = await adapter.query(QueryParams(query="xyznonexistent123"))
+
+        assert len(httpx_mock.get_requests()) == 1
+        assert first.status == second.status == ResultStatus.NO_DATA
+        assert second.error == first.error
+        entry = await cache._l1.get(
+            cache_key("gdelt", "articles", search_query="xyznonexistent123:1week")
+        )
+        assert entry is not None
+        assert entry.ttl_seconds == GDELTAdapter.NO_DATA_TTL
+
+        await adapter.close()
+        await cache.close()
+
 
 class TestSanitizeGdeltQuery:
     """Tests for _sanitize_gdelt_query function."""
@@ -0,0 +1,66 @@
+"""Tests for the shared adapter HTTP transport."""
+
+import re
+
+import httpx
+import pytest
+
+from ignifer.adapters._http import POOL_LIMITS, close_transport, get_transport
+from ignifer.adapters.gdelt import GDELTAdapter
+from ignifer.adapters.worldbank import WorldBankAdapter
+
+
+@pytest.fixture(autouse=True)
+async def fresh_transport():
+    """Start and end each test without a shared pool."""
+    await close_transport()
+    yield
+    await close_transport()
+
+
+class TestSharedTransport:
+    def test_get_transport_returns_singleton(self) -> None:
+        assert get_transport() is get_transport()
+
+    def test_pool_uses_configured_limits(self) -> None:
+        pool = get_transport()._pool._pool
+        assert pool._max_connections == POOL_LIMITS.max_connections
+        assert pool._max_keepalive_connections == POOL_LIMITS.max_keepalive_connections
+        assert pool._keepalive_expiry == POOL_LIMITS.keepalive_expiry
+        assert pool._http2 is True
+
+    @pytest.mark.asyncio
+    async def test_close_transport_creates_fresh_pool_on_next_use(self) -> None:
+        first = get_transport()
+        await close_transport()
+        assert get_transport() is not first
+
+    @pytest.mark.asyncio
+    async def test_adapters_share_one_transport(self) -> None:
+        gdelt = GDELTAdapter()
+        worldbank = WorldBankAdapter()
+
+        gdelt_client = await gdelt._get_client()
+        worldbank_client = await worldbank._get_client()
+
+        assert gdelt_client is not worldbank_client
+        assert gdelt_client._transport is get_transport()
+        assert worldbank_client._transport is get_transport()
+
+        await gdelt.close()
+        await worldbank.close()
+
+    @pytest.mark.asyncio
+    async def test_closing_adapter_keeps_pool_open(self, httpx_mock) -> None:
+        """Closing one adapter's client must not close the shared pool."""
+        httpx_mock.add_response(url=re.compile(r".*example\.com.*"), text="ok")
+        transport = get_transport()
+
+        adapter = GDELTAdapter()
+        await adapter._get_client()
+        await adapter.close()
+
+        async with httpx.AsyncClient(transport=transport) as client:
+            response = await client.get("https://example.com/")
+        assert response.text == "ok"
+        assert get_transport() is transport
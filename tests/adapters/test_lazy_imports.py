@@ -0,0 +1,104 @@
+"""Tests for lazy adapter loading in the adapters package."""
+
+import subprocess
+import sys
+
+import pytest
+
+import ignifer.adapters
+from ignifer.adapters._lazy import lazy_import
+
+
+def _run(code: str) -> str:
+    """Run code in a fresh interpreter and return its stdout."""
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+    return result.stdout.strip()
+
+
+class TestLazyAdapterExports:
+    def test_package_import_does_not_execute_adapter_modules(self) -> None:
+        """Importing the package leaves adapter modules and their deps unloaded."""
+        out = _run(
+            "import sys, ignifer.adapters; "
+            "print('httpx' in sys.modules, 'websockets' in sys.modules)"
+        )
+        assert out == "False False"
+
+    def test_attribute_access_executes_only_that_adapter(self) -> None:
+        """Accessing an adapter class executes its module but not the others."""
+        out = _run(
+            "import sys, ignifer.adapters as a; a.AISStreamAdapter; "
+            "print(hasattr(sys.modules['ignifer.adapters.aisstream'], 'async_timeout'), "
+            "'ignifer.adapters._lazy' in sys.modules)"
+        )
+        assert out == "True True"
+
+    def test_adapter_dependencies_load_on_first_use(self) -> None:
+        """Third-party client libraries are imported on first use, not at import."""
+        out = _run(
+            "import sys; from ignifer.adapters.gdelt import GDELTAdapter; "
+            "before = 'httpx' in sys.modules; GDELTAdapter.__init__; "
+            "from ignifer.adapters.gdelt import httpx; httpx.AsyncClient; "
+            "print(before, 'httpx' in sys.modules)"
+        )
+        assert out == "False True"
+
+    def test_submodule_bound_on_package(self) -> None:
+        import ignifer.adapters.worldbank
+
+        assert ignifer.adapters.worldbank.WorldBankAdapter.__name__ == "WorldBankAdapter"
+
+    def test_lazy_attribute_is_the_real_class(self) -> None:
+        from ignifer.adapters.wikidata import WikidataAdapter
+
+        assert ignifer.adapters.WikidataAdapter is WikidataAdapter
+
+    def test_from_import_resolves_lazily(self) -> None:
+        from ignifer.adapters import OpenSkyAdapter
+
+        assert OpenSkyAdapter.__name__ == "OpenSkyAdapter"
+
+    def test_unknown_attribute_raises(self) -> None:
+        with pytest.raises(AttributeError):
+            _ = ignifer.adapters.NoSuchAdapter
+
+    def test_every_export_resolves(self) -> None:
+        """Every name in __all__ (base and lazy) resolves to a real object."""
+        for name in ignifer.adapters.__all__:
+            assert getattr(ignifer.adapters, name) is not None
+
+    def test_exports_cover_base_module(self) -> None:
+        import ignifer.adapters.base as base
+
+        assert set(base.__all__) <= set(ignifer.adapters.__all__)
+
+    def test_dir_lists_exports(self) -> None:
+        assert set(ignifer.adapters.__all__) <= set(dir(ignifer.adapters))
+
+
+class TestLazyImport:
+    def test_module_proxy_defers_import(self) -> None:
+        out = _run(
+            "import sys; from ignifer.adapters._lazy import lazy_import; "
+            "m = lazy_import('colorsys'); before = 'colorsys' in sys.modules; "
+            "m.rgb_to_hsv; print(before, 'colorsys' in sys.modules)"
+        )
+        assert out == "False True"
+
+    def test_module_proxy_caches_resolved_module(self) -> None:
+        import json
+
+        proxy = lazy_import("json")
+        assert proxy.dumps is json.dumps
+        assert proxy._mod is json
+
+    def test_callable_proxy(self) -> None:
+        dumps = lazy_import("json:dumps")
+        assert dumps({"a": 1}) == '{"a": 1}'
+
+    def test_missing_module_raises_on_use(self) -> None:
+        proxy = lazy_import("ignifer_no_such_module")
+        with pytest.raises(ModuleNotFoundError):
+            _ = proxy.anything
@@ -1,16 +1,19 @@
 """Tests for OpenSky Network adapter."""
 
+import asyncio
 import json
 import re
+from datetime import datetime, timezone
 from pathlib import Path
 
 import httpx
 import pytest
 
 from ignifer.adapters.base import AdapterAuthError, AdapterTimeoutError
-from ignifer.adapters.opensky import OpenSkyAdapter
+from ignifer.adapters.opensky import OpenSkyAdapter, _get_token_cache, reset_token_cache
+from ignifer.cache import cache_key
 from ignifer.config import reset_settings
-from ignifer.models import QualityTier, QueryParams, ResultStatus
+from ignifer.models import OSINTResult, QualityTier, QueryParams, ResultStatus
 
 
 def load_fixture(name: str) -> dict:
@@ -21,10 +24,12 @@ def load_fixture(name: str) -> dict:
 
 @pytest.fixture(autouse=True)
 def reset_settings_fixture():
-    """Reset settings singleton before each test."""
+    """Reset settings singleton and shared OAuth2 token before each test."""
     reset_settings()
+    reset_token_cache()
     yield
     reset_settings()
+    reset_token_cache()
 
 
 @pytest.fixture
@@ -282,6 +287,63 @@ class TestOpenSkyAdapter:
 
         await adapter.close()
 
+    @pytest.mark.asyncio
+    async def test_get_tracks_bounds_concurrency(self) -> None:
+        """Test get_tracks keeps order and limits requests in flight."""
+        adapter = OpenSkyAdapter()
+        in_flight = 0
+        peak = 0
+
+        async def fake_get_track(icao24: str) -> OSINTResult:
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return OSINTResult(
+                status=ResultStatus.NO_DATA,
+                query=icao24,
+                results=[],
+                sources=[],
+                retrieved_at=datetime.now(timezone.utc),
+            )
+
+        adapter.get_track = fake_get_track  # type: ignore[method-assign]
+        icao24s = [f"abc12{i}" for i in range(6)]
+
+        results = await adapter.get_tracks(icao24s, max_concurrency=2)
+
+        assert [r.query for r in results] == icao24s
+        assert peak == 2
+
+    @pytest.mark.asyncio
+    async def test_get_tracks_cancels_remaining_on_error(self) -> None:
+        """Test get_tracks cancels the other requests when one fails."""
+        adapter = OpenSkyAdapter()
+        started: list[str] = []
+        cancelled: list[str] = []
+
+        async def fake_get_track(icao24: str) -> OSINTResult:
+            started.append(icao24)
+            if icao24 == "abc120":
+                raise AdapterTimeoutError("opensky", 15.0)
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled.append(icao24)
+                raise
+            raise AssertionError("track request should have been cancelled")
+
+        adapter.get_track = fake_get_track  # type: ignore[method-assign]
+        icao24s = [f"abc12{i}" for i in range(6)]
+
+        with pytest.raises(AdapterTimeoutError):
+            await asyncio.wait_for(adapter.get_tracks(icao24s, max_concurrency=2), timeout=2)
+
+        # The request sharing the first slot was cancelled, the queued ones never ran
+        assert cancelled == started[1:]
+        assert len(started) <= 3
+
     @pytest.mark.asyncio
     async def test_get_track_rate_limited(self, mock_opensky_with_token) -> None:
         """Test get_track with rate limiting."""
@@ -627,6 +689,116 @@ class TestOpenSkyAdapter:
         await adapter.close()
         await cache.close()
 
+    @pytest.mark.asyncio
+    async def test_get_states_cache_round_trips_columns(
+        self, mock_opensky_with_token, tmp_path
+    ) -> None:
+        """Test the full feed is cached as columns and rebuilt as the same rows."""
+        from ignifer.cache import CacheManager, MemoryCache, SQLiteCache
+
+        cache = CacheManager(l1=MemoryCache(), l2=SQLiteCache(db_path=tmp_path / "cache.db"))
+        mock_opensky_with_token.add_response(
+            url=re.compile(r".*opensky-network\.org/api/states/all.*"),
+            json=load_fixture("opensky_states.json"),
+        )
+
+        adapter = OpenSkyAdapter(cache=cache)
+        first = await adapter.get_states()
+        entry = await cache._l1.get(cache_key("opensky", "states", icao24="all"))
+        second = await adapter.get_states()
+
+        assert entry is not None
+        assert "columns" in entry.data
+        assert second.results == first.results
+
+        await adapter.close()
+        await cache.close()
+
+    @pytest.mark.asyncio
+    async def test_get_track_cache_hit_matches_fresh_result(
+        self, mock_opensky_with_token, tmp_path
+    ) -> None:
+        """Test a cached track rebuilds the same sorted waypoints."""
+        from ignifer.cache import CacheManager, MemoryCache, SQLiteCache
+
+        cache = CacheManager(l1=MemoryCache(), l2=SQLiteCache(db_path=tmp_path / "cache.db"))
+        mock_opensky_with_token.add_response(
+            url=re.compile(r".*opensky-network\.org/api/tracks/all.*"),
+            json=load_fixture("opensky_track.json"),
+        )
+
+        adapter = OpenSkyAdapter(cache=cache)
+        first = await adapter.get_track("abc123")
+        second = await adapter.get_track("abc123")
+
+        assert second.results == first.results
+        api_requests = [
+            r for r in mock_opensky_with_token.get_requests() if "tracks/all" in str(r.url)
+        ]
+        assert len(api_requests) == 1
+
+        await adapter.close()
+        await cache.close()
+
+    @pytest.mark.asyncio
+    async def test_get_track_reads_cached_waypoint_dicts(self, tmp_path) -> None:
+        """Test track entries cached as waypoint dicts still load."""
+        from ignifer.cache import CacheManager, MemoryCache, SQLiteCache
+
+        cache = CacheManager(l1=MemoryCache(), l2=SQLiteCache(db_path=tmp_path / "cache.db"))
+        await cache.set(
+            cache_key("opensky", "track", icao24="abc123"),
+            {
+                "icao24": "abc123",
+                "callsign": "UAL123",
+                "start_time": 1,
+                "end_time": 2,
+                "waypoints": [
+                    {
+                        "timestamp": 1,
+                        "latitude": 40.0,
+                        "longitude": -74.0,
+                        "altitude": 1000.0,
+                        "heading": 90.0,
+                        "on_ground": False,
+                    }
+                ],
+            },
+            ttl_seconds=60,
+            source="opensky",
+        )
+
+        adapter = OpenSkyAdapter(cache=cache)
+        result = await adapter.get_track("abc123")
+
+        assert result.results == [
+            {
+                "icao24": "abc123",
+                "callsign": "UAL123",
+                "start_time": 1,
+                "end_time": 2,
+                "timestamp": 1,
+                "latitude": 40.0,
+                "longitude": -74.0,
+                "altitude": 1000.0,
+                "heading": 90.0,
+                "on_ground": False,
+            }
+        ]
+
+        await adapter.close()
+        await cache.close()
+
+    def test_states_ttl_counts_from_server_time(self) -> None:
+        """Test state vectors are cached only until they reach the TTL in age."""
+        import time
+
+        now = int(time.time())
+        assert OpenSkyAdapter._states_ttl(300, now - 100) in (199, 200)
+        assert OpenSkyAdapter._states_ttl(300, now - 1000) == 1
+        assert OpenSkyAdapter._states_ttl(300, now + 50) == 300
+        assert OpenSkyAdapter._states_ttl(300, None) == 300
+
     @pytest.mark.asyncio
     async def test_get_track_invalid_json(self, mock_opensky_with_token) -> None:
         """Test that invalid JSON response on track endpoint raises AdapterParseError."""
@@ -696,7 +868,9 @@ class TestOpenSkyAdapter:
         assert result1.status == ResultStatus.SUCCESS
 
         # Simulate token expiration
-        adapter._token_expires_at = datetime.now(timezone.utc) - timedelta(minutes=5)
+        _get_token_cache("test_client_id").expires_at = (
+            datetime.now(timezone.utc) - timedelta(minutes=5)
+        )
 
         # Second token response (for refresh)
         httpx_mock.add_response(
@@ -725,4 +899,112 @@ class TestOpenSkyAdapter:
         ]
         assert len(token_requests) == 2, "Should have made two token requests"
 
+        # API requests carry the token that was current when they were sent
+        api_requests = [
+            r for r in httpx_mock.get_requests()
+            if "/api/states/all" in str(r.url)
+        ]
+        assert api_requests[0].headers["Authorization"] == "Bearer token_1"
+        assert api_requests[1].headers["Authorization"] == "Bearer token_2"
+
+        await adapter.close()
+
+    @pytest.mark.asyncio
+    async def test_token_expiry_is_jittered(self, mock_opensky_with_token) -> None:
+        """Token lifetime is shortened by at most TOKEN_EXPIRY_JITTER of expires_in."""
+        from datetime import datetime, timedelta, timezone
+
+        adapter = OpenSkyAdapter()
+
+        before = datetime.now(timezone.utc)
+        await adapter._get_access_token()
+        after = datetime.now(timezone.utc)
+
+        expires_at = _get_token_cache("test_client_id").expires_at
+        assert expires_at is not None
+        min_lifetime = timedelta(seconds=1800 * (1 - OpenSkyAdapter.TOKEN_EXPIRY_JITTER))
+        assert before + min_lifetime <= expires_at
+        assert expires_at <= after + timedelta(seconds=1800)
+
+        await adapter.close()
+
+    @pytest.mark.asyncio
+    async def test_token_expiry_measured_from_request_start(
+        self, mock_opensky_credentials, httpx_mock, monkeypatch
+    ) -> None:
+        """Time spent waiting for the token response counts against its lifetime."""
+        from datetime import datetime, timedelta, timezone
+
+        monkeypatch.setattr("ignifer.adapters.opensky.random.uniform", lambda a, b: 0.0)
+        issued_at: list[datetime] = []
+
+        async def slow_token_response(request: httpx.Request) -> httpx.Response:
+            issued_at.append(datetime.now(timezone.utc))
+            await asyncio.sleep(0.05)
+            return httpx.Response(
+                200, json={"access_token": "test_access_token", "expires_in": 1800}
+            )
+
+        httpx_mock.add_callback(
+            slow_token_response,
+            url=re.compile(r".*auth\.opensky-network\.org.*token.*"),
+        )
+
+        adapter = OpenSkyAdapter()
+        await adapter._get_access_token()
+
+        expires_at = _get_token_cache("test_client_id").expires_at
+        assert expires_at is not None
+        assert expires_at <= issued_at[0] + timedelta(seconds=1800)
+
+        await adapter.close()
+
+    @pytest.mark.asyncio
+    async def test_concurrent_token_requests_fetch_once(self, mock_opensky_with_token) -> None:
+        """Concurrent callers with no cached token share a single token request."""
+        adapter = OpenSkyAdapter()
+
+        tokens = await asyncio.gather(*(adapter._get_access_token() for _ in range(5)))
+
+        assert tokens == ["test_access_token"] * 5
+        token_requests = [
+            r for r in mock_opensky_with_token.get_requests()
+            if "token" in str(r.url)
+        ]
+        assert len(token_requests) == 1
+
+        await adapter.close()
+
+    @pytest.mark.asyncio
+    async def test_token_shared_across_adapter_instances(self, mock_opensky_with_token) -> None:
+        """A new adapter reuses the token obtained by an earlier one."""
+        first = OpenSkyAdapter()
+        second = OpenSkyAdapter()
+
+        assert await first._get_access_token() == "test_access_token"
+        assert await second._get_access_token() == "test_access_token"
+
+        token_requests = [
+            r for r in mock_opensky_with_token.get_requests()
+            if "token" in str(r.url)
+        ]
+        assert len(token_requests) == 1
+
+        await first.close()
+        await second.close()
+
+    @pytest.mark.asyncio
+    async def test_client_header_follows_token_refreshed_elsewhere(
+        self, mock_opensky_with_token
+    ) -> None:
+        """A client's Authorization header picks up a token refreshed by another adapter."""
+        adapter = OpenSkyAdapter()
+        client = await adapter._get_client()
+        assert client.headers["Authorization"] == "Bearer test_access_token"
+
+        _get_token_cache("test_client_id").access_token = "refreshed_token"
+
+        client = await adapter._get_client()
+        assert client.headers["Authorization"] == "Bearer refreshed_token"
+
         await adapter.close()
@@ -122,6 +122,22 @@ class TestWikidataAdapterHelpers:
         # English aliases should come first
         assert aliases.index("Putin") < aliases.index("Путин")
 
+    def test_extract_aliases_skips_duplicates_across_languages(self) -> None:
+        """_extract_aliases lists an alias shared by several languages once."""
+        adapter = WikidataAdapter()
+        entity_data = {
+            "aliases": {
+                "en": [{"language": "en", "value": "Putin"}],
+                "de": [
+                    {"language": "de", "value": "Putin"},
+                    {"language": "de", "value": "W. Putin"},
+                ],
+                "fr": [{"language": "fr", "value": "W. Putin"}],
+            }
+        }
+
+        assert adapter._extract_aliases(entity_data) == ["Putin", "W. Putin"]
+
     def test_extract_aliases_empty(self) -> None:
         """_extract_aliases handles empty/missing aliases."""
         adapter = WikidataAdapter()
@@ -237,6 +253,32 @@ class TestWikidataAdapterQuery:
 
         await adapter.close()
 
+    @pytest.mark.asyncio
+    async def test_query_entity_fetch_requests_only_aliases_and_claims(
+        self, httpx_mock
+    ) -> None:
+        """Batch entity fetch skips labels/descriptions already in search results."""
+        httpx_mock.add_response(
+            url=re.compile(r".*wbsearchentities.*"),
+            json=load_fixture("wikidata_search.json"),
+        )
+        httpx_mock.add_response(
+            url=re.compile(r".*wbgetentities.*"),
+            json=load_fixture("wikidata_entities_batch.json"),
+        )
+
+        adapter = WikidataAdapter()
+        await adapter.query(QueryParams(query="Vladimir Putin"))
+
+        entity_request = next(
+            request
+            for request in httpx_mock.get_requests()
+            if request.url.params.get("action") == "wbgetentities"
+        )
+        assert entity_request.url.params["props"] == "aliases|claims"
+
+        await adapter.close()
+
     @pytest.mark.asyncio
     async def test_query_empty_string_returns_no_data(self) -> None:
         """Empty query string returns NO_DATA status."""
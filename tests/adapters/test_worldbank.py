@@ -1,5 +1,6 @@
 """Tests for World Bank adapter."""
 
+import asyncio
 import json
 import re
 from pathlib import Path
@@ -111,6 +112,18 @@ class TestWorldBankAdapter:
         _, country = adapter._parse_query("GDP SSA", self.SAMPLE_COUNTRY_LOOKUP)
         assert country == "SSF"
 
+    def test_country_names_sorted_once_per_lookup(self) -> None:
+        """Sorted country names are reused until the lookup table changes."""
+        adapter = WorldBankAdapter()
+        lookup = dict(self.SAMPLE_COUNTRY_LOOKUP)
+
+        first = adapter._country_names_by_length(lookup)
+        assert adapter._country_names_by_length(lookup) is first
+        assert [len(n) for n in first] == sorted((len(n) for n in lookup), reverse=True)
+
+        replacement = {"chad": "TCD"}
+        assert adapter._country_names_by_length(replacement) == ("chad",)
+
     def test_parse_query_unparseable_returns_none(self) -> None:
         """Unparseable queries return None for both fields."""
         adapter = WorldBankAdapter()
@@ -145,6 +158,23 @@ class TestWorldBankAdapter:
         assert result.results[0]["value"] == 25462700000000
         assert result.sources[0].source == "worldbank"
 
+    @pytest.mark.asyncio
+    async def test_query_skips_years_without_value(self, httpx_mock) -> None:
+        """Records with a null value are dropped from the results."""
+        fixture_data = load_fixture("worldbank_response.json")
+        fixture_data[1][1]["value"] = None
+        httpx_mock.add_response(
+            url=re.compile(r".*worldbank.*"),
+            json=fixture_data,
+        )
+
+        adapter = self._adapter_with_country_lookup()
+        result = await adapter.query(QueryParams(query="GDP United States"))
+
+        assert result.status == ResultStatus.SUCCESS
+        assert len(result.results) == 4
+        assert "2022" not in [r["year"] for r in result.results]
+
     @pytest.mark.asyncio
     async def test_query_no_data_unparseable(self) -> None:
         """Unparseable query returns NO_DATA with helpful message."""
@@ -364,6 +394,77 @@ class TestWorldBankAdapter:
         # Only one HTTP request should have been made
         assert len(httpx_mock.get_requests()) == 1
 
+    @pytest.mark.asyncio
+    async def test_ensure_country_lookup_concurrent_calls_fetch_once(self, httpx_mock) -> None:
+        """Concurrent first calls share a single country-list request."""
+        country_response = [
+            {"page": 1, "pages": 1, "per_page": 400, "total": 1},
+            [{"id": "USA", "name": "United States", "iso2Code": "US"}],
+        ]
+        httpx_mock.add_response(
+            url=re.compile(r".*country\?format=json.*"),
+            json=country_response,
+        )
+
+        adapter = WorldBankAdapter()
+        lookups = await asyncio.gather(*(adapter._ensure_country_lookup() for _ in range(5)))
+
+        assert all(lookup is lookups[0] for lookup in lookups)
+        assert len(httpx_mock.get_requests()) == 1
+
+        await adapter.close()
+
+    @pytest.mark.asyncio
+    async def test_ensure_country_lookup_uses_cache_manager(self, httpx_mock) -> None:
+        """A fetched country list is cached and reused by later adapter instances."""
+        country_response = [
+            {"page": 1, "pages": 1, "per_page": 400, "total": 1},
+            [{"id": "USA", "name": "United States", "iso2Code": "US"}],
+        ]
+        httpx_mock.add_response(
+            url=re.compile(r".*country\?format=json.*"),
+            json=country_response,
+        )
+        stored: dict = {}
+
+        async def fake_get(key):
+            if key not in stored:
+                return None
+            entry = MagicMock(spec=CacheEntry)
+            entry.data = stored[key]
+            entry.is_stale = False
+            return entry
+
+        async def fake_set(key, data, ttl_seconds, source):
+            stored[key] = data
+
+        mock_cache = MagicMock()
+        mock_cache.get = AsyncMock(side_effect=fake_get)
+        mock_cache.set = AsyncMock(side_effect=fake_set)
+
+        first = await WorldBankAdapter(cache=mock_cache)._ensure_country_lookup()
+        second = await WorldBankAdapter(cache=mock_cache)._ensure_country_lookup()
+
+        assert first == second
+        assert second["united states"] == "USA"
+        assert len(httpx_mock.get_requests()) == 1
+
+    @pytest.mark.asyncio
+    async def test_ensure_country_lookup_does_not_cache_fallback(self, httpx_mock) -> None:
+        """An aliases-only lookup after an API error is not cached."""
+        httpx_mock.add_exception(
+            httpx.ConnectError("Connection failed"),
+            url=re.compile(r".*country\?format=json.*"),
+        )
+        mock_cache = MagicMock()
+        mock_cache.get = AsyncMock(return_value=None)
+        mock_cache.set = AsyncMock()
+
+        lookup = await WorldBankAdapter(cache=mock_cache)._ensure_country_lookup()
+
+        assert lookup["usa"] == "USA"
+        mock_cache.set.assert_not_called()
+
     @pytest.mark.asyncio
     async def test_ensure_country_lookup_falls_back_on_error(self, httpx_mock) -> None:
         """Country lookup falls back to aliases on API error."""
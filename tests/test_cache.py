@@ -1,13 +1,16 @@
 """Tests for cache module."""
 
 from datetime import datetime, timedelta, timezone
+from unittest.mock import patch
 
+import aiosqlite
 import pytest
 
 from ignifer.cache import (
     CacheEntry,
     CacheManager,
     MemoryCache,
+    SQLiteCache,
     cache_key,
 )
 
@@ -86,6 +89,50 @@ class TestMemoryCache:
         assert result is not None
         assert result.data == {"foo": "bar"}
 
+    @pytest.mark.asyncio
+    async def test_get_counts_hits_and_misses(self) -> None:
+        """Get should count hits and misses."""
+        cache = MemoryCache()
+        entry = CacheEntry(
+            key="test",
+            data={"foo": "bar"},
+            created_at=datetime.now(timezone.utc),
+            ttl_seconds=3600,
+            source="gdelt",
+        )
+        await cache.set("test", entry)
+        await cache.get("test")
+        await cache.get("test")
+        await cache.get("nonexistent")
+        assert cache.hits == 2
+        assert cache.misses == 1
+
+
+class TestSQLiteCache:
+    """Tests for SQLiteCache (L2)."""
+
+    @pytest.mark.asyncio
+    async def test_set_then_get_round_trips_data(self, tmp_path) -> None:
+        """Stored data should come back unchanged, including non-ASCII text."""
+        cache = SQLiteCache(tmp_path / "cache.db")
+        data = {"articles": [{"title": "Köln – 東京", "tone": -1.5, "url": None}]}
+        try:
+            await cache.set(
+                "test",
+                CacheEntry(
+                    key="test",
+                    data=data,
+                    created_at=datetime.now(timezone.utc),
+                    ttl_seconds=3600,
+                    source="gdelt",
+                ),
+            )
+            result = await cache.get("test")
+            assert result is not None
+            assert result.data == data
+        finally:
+            await cache.close()
+
 
 class TestCacheManager:
     """Tests for CacheManager coordinating L1 and L2."""
@@ -128,3 +175,97 @@ class TestCacheManager:
             assert result.data == {"foo": "bar"}
         finally:
             await manager.close()
+
+    @pytest.mark.asyncio
+    async def test_mget_checks_l1_then_l2_in_order(self, tmp_path) -> None:
+        """Mget should return one result per key and promote L2 hits to L1."""
+        l2 = SQLiteCache(tmp_path / "cache.db")
+        manager = CacheManager(l1=MemoryCache(), l2=l2)
+        now = datetime.now(timezone.utc)
+        try:
+            await manager._l1.set(
+                "in-l1",
+                CacheEntry(
+                    key="in-l1", data={"tier": 1}, created_at=now, ttl_seconds=60, source="gdelt"
+                ),
+            )
+            await l2.set(
+                "in-l2",
+                CacheEntry(
+                    key="in-l2", data={"tier": 2}, created_at=now, ttl_seconds=60, source="gdelt"
+                ),
+            )
+
+            results = await manager.mget(["in-l2", "missing", "in-l1"])
+
+            assert [r.data if r else None for r in results] == [{"tier": 2}, None, {"tier": 1}]
+            assert await manager._l1.get("in-l2") is not None
+        finally:
+            await manager.close()
+
+    @pytest.mark.asyncio
+    async def test_set_writes_l2_in_background(self, tmp_path) -> None:
+        """Set should update L1 at once and L2 by the time flush() returns."""
+        l2 = SQLiteCache(tmp_path / "cache.db")
+        manager = CacheManager(l1=MemoryCache(), l2=l2)
+        try:
+            await manager.set("test", {"foo": "bar"}, ttl_seconds=3600, source="gdelt")
+            assert await manager._l1.get("test") is not None
+
+            await manager.flush()
+            assert not manager._pending_writes
+            entry = await l2.get("test")
+            assert entry is not None
+            assert entry.data == {"foo": "bar"}
+        finally:
+            await manager.close()
+
+    @pytest.mark.asyncio
+    async def test_close_finishes_pending_writes(self, tmp_path) -> None:
+        """Close should not drop an L2 write that is still in flight."""
+        db_path = tmp_path / "cache.db"
+        manager = CacheManager(l1=MemoryCache(), l2=SQLiteCache(db_path))
+        await manager.set("test", {"foo": "bar"}, ttl_seconds=3600, source="gdelt")
+        await manager.close()
+
+        l2 = SQLiteCache(db_path)
+        try:
+            entry = await l2.get("test")
+            assert entry is not None
+            assert entry.data == {"foo": "bar"}
+        finally:
+            await l2.close()
+
+    @pytest.mark.asyncio
+    async def test_sets_on_cold_cache_share_one_connection(self, tmp_path) -> None:
+        """Background writes racing to connect should open one connection, in order."""
+        manager = CacheManager(l1=MemoryCache(), l2=SQLiteCache(tmp_path / "cache.db"))
+        try:
+            with patch(
+                "ignifer.cache.aiosqlite.connect", wraps=aiosqlite.connect
+            ) as mock_connect:
+                for version in range(5):
+                    await manager.set(
+                        "test", {"version": version}, ttl_seconds=3600, source="gdelt"
+                    )
+                await manager.flush()
+
+            assert mock_connect.call_count == 1
+            entry = await manager._l2.get("test")
+            assert entry is not None
+            assert entry.data == {"version": 4}
+        finally:
+            await manager.close()
+
+    @pytest.mark.asyncio
+    async def test_stats_report_l1_hits_and_misses(self, tmp_path) -> None:
+        """Stats should count lookups answered by L1 and those that fell through."""
+        manager = CacheManager(l1=MemoryCache(), l2=SQLiteCache(tmp_path / "cache.db"))
+        try:
+            await manager.set("test", {"foo": "bar"}, ttl_seconds=3600, source="gdelt")
+            await manager.get("test")
+            await manager.mget(["test", "missing"])
+
+            assert manager.stats() == {"l1_hits": 2, "l1_misses": 1}
+        finally:
+            await manager.close()
@@ -458,6 +458,10 @@ class TestPercentageToLevel:
         assert calculator.percentage_to_level(1.5) == ConfidenceLevel.ALMOST_CERTAIN
         assert calculator.percentage_to_level(2.0) == ConfidenceLevel.ALMOST_CERTAIN
 
+    def test_nan_maps_to_remote(self, calculator: ConfidenceCalculator) -> None:
+        """NaN should map to REMOTE rather than the top of the scale."""
+        assert calculator.percentage_to_level(float("nan")) == ConfidenceLevel.REMOTE
+
 
 class TestConfidenceIntegration:
     """Integration tests for confidence framework."""
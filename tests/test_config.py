@@ -1,6 +1,8 @@
 """Tests for configuration module."""
 
 import os
+import sys
+import types
 from pathlib import Path
 from unittest.mock import patch
 
@@ -10,6 +12,7 @@ from ignifer.config import (
     CONFIG_FILE_PATH,
     Settings,
     _load_config_file,
+    event_loop_options,
     get_settings,
     reset_settings,
 )
@@ -438,3 +441,35 @@ rigor_mode = false
             settings = Settings()
 
         assert settings.rigor_mode is True
+
+
+class TestUvloop:
+    """Tests for the optional uvloop event loop."""
+
+    def test_use_uvloop_default_true(self, no_config_file) -> None:
+        """uvloop is used by default when installed."""
+        with patch.dict(os.environ, {}, clear=True):
+            settings = Settings()
+
+        assert settings.use_uvloop is True
+
+    def test_use_uvloop_env_false(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """IGNIFER_USE_UVLOOP=false should opt out of uvloop."""
+        monkeypatch.setenv("IGNIFER_USE_UVLOOP", "false")
+
+        settings = Settings()
+
+        assert settings.use_uvloop is False
+
+    def test_event_loop_options_when_available(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """uvloop should be requested from anyio when it imports."""
+        monkeypatch.setitem(sys.modules, "uvloop", types.ModuleType("uvloop"))
+
+        assert event_loop_options(True) == {"use_uvloop": True}
+        assert event_loop_options(False) == {}
+
+    def test_event_loop_options_missing(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """The default event loop should be used when uvloop is not installed."""
+        monkeypatch.setitem(sys.modules, "uvloop", None)
+
+        assert event_loop_options(True) == {}
@@ -0,0 +1,44 @@
+"""Tests for JSON encoding and decoding."""
+
+import pytest
+
+from ignifer import _json
+
+
+@pytest.fixture(params=["orjson", "stdlib"])
+def backend(request, monkeypatch):
+    """Run each test against orjson (when installed) and the stdlib fallback."""
+    if request.param == "stdlib":
+        monkeypatch.setattr(_json, "orjson", None)
+    elif _json.orjson is None:
+        pytest.skip("orjson not installed")
+    return request.param
+
+
+class TestLoads:
+    def test_decodes_bytes(self, backend) -> None:
+        assert _json.loads(b'{"name": "K\xc3\xb6ln", "ids": [1, 2.5, null]}') == {
+            "name": "Köln",
+            "ids": [1, 2.5, None],
+        }
+
+    def test_decodes_str(self, backend) -> None:
+        assert _json.loads('[{"a": true}]') == [{"a": True}]
+
+    def test_malformed_raises_value_error(self, backend) -> None:
+        with pytest.raises(ValueError):
+            _json.loads(b"<html>Service Unavailable</html>")
+
+
+class TestDumps:
+    def test_encodes_compact_utf8_bytes(self, backend) -> None:
+        assert _json.dumps({"name": "Köln", "ids": [1, None]}) == (
+            '{"name":"Köln","ids":[1,null]}'.encode()
+        )
+
+    def test_round_trips(self, backend) -> None:
+        obj = {"BoundingBoxes": [[[-90, -180], [90, 180]]], "FiltersShipMMSI": ["123456789"]}
+        assert _json.loads(_json.dumps(obj)) == obj
+
+    def test_non_string_keys_become_strings(self, backend) -> None:
+        assert _json.dumps({1: "a", 2.5: "b", None: "c"}) == b'{"1":"a","2.5":"b","null":"c"}'
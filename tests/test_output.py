@@ -1,6 +1,7 @@
 """Tests for output formatting - TSUKUYOMI/Amaterasu style."""
 
 from datetime import datetime, timedelta, timezone
+from unittest.mock import patch
 
 from ignifer.models import (
     ConfidenceLevel,
@@ -253,6 +254,72 @@ class TestOutputFormatter:
         assert "LIMITED" in formatter._assess_coverage_level(5)
         assert "MINIMAL" in formatter._assess_coverage_level(2)
 
+    def test_analyze_source_diversity(self) -> None:
+        """Diversity summary counts domains, languages and the date span."""
+        formatter = OutputFormatter()
+        articles = [
+            {"domain": "bbc.co.uk", "language": "English", "seendate": "20260101T120000Z"},
+            {"domain": "lemonde.fr", "language": "French", "seendate": "20260103T080000Z"},
+            {"domain": "bbc.co.uk", "language": "english", "seendate": "not-a-date"},
+            {"language": "", "seendate": ""},
+        ]
+
+        diversity = formatter._analyze_source_diversity(articles)
+
+        assert diversity["unique_domains"] == 2
+        assert diversity["languages"] == "english, french"
+        assert diversity["geo_assessment"] == "France, UK"
+        assert diversity["temporal"] == "3 days"
+
+    def test_identify_info_gaps_single_language_and_stale(self) -> None:
+        """Gaps flag monolingual, low-volume and stale coverage."""
+        formatter = OutputFormatter()
+        articles = [
+            {"domain": f"site{i}.com", "language": "English", "seendate": "20200101T000000Z"}
+            for i in range(6)
+        ]
+
+        gaps = formatter._identify_info_gaps(articles, "test")
+
+        assert any("Single-language results (english)" in g for g in gaps)
+        assert any("Low source volume" in g for g in gaps)
+        assert any("days old" in g for g in gaps)
+        assert not any("Limited source diversity" in g for g in gaps)
+
+    def test_format_success_scans_articles_once(self) -> None:
+        """Briefing sections share a single scan of the article list."""
+        result = OSINTResult(
+            status=ResultStatus.SUCCESS,
+            query="test topic",
+            results=[
+                {"title": "A", "domain": "example.com", "seendate": "20260101T000000Z"},
+                {"title": "B", "domain": "example.org", "sourcecountry": "France"},
+            ],
+            sources=[],
+            retrieved_at=datetime.now(timezone.utc),
+        )
+        formatter = OutputFormatter()
+
+        with patch.object(
+            formatter, "_scan_articles", wraps=formatter._scan_articles
+        ) as scan:
+            output = formatter.format(result)
+
+        assert scan.call_count == 1
+        assert "Unique Domains:     2" in output
+
+    def test_format_article_date(self) -> None:
+        """GDELT seendate values are formatted; malformed ones are skipped."""
+        formatter = OutputFormatter()
+
+        assert formatter._format_article_date({"seendate": "20260105T093000Z"}) == "05 Jan 2026"
+        assert formatter._format_article_date({"seendate": "20261305T093000Z"}) is None
+        assert formatter._format_article_date({"seendate": "2026-01-05"}) is None
+        assert formatter._format_article_date({"seendate": ""}) is None
+        assert formatter._format_article_date({}) is None
+        assert formatter._format_article_date({"seendate": 20260105}) is None
+        assert formatter._format_article_date({"seendate": b"20260105T093000Z"}) is None
+
     def test_source_reliability_grade(self) -> None:
         """Source reliability grades are IC-standard."""
         result = OSINTResult(
@@ -180,6 +180,20 @@ class TestFormatSourceAttribution:
 
         assert "freshness" in result.lower()
 
+    def test_unknown_source_name_is_title_cased(self) -> None:
+        """Sources missing from the display-name table fall back to title case."""
+        sources = [
+            SourceMetadata(
+                source_name="custom_feed",
+                source_url="https://example.com/",
+                retrieved_at=datetime.now(timezone.utc),
+            )
+        ]
+
+        result = format_source_attribution(sources)
+
+        assert "* Custom Feed - Retrieved" in result
+
 
 class TestFormatAnalyticalCaveats:
     """Tests for format_analytical_caveats function."""
@@ -1,5 +1,6 @@
 """Tests for economic_context tool in server.py."""
 
+import asyncio
 import json
 from datetime import datetime, timezone
 from pathlib import Path
@@ -9,7 +10,7 @@ import pytest
 
 from ignifer.adapters.base import AdapterError, AdapterTimeoutError
 from ignifer.models import OSINTResult, ResultStatus
-from ignifer.server import economic_context
+from ignifer.server import WORLDBANK_MAX_CONCURRENCY, economic_context
 
 
 # Helper to call the wrapped function
@@ -295,6 +296,31 @@ async def test_economic_context_rate_limited_status(mock_all_adapters):
     assert "Try again in a few minutes" in result
 
 
+@pytest.mark.asyncio
+async def test_economic_context_rate_limit_stops_remaining_queries(mock_all_adapters):
+    """A RATE_LIMITED result should cancel the indicator queries still pending."""
+    wb = mock_all_adapters["worldbank"]
+
+    async def query(params):
+        if wb.query.call_count == 1:
+            return OSINTResult(
+                status=ResultStatus.RATE_LIMITED,
+                query=params.query,
+                results=[],
+                sources=[],
+                retrieved_at=datetime.now(timezone.utc),
+            )
+        await asyncio.sleep(10)
+
+    wb.query.side_effect = query
+
+    result = await asyncio.wait_for(call_economic_context("China"), timeout=2)
+
+    assert "Service Temporarily Unavailable" in result
+    # The slot freed by the rate-limited query may start one more before cancellation
+    assert wb.query.call_count <= WORLDBANK_MAX_CONCURRENCY + 1
+
+
 @pytest.mark.asyncio
 async def test_economic_context_adapter_error(mock_all_adapters):
     """Test economic context with general adapter error."""
@@ -2,6 +2,7 @@
 
 import pytest
 from datetime import datetime, timezone
+from unittest.mock import patch
 
 from ignifer.timeparse import parse_time_range, TimeRangeResult
 
@@ -141,12 +142,49 @@ class TestParseTimeRange:
         assert result.is_valid
         assert result.gdelt_timespan == "2w"
 
+    def test_parse_n_unit_rejects_partial_matches(self):
+        """Test 'N unit' forms require a number and a known unit."""
+        for text in ("last 7", "7 fortnights", "last seven days", "3 days ago"):
+            result = parse_time_range(text)
+            assert not result.is_valid, text
+
+    def test_parse_last_n_ignores_trailing_words(self):
+        """Test 'last N unit' tolerates trailing words."""
+        result = parse_time_range("last 3 days of coverage")
+        assert result.is_valid
+        assert result.gdelt_timespan == "3d"
+
+    def test_parse_internal_whitespace(self):
+        """Test runs of whitespace between tokens are accepted."""
+        result = parse_time_range("last\t12   hours")
+        assert result.is_valid
+        assert result.gdelt_timespan == "12h"
+
     def test_parse_whitespace_stripping(self):
         """Test that whitespace is properly handled."""
         result = parse_time_range("  last 24 hours  ")
         assert result.is_valid
         assert result.gdelt_timespan == "24h"
 
+    def test_parse_fixed_forms_are_memoized(self):
+        """Test repeated fixed-form strings reuse the cached result."""
+        assert parse_time_range("last 7 days") is parse_time_range(" last 7 days ")
+
+    def test_parse_last_week_is_not_memoized(self):
+        """Test 'last week' is recomputed once the current second changes."""
+        jan_15 = datetime(2026, 1, 15, tzinfo=timezone.utc).timestamp()
+        with patch("ignifer.timeparse.time.time") as mock_time:
+            mock_time.return_value = jan_15
+            first = parse_time_range("last week")
+            mock_time.return_value = jan_15 + 0.5
+            same_second = parse_time_range("last week")
+            mock_time.return_value = jan_15 + 86400
+            next_day = parse_time_range("last week")
+
+        assert first.start_datetime == "20260101000000"
+        assert same_second is first
+        assert next_day.start_datetime == "20260102000000"
+
     def test_time_range_result_is_valid_property(self):
         """Test TimeRangeResult.is_valid property."""
         valid_result = TimeRangeResult(gdelt_timespan="24h")
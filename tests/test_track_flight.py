@@ -1,5 +1,6 @@
 """Tests for the track_flight tool."""
 
+import asyncio
 from datetime import datetime, timezone
 from unittest.mock import AsyncMock, patch
 
@@ -376,6 +377,47 @@ class TestTrackFlightTool:
             assert "CURRENT POSITION" in result
             assert "ICAO24: abc123" in result
 
+    @pytest.mark.asyncio
+    async def test_track_by_icao24_fetches_state_and_track_concurrently(
+        self,
+        mock_opensky_state: dict[str, str | int | float | bool | None],
+        mock_track_waypoints: list[dict[str, str | int | float | bool | None]],
+    ) -> None:
+        """ICAO24 lookup requests the track without waiting for the state."""
+        track_started = asyncio.Event()
+
+        async def get_states(icao24: str) -> OSINTResult:
+            # Would time out if get_track were only called after get_states returned
+            await asyncio.wait_for(track_started.wait(), timeout=1)
+            return OSINTResult(
+                status=ResultStatus.SUCCESS,
+                query=icao24,
+                results=[mock_opensky_state],
+                sources=[],
+                retrieved_at=datetime.now(timezone.utc),
+            )
+
+        async def get_track(icao24: str) -> OSINTResult:
+            track_started.set()
+            return OSINTResult(
+                status=ResultStatus.SUCCESS,
+                query=icao24,
+                results=mock_track_waypoints,
+                sources=[],
+                retrieved_at=datetime.now(timezone.utc),
+            )
+
+        with patch("ignifer.server._get_opensky") as mock_get:
+            adapter = AsyncMock()
+            adapter.get_states.side_effect = get_states
+            adapter.get_track.side_effect = get_track
+            mock_get.return_value = adapter
+
+            result = await track_flight.fn("abc123")
+
+            assert "CURRENT POSITION" in result
+            assert "TRACK HISTORY" in result
+
     @pytest.mark.asyncio
     async def test_track_tail_number_not_found(self) -> None:
         """Tail number lookup returns helpful message when not found."""
@@ -623,6 +665,41 @@ class TestTrackFlightTool:
             assert "Rate Limited" in result
             assert "Suggestions" in result
 
+    @pytest.mark.asyncio
+    async def test_track_by_icao24_rate_limited_cancels_track(self) -> None:
+        """A rate-limited state lookup cancels the in-flight track request."""
+        track_cancelled = asyncio.Event()
+
+        async def get_track(icao24: str) -> OSINTResult:
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                track_cancelled.set()
+                raise
+            raise AssertionError("track request should have been cancelled")
+
+        async def get_states(icao24: str) -> OSINTResult:
+            # Let the track request start before the state lookup answers
+            await asyncio.sleep(0)
+            return OSINTResult(
+                status=ResultStatus.RATE_LIMITED,
+                query=icao24,
+                results=[],
+                sources=[],
+                retrieved_at=datetime.now(timezone.utc),
+            )
+
+        with patch("ignifer.server._get_opensky") as mock_get:
+            adapter = AsyncMock()
+            adapter.get_states.side_effect = get_states
+            adapter.get_track.side_effect = get_track
+            mock_get.return_value = adapter
+
+            result = await asyncio.wait_for(track_flight.fn("abc123"), timeout=2)
+
+            assert "Rate Limited" in result
+            assert track_cancelled.is_set()
+
     @pytest.mark.asyncio
     async def test_empty_identifier(self) -> None:
         """Empty identifier returns validation error."""
@@ -46,6 +46,12 @@ class TestIdentifyVesselIdentifier:
         assert id_type == "mmsi"
         assert normalized == "353136000"
 
+    def test_non_ascii_digits_are_not_mmsi(self) -> None:
+        """Nine non-ASCII digits are treated as a vessel name, not an MMSI."""
+        id_type, normalized = _identify_vessel_identifier("٣٦٧٥٩٦٤٨٠")
+        assert id_type == "vessel_name"
+        assert normalized == "٣٦٧٥٩٦٤٨٠"
+
     def test_imo_with_space(self) -> None:
         """IMO number with space is detected."""
         id_type, normalized = _identify_vessel_identifier("IMO 9811000")